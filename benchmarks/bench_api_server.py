@@ -0,0 +1,134 @@
+"""
+Benchmark - Read-only HTTP API throughput and latency
+
+Fills a job store with synthetic jobs, starts `pipeline.py serve` as a
+separate process and drives it with keep-alive client threads that mix
+listing pages, filters, single jobs and the score histogram. Each mode
+runs for a fixed time:
+
+    uncached     every request asks for a page not seen before
+    cached       dashboards polling the same views without ETags
+    revalidate   the same views sent with If-None-Match (304 responses)
+
+Usage:
+    python benchmarks/bench_api_server.py --jobs 20000 --clients 8 --seconds 5
+"""
+
+import argparse
+import http.client
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+from job_store import JobStore
+
+POLLED_VIEWS = ["/jobs", "/jobs?min_score=80", "/jobs?location=Halifax", "/jobs?status=Not+Applied&limit=20",
+                "/scores", "/jobs/42", "/runs", "/jobs?q=tableau&min_score=70"]
+
+
+def fill_store(path: str, count: int) -> None:
+    rng = random.Random(7)
+    tools = ["Python", "SQL", "Tableau", "Power BI", "Excel", "R"]
+    jobs = [{
+        "url": f"https://ca.indeed.com/viewjob?jk={i:08x}",
+        "title": f"Data Analyst {i}",
+        "company": f"Company {i % 900}",
+        "location": rng.choice(["Halifax, NS", "Toronto, ON", "Remote, Canada", "Moncton, NB"]),
+        "description": f"Reporting with {rng.choice(tools)} and {rng.choice(tools)}.",
+        "match_score": rng.randint(30, 100)
+    } for i in range(count)]
+    with JobStore(path) as store:
+        store.upsert_jobs(jobs)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def client(port: int, mode: str, seconds: float, seed: int, latencies: list, statuses: dict) -> None:
+    rng = random.Random(seed)
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    etags = {}
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        if mode == "uncached":
+            path = f"/jobs?min_score={rng.randint(30, 90)}&offset={rng.randrange(0, 5000, 50)}"
+        else:
+            path = rng.choice(POLLED_VIEWS)
+        headers = {"If-None-Match": etags[path]} if mode == "revalidate" and path in etags else {}
+        start = time.perf_counter()
+        conn.request("GET", path, headers=headers)
+        response = conn.getresponse()
+        response.read()
+        latencies.append(time.perf_counter() - start)
+        statuses[response.status] = statuses.get(response.status, 0) + 1
+        if response.getheader("ETag"):
+            etags[path] = response.getheader("ETag")
+    conn.close()
+
+
+def run_mode(port: int, mode: str, clients: int, seconds: float) -> None:
+    latencies, statuses = [], {}
+    threads = [threading.Thread(target=client, args=(port, mode, seconds, n, latencies, statuses))
+               for n in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    ordered = sorted(latencies)
+    p50 = ordered[len(ordered) // 2] * 1000
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000
+    print(f"  {mode:11} {len(ordered) / elapsed:8.0f} req/s  p50 {p50:6.2f}ms  p99 {p99:6.2f}ms  {statuses}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP API load benchmark")
+    parser.add_argument("--jobs", type=int, default=20000)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench_api_") as directory:
+        store_path = os.path.join(directory, "jobs.db")
+        fill_store(store_path, args.jobs)
+        for day in range(30):
+            with open(os.path.join(directory, f"pipeline_results_202601{day + 1:02d}_090000.json"), 'w') as f:
+                json.dump({"jobs_found": [{}] * 40, "jobs_scored": [{}] * 12, "errors": []}, f)
+        config_path = os.path.join(directory, "config.json")
+        with open(config_path, 'w') as f:
+            json.dump({"store_path": store_path, "output_dir": os.path.join(directory, "applications")}, f)
+
+        port = free_port()
+        server = subprocess.Popen([sys.executable, os.path.join(ROOT, "scripts", "pipeline.py"),
+                                   "--config", config_path, "serve", "--port", str(port)],
+                                  cwd=directory, stdout=subprocess.DEVNULL)
+        try:
+            for _ in range(100):
+                try:
+                    socket.create_connection(("127.0.0.1", port), timeout=1).close()
+                    break
+                except OSError:
+                    time.sleep(0.1)
+            print(f"{args.jobs} jobs, {args.clients} keep-alive clients, {args.seconds}s per mode")
+            for mode in ("uncached", "cached", "revalidate"):
+                run_mode(port, mode, args.clients, args.seconds)
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
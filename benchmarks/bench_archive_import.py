@@ -0,0 +1,112 @@
+"""
+Benchmark - Streaming archive import
+
+Writes a synthetic archive of pipeline_results_*.json files (jobs drawn
+from a shared pool, so runs overlap like real daily results), imports it
+into a fresh job store from a clean subprocess, and reports ingest rate
+plus peak RSS of the importer and of its largest worker. --compare also
+loads the largest file with json.load to show the memory spike avoided.
+
+Usage:
+    python benchmarks/bench_archive_import.py --size-mb 2048 --files 64 --workers 4
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+SCRIPTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts")
+
+IMPORT_CODE = """
+import json, resource, sys
+sys.path.insert(0, sys.argv[1])
+from archive_import import import_archives
+stats = import_archives(sys.argv[4:], sys.argv[2], workers=int(sys.argv[3]))
+stats["rss_importer"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+stats["rss_worker"] = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+print(json.dumps(stats))
+"""
+
+LOAD_CODE = ("import json, resource, sys; json.load(open(sys.argv[1])); "
+             "print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024)")
+
+WORDS = ("data analyst python sql power bi tableau excel dashboards reporting stakeholders "
+         "halifax toronto remote entry level junior full-time etl statistics").split()
+
+
+def job_pool(size: int, rng) -> list:
+    return [{
+        "title": f"Data Analyst {i} at Company {i % 500}",
+        "url": f"https://ca.indeed.com/viewjob?jk={i:08x}",
+        "description": " ".join(rng.choices(WORDS, k=150)),
+        "source": "Indeed",
+        "location": rng.choice(["Halifax, NS", "Toronto, ON", "Remote, Canada"]),
+        "company": f"Company {i % 500}",
+        "match_score": rng.randint(40, 100)
+    } for i in range(size)]
+
+
+def write_archive(directory: str, size_mb: int, files: int, seed: int = 11) -> int:
+    """Write `files` results dumps totalling about size_mb. Returns bytes written."""
+    rng = random.Random(seed)
+    pool = job_pool(20000, rng)
+    target = size_mb * 1024 * 1024 // files
+    start_day = datetime(2025, 1, 1)
+    total = 0
+
+    for n in range(files):
+        stamp = (start_day + timedelta(days=n)).strftime("%Y%m%d_060000")
+        path = os.path.join(directory, f"pipeline_results_{stamp}.json")
+        written = 0
+        with open(path, 'w') as f:
+            f.write('{\n  "jobs_found": [\n')
+            first = True
+            while written < target:
+                chunk = ",\n".join(json.dumps(job, indent=2) for job in rng.sample(pool, 200))
+                f.write(("" if first else ",\n") + chunk)
+                first = False
+                written += len(chunk)
+            f.write('\n  ],\n  "jobs_scored": [],\n  "applications_generated": [],\n  "errors": []\n}\n')
+        total += os.path.getsize(path)
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Archive import benchmark")
+    parser.add_argument("--size-mb", type=int, default=2048, help="Total archive size")
+    parser.add_argument("--files", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--compare", action="store_true", help="Also json.load the largest file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench_archive_") as directory:
+        start = time.perf_counter()
+        total = write_archive(directory, args.size_mb, args.files)
+        print(f"Wrote {total / 1e9:.2f} GB in {args.files} files ({time.perf_counter() - start:.0f}s)")
+        paths = sorted(os.path.join(directory, name) for name in os.listdir(directory))
+
+        store = os.path.join(directory, "jobs.db")
+        output = subprocess.run([sys.executable, "-c", IMPORT_CODE, SCRIPTS, store, str(args.workers)] + paths,
+                                capture_output=True, text=True, check=True).stdout
+        stats = json.loads(output.strip().splitlines()[-1])
+
+        print(f"Imported {stats['records']:,} records in {stats['seconds']}s "
+              f"({stats['records_per_second']:,}/s, {total / 1e6 / stats['seconds']:.0f} MB/s)")
+        print(f"  written {stats['written']:,}, duplicates {stats['duplicates']:,}, "
+              f"unique jobs {stats['unique_jobs']:,}, errors {len(stats['errors'])}")
+        print(f"  peak RSS: importer {stats['rss_importer']:.0f} MB, largest worker {stats['rss_worker']:.0f} MB")
+
+        if args.compare:
+            largest = max(paths, key=os.path.getsize)
+            rss = subprocess.run([sys.executable, "-c", LOAD_CODE, largest], capture_output=True, text=True).stdout
+            print(f"  json.load of one {os.path.getsize(largest) / 1e6:.0f} MB file: peak RSS {rss.strip()} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Benchmark - Company name extraction and normalization
+
+Generates search result titles and URLs in the shapes the job boards
+use (Indeed "Role - Company - City", LinkedIn "Role at Company" and
+"Company hiring Role", careers-site postings, LinkedIn slugs), naming
+each employer by one of its variants ("RBC", "RBC Royal Bank", "Royal
+Bank of Canada Ltd."). Compares the old extract_company with the
+normalizer: throughput (cold and warm caches), unknowns, accuracy against
+the known employer and how many duplicate spellings are merged.
+
+Usage:
+    python benchmarks/bench_company_names.py --titles 100000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+from company_names import CompanyNormalizer, DEFAULT_ALIASES
+
+ROLES = ["Data Analyst", "Junior Data Analyst", "Business Intelligence Analyst", "Reporting Analyst",
+         "Data Scientist", "Analytics Engineer"]
+CITIES = ["Halifax, NS", "Toronto, ON", "Moncton, NB", "Remote, Canada"]
+SUFFIXES = ["", " Inc.", " Ltd.", " Limited", " Corp."]
+
+
+def legacy_extract_company(title: str, url: str) -> str:
+    """extract_company as it was before company_names."""
+    if 'linkedin.com/jobs/view' in url:
+        parts = url.split('/')
+        if len(parts) > 4:
+            return parts[4].replace('-', ' ').title()
+    if ' at ' in title:
+        return title.split(' at ')[-1].split('-')[0].strip()
+    return 'Unknown Company'
+
+
+def employers(count: int) -> list:
+    """(canonical name, spelling variants, careers domain) for known and synthetic employers."""
+    with open(DEFAULT_ALIASES, 'r', encoding='utf-8') as f:
+        companies = json.load(f)["companies"]
+    known = [(name, [name] + entry["aliases"], entry["domains"][0] if entry["domains"] else None)
+             for name, entry in companies.items()]
+    synthetic = [(f"Maritime Analytics {i}", [f"Maritime Analytics {i}"], f"maritimeanalytics{i}.ca")
+                 for i in range(count - len(known))]
+    return known + synthetic
+
+
+def sample_results(count: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    pool = employers(600)
+    results = []
+    for n in range(count):
+        canonical, variants, domain = rng.choice(pool)
+        name = rng.choice(variants) + rng.choice(SUFFIXES)
+        role, city = rng.choice(ROLES), rng.choice(CITIES)
+        shape = rng.randrange(5)
+        if shape == 0:
+            title, url = f"{role} - {name} - {city} - Indeed.com", f"https://ca.indeed.com/viewjob?jk={n:x}"
+        elif shape == 1:
+            title, url = f"{role} at {name} | LinkedIn", f"https://ca.linkedin.com/jobs/view/{n}"
+        elif shape == 2:
+            title, url = f"{name} hiring {role} in {city} | LinkedIn", f"https://ca.linkedin.com/jobs/view/{n}"
+        elif shape == 3:
+            slug = "-".join(f"{role} at {name}".lower().replace(".", "").split())
+            title, url = role, f"https://ca.linkedin.com/jobs/view/{slug}-{n}"
+        else:
+            title, url = f"{role} | Careers", f"https://careers.{domain or 'example.com'}/job/{n}"
+        results.append((title, url, canonical, name))
+    return results
+
+
+def measure(label: str, extract, results: list) -> list:
+    start = time.perf_counter()
+    names = [extract(title, url) for title, url, _, _ in results]
+    seconds = time.perf_counter() - start
+    correct = sum(1 for name, (_, _, truth, _) in zip(names, results) if name == truth)
+    print(f"  {label:18} {len(results) / seconds:9.0f} titles/s  {names.count('Unknown Company'):6d} unknown  "
+          f"{correct / len(results):6.1%} correct  {len(set(names)):6d} distinct names")
+    return names
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Company name normalization benchmark")
+    parser.add_argument("--titles", type=int, default=100000)
+    args = parser.parse_args()
+
+    results = sample_results(args.titles)
+    truth = len({canonical for _, _, canonical, _ in results})
+    print(f"{len(results)} search results from {truth} employers")
+
+    measure("old extract", legacy_extract_company, results)
+    normalizer = CompanyNormalizer()
+    new = measure("normalizer (cold)", normalizer.extract, results)
+    measure("normalizer (warm)", normalizer.extract, results)
+
+    spellings = len({name for _, _, _, name in results})
+    new_names = {name for name in new if name != "Unknown Company"}
+    print(f"\nDistinct company names: {spellings} as written, {len(new_names)} after normalizing "
+          f"({spellings - len(new_names)} duplicate spellings merged, {truth} real employers)")
+
+
+if __name__ == "__main__":
+    main()
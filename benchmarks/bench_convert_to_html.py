@@ -0,0 +1,77 @@
+"""
+Benchmark - Markdown to HTML batch conversion
+
+Builds a tree of 1,000 resume/cover-letter Markdown documents and times a
+cold conversion, a warm run with nothing changed, and a run after editing
+1% of the files. Compares the worker pool against in-process conversion.
+
+Usage:
+    python benchmarks/bench_convert_to_html.py --docs 1000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+from convert_to_html import convert_tree
+
+DOCUMENT = """# Vrajesh Bhatt
+**Data Analyst** | Halifax, NS | vrajesh.bhatt@outlook.com
+
+## Summary
+Results-driven Computer Engineering graduate with expertise in AI/Data Science.
+
+## Experience
+### Data Analyst — Company {i}
+- Analyzed operational data to identify efficiency improvements
+- Developed automated dashboards using Power BI for executive reporting
+- Created Python scripts for data processing and validation
+
+| Skill | Years |
+|-------|-------|
+| Python | 3 |
+| SQL | 3 |
+| Power BI | 2 |
+""" * 3
+
+
+def build_tree(root: str, docs: int) -> list:
+    paths = []
+    for i in range(docs):
+        folder = os.path.join(root, f"{i:04d}_Company_{i}")
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, f"Resume_{i}.md")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(DOCUMENT.format(i=i))
+        paths.append(path)
+    return paths
+
+
+def report(label: str, stats: dict):
+    print(f"{label:<22} {stats['seconds']:7.3f}s  converted {stats['converted']:5}  skipped {stats['skipped']:5}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Markdown conversion benchmark")
+    parser.add_argument("--docs", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    for workers in (1, args.workers):
+        label = "serial" if workers == 1 else f"pool({workers or os.cpu_count()})"
+        with tempfile.TemporaryDirectory() as root:
+            paths = build_tree(root, args.docs)
+            report(f"{label} cold", convert_tree(root, workers=workers))
+            report(f"{label} warm", convert_tree(root, workers=workers))
+
+            for path in paths[::100]:
+                with open(path, 'a', encoding='utf-8') as f:
+                    f.write("\n- Edited\n")
+            report(f"{label} 1% edited", convert_tree(root, workers=workers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Benchmark - Email to job correlation
+
+Reports accuracy of the correlation index on the labelled fixture
+(benchmarks/data/email_fixture.json: stored jobs plus recruiter emails with
+the job and status each should resolve to), then throughput on a synthetic
+batch of emails against a synthetic store, compared with scanning every
+stored company name per email.
+
+Usage:
+    python benchmarks/bench_email_correlation.py --jobs 5000 --emails 10000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "..", "scripts"))
+
+from email_correlation import CorrelationIndex, correlate, company_key, classify_status
+
+FIXTURE = os.path.join(HERE, "data", "email_fixture.json")
+
+NAMES = ("maple harbour atlantic northern summit cedar granite beacon coastal prairie aurora "
+         "keystone lighthouse evergreen tidal meridian bluenose fundy citadel").split()
+KINDS = ["Analytics", "Health", "Financial", "Logistics", "Energy", "Insurance", "Software", "Foods"]
+ROLES = ["Data Analyst", "Junior Data Analyst", "Business Intelligence Analyst", "Reporting Analyst",
+         "Junior Data Scientist", "Operations Analyst", "BI Developer"]
+TEMPLATES = [
+    ("Interview invitation - {role}", "We would like to invite you to an interview for the {role} position. "
+     "Please send your availability for next week."),
+    ("Your application to {company}", "Thank you for your interest in {company}. Unfortunately we have "
+     "decided to move forward with other candidates for the {role} role."),
+    ("{company} - {role}", "Thank you for applying to the {role} role. We have received your application."),
+    ("Offer - {role}", "We are pleased to offer you the {role} position. Your offer letter is attached."),
+    ("Weekly newsletter", "Read about our latest products, events and community news."),
+]
+
+
+def synthetic_jobs(count: int, rng) -> list:
+    jobs = []
+    for i in range(count):
+        company = f"{rng.choice(NAMES).title()} {rng.choice(NAMES).title()} {rng.choice(KINDS)} {i // 3}"
+        jobs.append({"url": f"https://ca.indeed.com/viewjob?jk={i:08x}", "title": rng.choice(ROLES),
+                     "company": company + rng.choice([" Inc.", " Ltd.", ""]), "status": "Applied"})
+    return jobs
+
+
+def synthetic_emails(jobs: list, count: int, rng) -> list:
+    emails = []
+    for _ in range(count):
+        job = rng.choice(jobs)
+        company = job["company"]
+        subject, body = rng.choice(TEMPLATES)
+        domain = company_key(company).replace(" ", "") + ".ca"
+        sender = rng.choice([f"{company} Careers <careers@{domain}>", f"{company} <no-reply@myworkday.com>"])
+        emails.append({"url": job["url"], "sender": sender, "subject": subject.format(role=job["title"], company=company),
+                       "body": body.format(role=job["title"], company=company) + " " * 10 + "Regards, Talent Team"})
+    return emails
+
+
+def naive_correlate(emails: list, jobs: list) -> list:
+    """Baseline: classify, then check every stored company name against the email."""
+    updates = []
+    names = [(company_key(job["company"]), job) for job in jobs]
+    for email in emails:
+        status = classify_status(email["subject"], email["body"])
+        if not status:
+            continue
+        text = company_key(f"{email['sender']} {email['subject']} {email['body']}")
+        for name, job in names:
+            if name and f" {name} " in f" {text} ":
+                updates.append({"url": job["url"], "status": status})
+                break
+    return updates
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Email correlation benchmark")
+    parser.add_argument("--jobs", type=int, default=5000, help="Stored jobs")
+    parser.add_argument("--emails", type=int, default=10000, help="Emails per batch")
+    parser.add_argument("--naive", type=int, default=1000, help="Emails for the linear-scan baseline")
+    args = parser.parse_args()
+
+    with open(FIXTURE, 'r', encoding='utf-8') as f:
+        fixture = json.load(f)
+
+    index = CorrelationIndex(fixture["jobs"])
+    correct = 0
+    for email in fixture["emails"]:
+        updates = correlate([email], index)
+        found = {"url": updates[0]["url"], "status": updates[0]["status"]} if updates else {"url": None, "status": None}
+        if found == email["expected"]:
+            correct += 1
+        else:
+            print(f"    ✗ expected {email['expected']}, got {found}: {email['subject']}")
+    print(f"Labelled fixture ({len(fixture['emails'])} emails, {len(fixture['jobs'])} jobs): "
+          f"{correct / len(fixture['emails']):.1%} correct")
+
+    rng = random.Random(5)
+    jobs = synthetic_jobs(args.jobs, rng)
+    emails = synthetic_emails(jobs, args.emails, rng)
+
+    start = time.perf_counter()
+    index = CorrelationIndex(jobs)
+    build = time.perf_counter() - start
+    start = time.perf_counter()
+    updates = correlate(emails, index)
+    seconds = time.perf_counter() - start
+    print(f"Index over {args.jobs:,} jobs built in {build * 1000:.0f}ms")
+    print(f"  Correlated {args.emails:,} emails in {seconds:.2f}s ({args.emails / seconds:,.0f} emails/s), "
+          f"{len(updates):,} status updates")
+    matched = sum((index.match(e["sender"], e["subject"], e["body"]) or {}).get("job", {}).get("url") == e["url"]
+                  for e in emails)
+    print(f"  Matched to the right job: {matched / len(emails):.1%}")
+
+    sample = emails[:args.naive]
+    start = time.perf_counter()
+    naive_correlate(sample, jobs)
+    naive_seconds = time.perf_counter() - start
+    naive_rate = len(sample) / naive_seconds
+    print(f"  Linear scan baseline: {naive_rate:,.0f} emails/s ({args.emails / seconds / naive_rate:.0f}x slower)")
+
+
+if __name__ == "__main__":
+    main()
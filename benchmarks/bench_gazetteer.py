@@ -0,0 +1,97 @@
+"""
+Benchmark - Gazetteer location extraction
+
+Reports accuracy of the gazetteer extractor and of the previous
+17-city substring extractor on the labelled fixture
+(benchmarks/data/location_fixture.json), then extraction throughput over
+synthetic descriptions built from the fixture plus filler text.
+
+Usage:
+    python benchmarks/bench_gazetteer.py --descriptions 100000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "..", "scripts"))
+
+from gazetteer import load_gazetteer
+
+FIXTURE = os.path.join(HERE, "data", "location_fixture.json")
+FILLER = ("we are looking for a motivated analyst to join our team you will build dashboards "
+          "and reports work with stakeholders and clean data using python sql and power bi").split()
+
+
+def legacy_extract_location(description: str) -> str:
+    """The original extractor: first of 17 cities found as a substring."""
+    locations = [
+        'Toronto, ON', 'Vancouver, BC', 'Montreal, QC', 'Calgary, AB',
+        'Halifax, NS', 'Ottawa, ON', 'Edmonton, AB', 'Winnipeg, MB',
+        'Quebec City, QC', 'Victoria, BC', 'Saskatoon, SK', 'Regina, SK',
+        'St. John\'s, NL', 'Fredericton, NB', 'Charlottetown, PEI',
+        'Remote, Canada', 'Hybrid, Canada'
+    ]
+    desc_lower = description.lower()
+    for location in locations:
+        if location.split(',')[0].lower() in desc_lower:
+            return location
+    return 'Canada'
+
+
+def accuracy(cases, extract) -> float:
+    return sum(extract(c["text"]) == c["expected"] for c in cases) / len(cases)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gazetteer location extraction benchmark")
+    parser.add_argument("--descriptions", type=int, default=100000)
+    parser.add_argument("--words", type=int, default=40, help="Filler words per description")
+    args = parser.parse_args()
+
+    with open(FIXTURE, 'r', encoding='utf-8') as f:
+        cases = json.load(f)
+
+    start = time.perf_counter()
+    gazetteer = load_gazetteer()
+    build = time.perf_counter() - start
+
+    def extract(text):
+        return gazetteer.locate(text)["label"]
+
+    print(f"Labelled fixture ({len(cases)} cases):")
+    print(f"  Gazetteer: {accuracy(cases, extract):.1%}")
+    print(f"  Legacy:    {accuracy(cases, legacy_extract_location):.1%}")
+    for case in cases:
+        found = extract(case["text"])
+        if found != case["expected"]:
+            print(f"    ✗ expected {case['expected']!r}, got {found!r}: {case['text'][:60]}")
+
+    rng = random.Random(3)
+    texts = [
+        " ".join(rng.choices(FILLER, k=args.words // 2)) + " " + rng.choice(cases)["text"] + " "
+        + " ".join(rng.choices(FILLER, k=args.words // 2))
+        for _ in range(args.descriptions)
+    ]
+
+    start = time.perf_counter()
+    for text in texts:
+        gazetteer.locate(text)
+    elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for text in texts:
+        legacy_extract_location(text)
+    legacy = time.perf_counter() - start
+
+    print(f"\nGazetteer built in {build * 1000:.0f}ms")
+    print(f"{len(texts):,} descriptions: gazetteer {elapsed:.2f}s ({len(texts) / elapsed:,.0f}/s), "
+          f"legacy {legacy:.2f}s ({len(texts) / legacy:,.0f}/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark - Columnar history export
+
+Simulates six months of daily pipeline runs, appends each run to the
+Parquet history, compacts it and times loading the full history.
+
+Usage:
+    python benchmarks/bench_history_export.py --days 180 --jobs 50
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+from history_export import export_run, compact_history, load_history
+
+
+def synthetic_results(day: int, jobs: int) -> dict:
+    """Build a results dictionary shaped like JobPipeline.run output."""
+    found = []
+    for i in range(jobs):
+        found.append({
+            "title": f"Data Analyst {i}",
+            "url": f"https://example.com/jobs/{day}-{i}",
+            "company": f"Company {i % 40}",
+            "location": random.choice(["Halifax, NS", "Toronto, ON", "Canada"]),
+            "source": "Indeed",
+            "match_score": random.randint(20, 100)
+        })
+    return {"jobs_found": found, "jobs_scored": [j for j in found if j["match_score"] >= 80]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="History export benchmark")
+    parser.add_argument("--days", type=int, default=180)
+    parser.add_argument("--jobs", type=int, default=50)
+    args = parser.parse_args()
+
+    start_day = datetime(2026, 1, 1)
+    with tempfile.TemporaryDirectory() as history_dir:
+        t0 = time.perf_counter()
+        for day in range(args.days):
+            run_id = (start_day + timedelta(days=day)).strftime("%Y%m%d_060000")
+            export_run(synthetic_results(day, args.jobs), history_dir, run_id=run_id)
+        append_time = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        uncompacted = load_history(history_dir)
+        load_parts_time = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        compact_history(history_dir)
+        compact_time = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        history = load_history(history_dir, columns=["run_date", "match_score"])
+        trend = history.groupby("run_date")["match_score"].mean()
+        load_time = time.perf_counter() - t0
+
+    print(f"Runs appended:          {args.days} ({append_time / args.days * 1000:.1f} ms/run)")
+    print(f"Rows:                   {len(uncompacted)}")
+    print(f"Load before compaction: {load_parts_time * 1000:.1f} ms")
+    print(f"Compaction:             {compact_time * 1000:.1f} ms")
+    print(f"Load + trend query:     {load_time * 1000:.1f} ms ({len(trend)} days)")
+
+
+if __name__ == "__main__":
+    main()
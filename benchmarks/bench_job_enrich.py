@@ -0,0 +1,93 @@
+"""
+Benchmark - Posting page enrichment
+
+Serves synthetic posting pages from a local static-file server that
+waits --latency seconds before each response, standing in for a remote
+job board, and times a cold enrichment pass (200 responses), a warm
+pass (304 responses via If-Modified-Since) and the same warm pass with
+one worker.
+
+Usage:
+    python benchmarks/bench_job_enrich.py --pages 500 --workers 16 --latency 0.05
+"""
+
+import argparse
+import functools
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+from job_enrich import enrich_jobs
+from quota import QuotaLedger, DEFAULT_LIMITS, set_ledger
+
+# Measure the code under test, not the quota: an unlimited in-memory ledger
+set_ledger(QuotaLedger(None, limits={name: {} for name in DEFAULT_LIMITS}))
+
+PAGE = """<!DOCTYPE html><html><head><title>Data Analyst {i}</title>
+<script>var tracking = {{}};</script></head><body>
+<nav><a href="/">Home</a><a href="/jobs">Jobs</a></nav>
+<main><h1>Data Analyst {i}</h1>
+{paragraphs}
+</main><footer>© Example Corp</footer></body></html>"""
+
+PARAGRAPH = ("<p>We are looking for a Data Analyst with Python, SQL, Tableau and Power BI "
+             "experience to build dashboards and reporting for our Halifax team.</p>")
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    latency = 0.0
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        super().do_GET()
+
+    def log_message(self, *args):
+        pass
+
+
+class BenchServer(ThreadingHTTPServer):
+    # The default backlog of 5 overflows when all workers connect at once, and each
+    # dropped SYN costs a ~1s retry, so the benchmark would time TCP, not enrichment
+    request_queue_size = 128
+
+
+def run_pass(label: str, jobs_template, cache_dir: str, workers: int):
+    jobs = [dict(job) for job in jobs_template]
+    t0 = time.perf_counter()
+    stats = enrich_jobs(jobs, cache_dir=cache_dir, workers=workers)
+    elapsed = time.perf_counter() - t0
+    print(f"{label:<5} {elapsed:6.2f}s  {len(jobs) / elapsed:8.0f} pages/s  {stats}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Enrichment benchmark")
+    parser.add_argument("--pages", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.05, help="Server delay per response in seconds")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as site, tempfile.TemporaryDirectory() as cache_dir:
+        for i in range(args.pages):
+            with open(os.path.join(site, f"job{i}.html"), 'w') as f:
+                f.write(PAGE.format(i=i, paragraphs=PARAGRAPH * 20))
+
+        QuietHandler.latency = args.latency
+        handler = functools.partial(QuietHandler, directory=site)
+        server = BenchServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+
+        jobs = [{"url": f"{base}/job{i}.html", "description": "snippet"} for i in range(args.pages)]
+        run_pass("cold", jobs, cache_dir, args.workers)
+        run_pass("warm", jobs, cache_dir, args.workers)
+        run_pass("serial", jobs, cache_dir, 1)
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
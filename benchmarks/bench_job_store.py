@@ -0,0 +1,113 @@
+"""
+Benchmark - Full-text job search
+
+Checks how user queries are converted to FTS5, then loads synthetic
+postings into the SQLite FTS5 job store and reports indexing throughput
+and query latency for boolean and phrase queries.
+
+Usage:
+    python benchmarks/bench_job_store.py --postings 100000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+from job_store import JobStore, QueryError, normalize_query
+
+SKILLS = (
+    "python sql tableau excel statistics etl looker snowflake azure aws gcp spark "
+    "airflow dbt sas spss vba jira confluence salesforce sharepoint"
+).split() + ['"power bi"', "machine learning", "data warehouse", "a/b testing"]
+FILLER = [f"term{i}" for i in range(5000)]
+PLACES = ["Halifax, Nova Scotia", "Toronto, Ontario", "Ottawa, Ontario", "Vancouver, BC", "Remote, Canada"]
+LEVELS = ["entry level", "junior", "intermediate", "senior"]
+
+QUERIES = [
+    'tableau AND "nova scotia"',
+    '"power bi" OR tableau',
+    'python AND sql NOT senior',
+    '"entry level" AND remote',
+    'warehouse',
+]
+
+# User query → FTS5 expression, or None where QueryError is expected
+QUERY_CASES = [
+    ('tableau and "nova scotia"', 'tableau AND "nova scotia"'),
+    ('power-bi NOT senior', '"power-bi" NOT senior'),
+    ('sql (tableau OR looker)', 'sql AND ( tableau OR looker )'),
+    ('NEAR(sql python, 5)', 'NEAR(sql python, 5)'),
+    ('NOT tableau', None),
+    ('tableau NOT', None),
+    ('(sql OR) tableau', None),
+    ('NEAR(sql python', None),
+]
+
+
+def check_queries() -> int:
+    """Print each query case that normalizes wrongly; return the number passed."""
+    passed = 0
+    for query, expected in QUERY_CASES:
+        try:
+            result = normalize_query(query)
+        except QueryError:
+            result = None
+        if result == expected:
+            passed += 1
+        else:
+            print(f"  ✗ {query!r}: expected {expected!r}, got {result!r}")
+    return passed
+
+
+def synthetic_jobs(count: int):
+    """Generate postings with ~150-word descriptions mentioning a few skills."""
+    for i in range(count):
+        place = random.choice(PLACES)
+        level = random.choice(LEVELS)
+        skills = [s.strip('"') for s in random.sample(SKILLS, random.randint(3, 6))]
+        filler = random.choices(FILLER, k=140)
+        yield {
+            "url": f"https://example.com/jobs/{i}",
+            "title": f"{level.title()} Data Analyst",
+            "company": f"Company {i % 500}",
+            "location": place,
+            "description": f"{' '.join(filler)} Requires {', '.join(skills)}. {level} role based in {place}."
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Job store FTS benchmark")
+    parser.add_argument("--postings", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"Query normalization: {check_queries()}/{len(QUERY_CASES)} cases correct")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with JobStore(os.path.join(tmp, "jobs.db")) as store:
+            jobs = list(synthetic_jobs(args.postings))
+            t0 = time.perf_counter()
+            for start in range(0, len(jobs), 5000):
+                store.upsert_jobs(jobs[start:start + 5000])
+            index_time = time.perf_counter() - t0
+            print(f"Indexed {store.count()} postings in {index_time:.1f}s "
+                  f"({args.postings / index_time:,.0f}/s)")
+
+            for query in QUERIES:
+                timings = []
+                for _ in range(args.repeat):
+                    t0 = time.perf_counter()
+                    results = store.search(query, days=60, limit=20)
+                    timings.append((time.perf_counter() - t0) * 1000)
+                print(f"  {query:<32} median {statistics.median(timings):6.1f} ms  "
+                      f"max {max(timings):6.1f} ms  ({len(results)} results)")
+
+
+if __name__ == "__main__":
+    main()
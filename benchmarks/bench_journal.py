@@ -0,0 +1,112 @@
+"""
+Benchmark - Event journal replay time and disk growth over a year
+
+Simulates a year of daily pipeline runs. Each run finds jobs (most of
+them seen on earlier days), scores them, generates and syncs the best new
+ones and picks up a few status changes. Compares what the old per-run
+results dumps cost on disk and to read back with the event journal, with
+and without compaction.
+
+Usage:
+    python benchmarks/bench_journal.py --days 365 --found 150 --compact-events 20000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+from journal import Journal
+
+
+def directory_size(path: str) -> int:
+    return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+
+
+def simulate_day(rng: random.Random, day: int, pool: list, found: int) -> dict:
+    """One run's jobs: mostly re-sightings of recent postings plus some new ones."""
+    recent = pool[-30 * found // 2:]
+    repeats = rng.sample(recent, min(len(recent), int(found * 0.6)))
+    new = [{
+        "url": f"https://ca.indeed.com/viewjob?jk={day:03d}{n:04d}",
+        "title": f"Data Analyst {day}-{n}",
+        "company": f"Company {rng.randrange(2000)}",
+        "location": rng.choice(["Halifax, NS", "Toronto, ON", "Remote, Canada"]),
+        "source": "brave",
+        "description": "Reporting and dashboards with SQL, Python and Power BI. " * 12,
+        "match_score": rng.randint(40, 99),
+        "profile": "data-analyst"
+    } for n in range(found - len(repeats))]
+    pool.extend(new)
+    jobs = repeats + new
+    generated = sorted(new, key=lambda job: job["match_score"], reverse=True)[:10]
+    for job in generated:
+        job["package_path"] = f"applications/{job['url'][-7:]}"
+        job["notion_page_id"] = f"page-{job['url'][-7:]}"
+    statuses = [{"url": job["url"], "status": rng.choice(["Applied", "Interview", "Rejected"])}
+                for job in rng.sample(pool, min(len(pool), 5))]
+    return {"jobs": jobs, "scored": [j for j in jobs if j["match_score"] >= 80], "generated": generated,
+            "statuses": statuses}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Event journal benchmark")
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--found", type=int, default=150, help="Jobs found per run")
+    parser.add_argument("--compact-events", type=int, default=20000)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    pool = []
+    with tempfile.TemporaryDirectory(prefix="bench_journal_") as directory:
+        dumps = os.path.join(directory, "dumps")
+        os.makedirs(dumps)
+        compacted = Journal(os.path.join(directory, "journal"), compact_events=args.compact_events)
+        uncompacted = Journal(os.path.join(directory, "journal_raw"), compact_events=0)
+        events = 0
+
+        for day in range(args.days):
+            run = f"2026{day:04d}"
+            today = simulate_day(rng, day, pool, args.found)
+            # Old: the whole results dictionary, as main() writes it
+            with open(os.path.join(dumps, f"pipeline_results_{run}.json"), 'w') as f:
+                json.dump({"jobs_found": today["jobs"], "jobs_scored": today["scored"],
+                           "applications_generated": [j["package_path"] for j in today["generated"]],
+                           "errors": []}, f, indent=2)
+            for journal in (compacted, uncompacted):
+                written = journal.record("found", today["jobs"], run=run)
+                written += journal.record("scored", today["jobs"], run=run)
+                written += journal.record("generated", today["generated"], run=run)
+                written += journal.record("synced", today["generated"], run=run)
+                written += journal.record("status", today["statuses"], run=run)
+            events += written
+
+        print(f"{args.days} daily runs, {args.found} jobs found per run, {len(pool)} distinct jobs, "
+              f"{events} events")
+
+        start = time.perf_counter()
+        state = {}
+        for name in sorted(os.listdir(dumps)):
+            with open(os.path.join(dumps, name)) as f:
+                for job in json.load(f)["jobs_found"]:
+                    state.setdefault(job["url"], {}).update(job)
+        dump_seconds = time.perf_counter() - start
+
+        rows = [("results dumps", directory_size(dumps), dump_seconds, len(state))]
+        for label, journal in (("journal, no compaction", uncompacted), ("journal + compaction", compacted)):
+            reloaded = Journal(journal.directory, compact_events=0)
+            rows.append((label, journal.disk_usage(), reloaded.replay_seconds, len(reloaded.state)))
+
+        print(f"  {'':24} {'On disk':>10} {'Per run':>9} {'Rebuild':>9} {'Jobs':>7}")
+        for label, size, seconds, jobs in rows:
+            print(f"  {label:24} {size / 2 ** 20:8.1f}MB {size / args.days / 1024:7.1f}KB "
+                  f"{seconds * 1000:7.0f}ms {jobs:7d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark - Telegram digest notifier
+
+Runs a local mock of the Bot API sendMessage endpoint (with optional
+injected 429/500 responses and latency), produces job and urgent-email
+events at random intervals, and reports end-to-end alert latency,
+messages per event and the cost of notify() to the producing stage.
+
+Usage:
+    python benchmarks/bench_notifier.py --events 200 --window 2 --fail-rate 0.1
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+from notifier import TelegramNotifier
+
+
+def make_handler(state):
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            time.sleep(state["latency"])
+            roll = random.random()
+            if roll < state["fail_rate"] / 2:
+                self._reply(429, {"ok": False, "parameters": {"retry_after": 0.2}})
+            elif roll < state["fail_rate"]:
+                self._reply(500, {"ok": False})
+            else:
+                state["messages"].append(body["text"])
+                self._reply(200, {"ok": True})
+
+        def _reply(self, code, payload):
+            data = json.dumps(payload).encode()
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Notifier benchmark")
+    parser.add_argument("--events", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds over which events arrive")
+    parser.add_argument("--window", type=float, default=2.0)
+    parser.add_argument("--urgent-rate", type=float, default=0.05)
+    parser.add_argument("--fail-rate", type=float, default=0.1)
+    parser.add_argument("--latency", type=float, default=0.05, help="Mock API response time")
+    args = parser.parse_args()
+
+    state = {"messages": [], "fail_rate": args.fail_rate, "latency": args.latency}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(state))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    notifier = TelegramNotifier(
+        "TEST", "741797492", window_seconds=args.window, urgent_window_seconds=0.5,
+        min_interval=0.2, api_base=f"http://127.0.0.1:{server.server_address[1]}"
+    )
+
+    notify_costs = []
+    for i in range(args.events):
+        time.sleep(random.expovariate(args.events / args.duration))
+        t0 = time.perf_counter()
+        if random.random() < args.urgent_rate:
+            notifier.notify(f"Email from recruiter{i}@example.com: Interview invitation", urgent=True)
+        else:
+            notifier.notify(f"New job ({random.randint(80, 100)}%): Data Analyst {i} — Example Corp")
+        notify_costs.append((time.perf_counter() - t0) * 1e6)
+
+    notifier.close()
+    server.shutdown()
+    stats = notifier.stats()
+
+    print(f"Events:            {args.events} over {args.duration:.0f}s (window {args.window}s)")
+    print(f"Messages sent:     {stats['messages_sent']} ({stats['messages_failed']} failed), "
+          f"{args.events / max(stats['messages_sent'], 1):.1f} events/message")
+    print(f"Delivered events:  {stats['events_delivered']}")
+    print(f"Alert latency:     p50 {stats['latency_p50']:.2f}s  p99 {stats['latency_p99']:.2f}s")
+    print(f"notify() cost:     median {statistics.median(notify_costs):.1f} µs  "
+          f"max {max(notify_costs):.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark - Incremental Notion status pull
+
+Runs a local mock of the Notion database query endpoint holding N rows,
+edits a handful of them, and checks that an incremental pull transfers
+only the changed rows (and how many requests it takes) compared with a
+full pull.
+
+Usage:
+    python benchmarks/bench_notion_pull.py --rows 5000 --changed 25
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+
+class MockNotion:
+    """In-memory database implementing the subset of /databases/{id}/query we use."""
+
+    def __init__(self, rows: int):
+        base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        self.pages = [{
+            "id": f"page-{i}",
+            "last_edited_time": (base + timedelta(minutes=i)).strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+            "properties": {
+                "Status": {"select": {"name": "Not Applied"}},
+                "Job URL": {"url": f"https://example.com/jobs/{i}"}
+            }
+        } for i in range(rows)]
+        self.requests = 0
+        self.rows_returned = 0
+
+    def edit(self, count: int, status: str):
+        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+        for page in random.sample(self.pages, count):
+            page["properties"]["Status"]["select"]["name"] = status
+            page["last_edited_time"] = now
+
+    def query(self, body: dict) -> dict:
+        self.requests += 1
+        since = body.get("filter", {}).get("last_edited_time", {}).get("on_or_after", "")
+        matches = sorted((p for p in self.pages if p["last_edited_time"] >= since),
+                         key=lambda p: p["last_edited_time"])
+        start = int(body.get("start_cursor") or 0)
+        size = body.get("page_size", 100)
+        chunk = matches[start:start + size]
+        self.rows_returned += len(chunk)
+        more = start + size < len(matches)
+        return {"results": chunk, "has_more": more, "next_cursor": str(start + size) if more else None}
+
+
+def make_handler(mock: MockNotion):
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            payload = json.dumps(mock.query(body)).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Notion pull benchmark")
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--changed", type=int, default=25)
+    args = parser.parse_args()
+
+    mock = MockNotion(args.rows)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(mock))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    os.environ["NOTION_API_BASE"] = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    os.environ["NOTION_TOKEN"] = "ntn_mock"
+    os.environ["NOTION_DATABASE_ID"] = "mock-db"
+    os.chdir(tempfile.mkdtemp())  # no config.json, so the env database id is used
+
+    from notion_sync import pull_status_changes
+    from quota import QuotaLedger, DEFAULT_LIMITS, set_ledger
+    set_ledger(QuotaLedger(None, limits={name: {} for name in DEFAULT_LIMITS}))
+
+    t0 = time.perf_counter()
+    changes, cursor = pull_status_changes(since="")
+    print(f"Full pull:        {len(changes):6} rows  {mock.requests:4} requests  "
+          f"{(time.perf_counter() - t0) * 1000:7.1f} ms")
+
+    mock.edit(args.changed, "Applied")
+    mock.requests = mock.rows_returned = 0
+    t0 = time.perf_counter()
+    changes, cursor = pull_status_changes(since=cursor)
+    applied = sum(1 for c in changes if c["status"] == "Applied")
+    print(f"Incremental pull: {mock.rows_returned:6} rows  {mock.requests:4} requests  "
+          f"{(time.perf_counter() - t0) * 1000:7.1f} ms  ({applied}/{args.changed} edits seen)")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
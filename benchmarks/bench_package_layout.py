@@ -0,0 +1,91 @@
+"""
+Benchmark - Application package layouts on disk
+
+Generates the same batch of application packages in each layout and
+reports how many packages survive (flat names collide and overwrite each
+other), files written, bytes written and disk space actually allocated
+(every small file takes at least one filesystem block).
+
+Usage:
+    python benchmarks/bench_package_layout.py --packages 10000
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+from resume_generator import generate_application_package
+
+MODES = [
+    ("flat", {"layout": "flat"}),
+    ("sharded", {"layout": "sharded"}),
+    ("sharded + bundle", {"layout": "sharded", "bundle": True}),
+]
+
+TITLES = ["Data Analyst", "Junior Data Analyst", "Business Intelligence Analyst - Reporting",
+          "Business Intelligence Analyst - Finance", "Data Analyst, Operations Reporting",
+          "Data Analyst, Operations Planning", "Reporting Analyst", "Data Scientist"]
+
+
+def sample_jobs(count: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    companies = [f"Company {i}" for i in range(count // 8)]
+    return [{
+        "title": rng.choice(TITLES),
+        "company": rng.choice(companies),
+        "url": f"https://ca.indeed.com/viewjob?jk={i:08x}",
+        "location": rng.choice(["Halifax, NS", "Toronto, ON", "Remote, Canada"]),
+        "description": "SQL, Python and Power BI reporting for operations teams.",
+        "match_score": rng.randint(60, 99)
+    } for i in range(count)]
+
+
+def disk_usage(root: str) -> tuple:
+    """(package directories, files, bytes, allocated bytes) under root."""
+    packages = files = size = allocated = 0
+    for directory, _, names in os.walk(root):
+        if "job_details.json" in names:
+            packages += 1
+        for name in names:
+            stat = os.stat(os.path.join(directory, name))
+            files += 1
+            size += stat.st_size
+            allocated += stat.st_blocks * 512
+    return packages, files, size, allocated
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Package layout benchmark")
+    parser.add_argument("--packages", type=int, default=10000)
+    args = parser.parse_args()
+
+    jobs = sample_jobs(args.packages)
+    templates = os.path.join(ROOT, "templates")
+    print(f"{len(jobs)} jobs")
+    print(f"  {'Layout':22} {'Packages':>8} {'Files':>7} {'Written':>9} {'On disk':>9} {'Seconds':>8}")
+    baseline = None
+    with tempfile.TemporaryDirectory(prefix="bench_packages_") as directory:
+        for label, options in MODES:
+            output_dir = os.path.join(directory, label.replace(" ", "_").replace("+", ""))
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                for job in jobs:
+                    generate_application_package(job, templates, output_dir, **options)
+            seconds = time.perf_counter() - start
+            packages, files, size, allocated = disk_usage(output_dir)
+            baseline = baseline or allocated / packages
+            print(f"  {label:22} {packages:8d} {files:7d} {size / 2 ** 20:7.1f}MB {allocated / 2 ** 20:7.1f}MB "
+                  f"{seconds:8.2f}  ({allocated / packages / 1024:.1f}KB/package, "
+                  f"{allocated / packages / baseline:.0%} of flat)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark - Multi-profile scoring
+
+Scores synthetic postings against the config.json profiles, once with a
+separate scorer (and scan) per profile as separate runs would, and once
+with the shared single-pass scorer, and reports throughput and routing.
+
+Usage:
+    python benchmarks/bench_profile_scoring.py --postings 50000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+from profile_matcher import ProfileScorer
+
+TITLES = ["Junior Data Analyst", "BI Analyst", "Reporting Analyst", "Junior Data Scientist",
+          "Machine Learning Engineer", "Business Intelligence Developer", "Warehouse Associate"]
+TERMS = ("python sql power bi tableau excel dashboard dax etl machine learning statistics "
+         "scikit-learn pandas deep learning data analysis entry level junior full-time").split()
+FILLER = [f"word{i}" for i in range(2000)]
+LOCATIONS = ["Halifax, NS", "Toronto, ON", "Remote, Canada", "Vancouver, BC", "Ottawa, ON"]
+
+
+def synthetic_jobs(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    return [{
+        "title": rng.choice(TITLES),
+        "location": rng.choice(LOCATIONS),
+        "description": " ".join(rng.choices(TERMS, k=15) + rng.choices(FILLER, k=250))
+    } for _ in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-profile scoring benchmark")
+    parser.add_argument("--postings", type=int, default=50000)
+    parser.add_argument("--config", default=os.path.join(ROOT, "config.json"))
+    args = parser.parse_args()
+
+    with open(args.config, 'r') as f:
+        profiles = json.load(f).get("profiles") or None
+    jobs = synthetic_jobs(args.postings)
+
+    start = time.perf_counter()
+    for profile in profiles or [None]:
+        ProfileScorer([profile] if profile else None).score([dict(j) for j in jobs])
+    separate = time.perf_counter() - start
+
+    scorer = ProfileScorer(profiles)
+    start = time.perf_counter()
+    scored = scorer.score(jobs)
+    shared = time.perf_counter() - start
+
+    print(f"{len(scorer.profiles)} profiles, {len(jobs):,} postings")
+    print(f"  One scorer per profile: {separate:.2f}s ({len(jobs) / separate:,.0f} jobs/s)")
+    print(f"  Shared single pass:     {shared:.2f}s ({len(jobs) / shared:,.0f} jobs/s)")
+
+    routed = {}
+    for job in scored:
+        routed[job["profile"]] = routed.get(job["profile"], 0) + 1
+    for name, count in routed.items():
+        print(f"  Routed to {name}: {count:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark - Quota ledger overhead and low-priority deferral
+
+Measures what the quota check adds to every metered call (in memory and
+with the SQLite ledger, flushes included), then runs a search plan with
+deep pagination against a Brave budget that is nearly spent and shows
+which requests went out and which were deferred to the stale cache.
+
+Usage:
+    python benchmarks/bench_quota.py --calls 100000 --queries 20 --pages 3 --budget 40
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+import search_plan
+from quota import QuotaLedger, set_ledger
+from search_plan import SearchEngine, expand_plan
+
+
+def time_spend(ledger: QuotaLedger, calls: int) -> float:
+    """Microseconds per spend() call."""
+    start = time.perf_counter()
+    for i in range(calls):
+        ledger.spend("notion", priority="low" if i % 4 else "normal")
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def fake_search(query, count=10, country='ca', offset=0, timeout=None, priority="normal"):
+    from quota import spend
+    spend("brave", priority)
+    return [{"title": f"Data Analyst {offset}-{n}", "url": f"https://www.example.com/{abs(hash(query))}/{offset}/{n}",
+             "description": "", "location": "Canada", "company": "Example"} for n in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Quota ledger benchmark")
+    parser.add_argument("--calls", type=int, default=100000, help="spend() calls per overhead measurement")
+    parser.add_argument("--queries", type=int, default=20, help="Plan entries in the deferral run")
+    parser.add_argument("--pages", type=int, default=3, help="Result pages per plan entry")
+    parser.add_argument("--budget", type=int, default=40, help="Brave calls left this month")
+    args = parser.parse_args()
+
+    unlimited = {"notion": {}}
+    baseline = time.perf_counter()
+    for i in range(args.calls):
+        pass
+    loop = (time.perf_counter() - baseline) / args.calls * 1e6
+
+    with tempfile.TemporaryDirectory(prefix="bench_quota_") as directory:
+        memory = time_spend(QuotaLedger(None, limits=unlimited), args.calls)
+        limited = time_spend(QuotaLedger(None, limits={"notion": {"per_minute": 10 ** 9}}), args.calls)
+        ledger = QuotaLedger(os.path.join(directory, "quota.db"), limits={"notion": {"per_minute": 10 ** 9}},
+                             flush_seconds=0.05)
+        sqlite_backed = time_spend(ledger, args.calls)
+        ledger.close()
+        print(f"spend() overhead over {args.calls} calls (empty loop {loop:.2f}µs):")
+        print(f"  unlimited provider      {memory:6.2f}µs/call")
+        print(f"  limited, in memory      {limited:6.2f}µs/call")
+        print(f"  limited, SQLite ledger  {sqlite_backed:6.2f}µs/call  (flush every 50ms)")
+
+        # A month's Brave budget with only `budget` calls left
+        monthly = 2000
+        ledger = QuotaLedger(os.path.join(directory, "brave.db"),
+                             limits={"brave": {"per_minute": 10 ** 6, "per_month": monthly}})
+        ledger.spend("brave", cost=monthly - args.budget)
+        ledger.flush()
+        set_ledger(ledger)
+
+        search_plan.search_brave_jobs = fake_search
+        plan = [{"query": f"data analyst query {i}", "category": "Data", "pages": args.pages, "priority": i % 3}
+                for i in range(args.queries)]
+        requests = expand_plan(plan)
+        # Fill the stale cache once so deferred requests still return results
+        set_ledger(QuotaLedger(None, limits={"brave": {}}))
+        cache_path = os.path.join(directory, "cache.json")
+        SearchEngine(cache_path=cache_path, ttl_hours=0, workers=1).run(plan)
+        set_ledger(ledger)
+
+        outcome = SearchEngine(cache_path=cache_path, ttl_hours=0, workers=1).run(plan)
+        used = ledger.used("brave")["per_month"]
+        first = sum(1 for r in requests if r["offset"] == 0)
+        print(f"\n{len(requests)} requests ({first} first pages, {len(requests) - first} deep pages), "
+              f"{args.budget} Brave calls left of {monthly}, reserve {ledger.reserve:.0%}:")
+        print(f"  sent {used - (monthly - args.budget)}, deferred {outcome['health']['deferred']}, "
+              f"errors {len(outcome['errors'])}, month at {used}/{monthly} "
+              f"({used / monthly:.0%})")
+        ledger.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark - Adaptive search budget
+
+Simulates daily runs over a set of search terms where only some terms
+produce above-threshold jobs, and compares above-threshold jobs per API
+call for the uniform one-page-per-term plan against yield-based
+allocation with the same request budget. Adaptive entries may go up to
+--max-pages deep (search_budget.default_pages); at 1 the allocator can
+only pick terms, never deepen them.
+
+Yield-based allocation loses over short horizons, since every new term
+costs a probe and exploration keeps funding unproductive terms at first
+(--terms 6 --runs 10: 0.42 above-threshold jobs per call adaptive
+against 0.57 uniform). It pays off over weeks of daily runs with a few
+clearly productive terms (--terms 12 --runs 60: 0.65 against 0.43).
+
+Usage:
+    python benchmarks/bench_search_budget.py --terms 12 --runs 60 --max-pages 3
+"""
+
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+from search_budget import YieldTracker
+from search_plan import plan_from_terms
+
+
+def simulate_run(plan, productivity, rng):
+    """Return (term_stats, above_threshold) for one run of a plan."""
+    term_stats, above = {}, {}
+    for entry in plan:
+        term = entry["query"]
+        # Each page surfaces 10 results; deeper pages are less relevant
+        hits = sum(rng.random() < productivity[term] * 0.7 ** page
+                   for page in range(entry.get("pages", 1)) for _ in range(10))
+        term_stats[term] = {"requests": entry["pages"], "api_calls": entry["pages"],
+                            "results": 10 * entry["pages"], "new_jobs": 6 * entry["pages"]}
+        above[term] = hits
+    return term_stats, above
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Search budget benchmark")
+    parser.add_argument("--terms", type=int, default=12)
+    parser.add_argument("--runs", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--max-pages", type=int, default=3, help="Depth cap for adaptive entries")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    terms = [f"term {i}" for i in range(args.terms)]
+    productivity = {t: (rng.uniform(0.05, 0.3) if i % 3 == 0 else 0.0) for i, t in enumerate(terms)}
+    budget = args.terms
+
+    uniform = YieldTracker(None)
+    adaptive = YieldTracker(None)
+    for _ in range(args.runs):
+        uniform.record(*simulate_run([dict(e, pages=1) for e in plan_from_terms(terms)], productivity, rng))
+        adaptive.record(*simulate_run(adaptive.allocate(plan_from_terms(terms), budget, default_pages=args.max_pages), productivity, rng))
+
+    for label, tracker in (("uniform", uniform), ("adaptive", adaptive)):
+        calls = sum(h["api_calls"] for h in tracker.history)
+        above = sum(h["above_threshold"] for h in tracker.history)
+        last = tracker.history[-10:]
+        recent = sum(h["above_threshold"] for h in last) / sum(h["api_calls"] for h in last)
+        print(f"{label:<9} {calls:5} calls  {above:5} above threshold  "
+              f"{above / calls:.2f}/call overall  {recent:.2f}/call last 10 runs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark - Query plan engine
+
+Replaces the Brave API call with a stand-in that sleeps for a realistic
+latency and returns overlapping results, then compares running a
+30-query sweep through the engine against the old one-query-at-a-time
+loop, and measures a warm (fully cached) rerun.
+
+Usage:
+    python benchmarks/bench_search_plan.py --queries 30 --latency 0.6
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+import search_plan
+from search_plan import SearchEngine, expand_plan
+from quota import QuotaLedger, DEFAULT_LIMITS, set_ledger
+
+# Measure the code under test, not the quota: an unlimited in-memory ledger
+set_ledger(QuotaLedger(None, limits={name: {} for name in DEFAULT_LIMITS}))
+
+
+def make_stand_in(latency: float):
+    def fake_search(query, count=10, country='ca', offset=0, timeout=None, priority="normal"):
+        time.sleep(latency * random.uniform(0.7, 1.3))
+        rng = random.Random(f"{query}{offset}")
+        # Draw from a shared pool so different queries overlap like real results
+        return [{"title": f"Data Analyst {n}", "url": f"https://www.example.com/jobs/{n}/",
+                 "description": "", "location": "Canada", "company": "Example"}
+                for n in rng.sample(range(400), count)]
+    return fake_search
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query plan benchmark")
+    parser.add_argument("--queries", type=int, default=30)
+    parser.add_argument("--latency", type=float, default=0.6)
+    parser.add_argument("--workers", type=int, default=6)
+    args = parser.parse_args()
+
+    search_plan.search_brave_jobs = make_stand_in(args.latency)
+    plan = [{"query": f"data analyst query {i}", "category": f"C{i % 5}", "priority": i % 3}
+            for i in range(args.queries)]
+    n_requests = len(expand_plan(plan))
+
+    t0 = time.perf_counter()
+    for spec in expand_plan(plan[:5]):
+        search_plan.search_brave_jobs(spec["query"], count=spec["count"])
+    serial_five = time.perf_counter() - t0
+    print(f"Serial loop, 5 queries:      {serial_five:5.2f}s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = os.path.join(tmp, "cache.json")
+
+        t0 = time.perf_counter()
+        outcome = SearchEngine(cache_path=cache_path, workers=args.workers).run(plan)
+        cold = time.perf_counter() - t0
+        print(f"Engine, {n_requests} queries (cold):  {cold:5.2f}s  "
+              f"{len(outcome['jobs'])} unique jobs")
+
+        t0 = time.perf_counter()
+        SearchEngine(cache_path=cache_path, workers=args.workers).run(plan)
+        print(f"Engine, {n_requests} queries (warm):  {time.perf_counter() - t0:5.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Benchmark - Brave search tail latency with hedging and a circuit breaker
+
+Runs a local stand-in for the Brave web search endpoint that answers most
+requests in 80-200ms, stalls a small share of them for several seconds,
+and goes through short outages where every request hangs and then fails.
+The same sequence of pipeline search runs (12 requests each) is executed
+twice: once the old way (no deadline, no hedging, no breaker) and once with
+the engine's per-request deadline, p95 hedging and circuit breaker. Reports
+p50/p95/p99 run latency and how many extra requests hedging cost.
+
+Usage:
+    python benchmarks/bench_search_resilience.py --runs 60 --slow-rate 0.03 --outage-runs 3
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+
+class StandIn:
+    """Failure-injecting behaviour shared by all handler threads."""
+
+    def __init__(self, slow_rate: float, slow_seconds: float, hang_seconds: float, seed: int = 7):
+        self.slow_rate = slow_rate
+        self.slow_seconds = slow_seconds
+        self.hang_seconds = hang_seconds
+        self.outage = False
+        self.requests = 0
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def delay(self) -> tuple:
+        """(seconds to wait, whether to fail) for the next request."""
+        with self.lock:
+            self.requests += 1
+            if self.outage:
+                return self.hang_seconds, True
+            if self.rng.random() < self.slow_rate:
+                return self.slow_seconds, False
+            return self.rng.uniform(0.08, 0.2), False
+
+
+def make_handler(stand_in: StandIn):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            seconds, fail = stand_in.delay()
+            time.sleep(seconds)
+            params = parse_qs(urlparse(self.path).query)
+            query = params["q"][0]
+            count = int(params.get("count", ["10"])[0])
+            if fail:
+                self.send_response(503)
+                self.end_headers()
+                return
+            results = [{"title": f"Data Analyst at Company {n}", "url": f"https://ca.indeed.com/viewjob?jk={n}",
+                        "description": f"{query} Halifax, NS"} for n in range(count)]
+            payload = json.dumps({"web": {"results": results}}).encode()
+            try:
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+            except OSError:
+                pass  # client gave up on this attempt
+
+        def log_message(self, *args):
+            pass
+    return Handler
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def run_sequence(label: str, stand_in: StandIn, args, directory: str, **engine_options) -> None:
+    from search_plan import SearchEngine
+    from quota import QuotaLedger, DEFAULT_LIMITS, set_ledger
+    set_ledger(QuotaLedger(None, limits={name: {} for name in DEFAULT_LIMITS}))
+
+    plan = [{"query": f"data analyst query {i}", "category": "Data"} for i in range(args.queries)]
+    outages = set(range(args.runs // 2, args.runs // 2 + args.outage_runs))
+    cache_path = os.path.join(directory, f"{label}_cache.json")
+    latency_path = os.path.join(directory, f"{label}_latency.json")
+
+    # Warm-up run so both modes have cached results to fall back on
+    SearchEngine(cache_path=cache_path, ttl_hours=0, latency_path=latency_path, **engine_options).run(plan)
+    stand_in.requests = 0
+
+    durations, empty, health = [], 0, {}
+    for run in range(args.runs):
+        stand_in.outage = run in outages
+        # ttl 0: every run asks the API, as a daily run would for fresh results
+        engine = SearchEngine(cache_path=cache_path, ttl_hours=0, latency_path=latency_path, **engine_options)
+        start = time.perf_counter()
+        outcome = engine.run(plan)
+        durations.append(time.perf_counter() - start)
+        empty += sum(1 for stats in outcome["stats"].values() if stats["results"] == 0)
+        for key in ("hedged", "hedge_wins", "timeouts", "short_circuited"):
+            health[key] = health.get(key, 0) + outcome["health"][key]
+    stand_in.outage = False
+
+    requests = args.runs * args.queries
+    print(f"  {label:10} p50 {percentile(durations, 50):5.2f}s  p95 {percentile(durations, 95):5.2f}s  "
+          f"p99 {percentile(durations, 99):5.2f}s  max {max(durations):5.2f}s  "
+          f"total {sum(durations):6.1f}s")
+    print(f"  {'':10} {stand_in.requests} HTTP requests for {requests} searches "
+          f"({stand_in.requests / requests - 1:+.1%}), {empty} searches without results, "
+          f"hedged {health['hedged']} (won {health['hedge_wins']}), timeouts {health['timeouts']}, "
+          f"short-circuited {health['short_circuited']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Search tail latency benchmark")
+    parser.add_argument("--runs", type=int, default=60, help="Pipeline search runs per mode")
+    parser.add_argument("--queries", type=int, default=12, help="Requests per run")
+    parser.add_argument("--slow-rate", type=float, default=0.03, help="Share of requests that stall")
+    parser.add_argument("--slow-seconds", type=float, default=3.0)
+    parser.add_argument("--outage-runs", type=int, default=3, help="Runs during which the endpoint hangs and fails")
+    parser.add_argument("--hang-seconds", type=float, default=8.0)
+    parser.add_argument("--timeout", type=float, default=2.0, help="Per-request deadline for the resilient mode")
+    args = parser.parse_args()
+
+    stand_in = StandIn(args.slow_rate, args.slow_seconds, args.hang_seconds)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(stand_in))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    os.environ["BRAVE_API_BASE"] = f"http://127.0.0.1:{server.server_address[1]}/res/v1"
+    os.environ["BRAVE_API_KEY"] = "bench"
+
+    print(f"{args.runs} runs x {args.queries} requests, {args.slow_rate:.0%} stall {args.slow_seconds}s, "
+          f"{args.outage_runs} outage run(s) hanging {args.hang_seconds}s")
+    with tempfile.TemporaryDirectory(prefix="bench_resilience_") as directory:
+        run_sequence("baseline", stand_in, args, directory,
+                     timeout=600, hedge=False, breaker_failures=0)
+        run_sequence("resilient", stand_in, args, directory,
+                     timeout=args.timeout, hedge=True, breaker_failures=5)
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
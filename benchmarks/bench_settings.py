@@ -0,0 +1,106 @@
+"""
+Benchmark - Config and credential file opens per pipeline run
+
+Replays the settings lookups of one full pipeline run (config load, one
+Brave key lookup per search request, Notion pull and sync, Telegram) in a
+temporary project directory and counts open() calls, once with the
+previous per-call loaders and once with the shared settings registry.
+
+Usage:
+    python benchmarks/bench_settings.py --requests 12 --runs 3
+"""
+
+import argparse
+import builtins
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+
+def legacy_lookups(requests: int) -> None:
+    """The previous loaders: every lookup opens and scans its file."""
+    def read_key(path, markers):
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                for line in f:
+                    if any(m in line.lower() for m in markers):
+                        return line.split(':', 1)[1].strip()
+        return ''
+
+    def database_id():
+        with open("config.json", 'r') as f:
+            return json.load(f).get('notion_database_id', '')
+
+    with open("config.json", 'r') as f:
+        json.load(f)                                          # JobPipeline._load_config
+    for _ in range(requests):
+        read_key("credentials/brave-search.md", ["api key:", "token:"])
+    for _ in range(2):                                        # pull_from_notion + sync_to_notion
+        read_key("credentials/notion.md", ["ntn_"])
+        database_id()
+    read_key("credentials/telegram.md", ["token:"])
+
+
+def registry_lookups(requests: int) -> None:
+    """The same lookups through the shared settings registry."""
+    from settings import load_config
+    from job_search import load_brave_api_key
+    from notion_sync import load_notion_token, load_database_id
+    from notifier import load_telegram_token
+
+    load_config("config.json")
+    for _ in range(requests):
+        load_brave_api_key()
+    for _ in range(2):
+        load_notion_token()
+        load_database_id()
+    load_telegram_token()
+
+
+def count_opens(fn, *args) -> tuple:
+    opened = []
+    real_open = builtins.open
+
+    def counting_open(file, *a, **kw):
+        opened.append(file)
+        return real_open(file, *a, **kw)
+
+    builtins.open = counting_open
+    start = time.perf_counter()
+    try:
+        fn(*args)
+    finally:
+        builtins.open = real_open
+    return len(opened), time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Settings registry benchmark")
+    parser.add_argument("--requests", type=int, default=12, help="Brave requests per run")
+    parser.add_argument("--runs", type=int, default=3, help="Runs in one process (e.g. --worker loops)")
+    args = parser.parse_args()
+
+    project = tempfile.mkdtemp(prefix="bench_settings_")
+    os.makedirs(os.path.join(project, "credentials"))
+    with open(os.path.join(project, "config.json"), 'w') as f:
+        json.dump({"notion_database_id": "db123", "match_threshold": 80}, f)
+    for name, line in (("brave-search", "API Key: brv_test"), ("notion", "Token: ntn_test123"),
+                       ("telegram", "Token: 123:abc")):
+        with open(os.path.join(project, "credentials", f"{name}.md"), 'w') as f:
+            f.write(f"# {name}\n\n{line}\n")
+    os.chdir(project)
+    # Import after chdir so the registry resolves this project; keep import time out of the timings
+    import job_search, notion_sync, notifier  # noqa: F401
+
+    for label, fn in (("Per-call loaders", legacy_lookups), ("Settings registry", registry_lookups)):
+        for run in range(1, args.runs + 1):
+            opens, seconds = count_opens(fn, args.requests)
+            print(f"  {label:18} run {run}: {opens:3d} file opens ({seconds * 1000:.2f}ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark - TF-IDF similarity scoring
+
+Scores synthetic postings against the resume profile and reports
+throughput, then scores the labelled postings in
+benchmarks/data/similarity_fixture.json and reports the boost each label
+gets, both on their own and mixed into the synthetic batch, to show the
+boost does not depend on what else is scored.
+
+Usage:
+    python benchmarks/bench_similarity.py --postings 100000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+from resume_generator import CANDIDATE_PROFILE
+from similarity import SimilarityScorer, blend_scores, profile_text
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "similarity_fixture.json")
+
+RELEVANT = ("python sql power bi tableau excel dashboards reporting data analysis statistical "
+            "analysis data visualization automation stakeholders kpi etl").split()
+UNRELATED = ("hvac autocad welding forklift inventory nursing patient retail cashier "
+             "carpentry plumbing electrical scheduling logistics").split()
+FILLER = [f"word{i}" for i in range(3000)]
+
+
+def synthetic_posting(rng, relevant: bool) -> str:
+    vocab = RELEVANT if relevant else UNRELATED
+    title = "Junior Data Analyst" if relevant else "Warehouse Associate"
+    words = rng.choices(vocab, k=25) + rng.choices(FILLER, k=120)
+    rng.shuffle(words)
+    return f"{title} {' '.join(words)}"
+
+
+def boosts_by_label(postings: list, similarities) -> dict:
+    """Points blend_scores adds to each posting, grouped by label."""
+    points = [boosted - 50 for boosted in blend_scores([50] * len(postings), similarities)]
+    grouped = {}
+    for posting, gained in zip(postings, points):
+        grouped.setdefault(posting["label"], []).append(gained)
+    return grouped
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Similarity scoring benchmark")
+    parser.add_argument("--postings", type=int, default=100000)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    texts = [synthetic_posting(rng, rng.random() < 0.3) for _ in range(args.postings)]
+
+    scorer = SimilarityScorer(profile_text(CANDIDATE_PROFILE))
+    t0 = time.perf_counter()
+    scorer.score(texts)
+    elapsed = time.perf_counter() - t0
+    print(f"Scored {args.postings:,} postings in {elapsed:.2f}s ({args.postings / elapsed:,.0f}/s)")
+
+    with open(FIXTURE, 'r', encoding='utf-8') as f:
+        postings = json.load(f)["postings"]
+    fixture_texts = [p["text"] for p in postings]
+    alone = boosts_by_label(postings, scorer.score(fixture_texts))
+    mixed = boosts_by_label(postings, scorer.score(fixture_texts + texts)[:len(postings)])
+
+    print(f"Boost points on the labelled fixture ({len(postings)} postings), scored alone / "
+          f"among {args.postings:,} synthetic postings:")
+    for label in alone:
+        print(f"  {label:10} {min(alone[label]):3}-{max(alone[label]):<3} / "
+              f"{min(mixed[label]):3}-{max(mixed[label]):<3}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark - CLI startup time
+
+Measures wall-clock startup of `pipeline.py --version` and `--dry-run`,
+and uses `python -X importtime` to report cumulative import cost against
+eagerly importing every stage module.
+
+Usage:
+    python benchmarks/bench_startup.py --runs 20
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts")
+PIPELINE = os.path.join(SCRIPTS_DIR, "pipeline.py")
+STAGE_MODULES = "job_search, resume_generator, notion_sync, job_store, job_enrich, history_export"
+
+
+def wall_time(cmd, runs: int) -> float:
+    """Median wall time in milliseconds."""
+    timings = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        timings.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(timings)
+
+
+def import_profile(cmd):
+    """Return (total cumulative µs of top-level imports, top 5 by self time)."""
+    proc = subprocess.run([sys.executable, "-X", "importtime"] + cmd,
+                          capture_output=True, text=True, cwd=SCRIPTS_DIR)
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(self_us), int(cumulative_us), name.rstrip()[1:]))
+    total = sum(cum for _, cum, name in rows if not name.startswith(" "))
+    return total, sorted(rows, reverse=True)[:5]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Startup benchmark")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    baseline = wall_time([sys.executable, "-c", "pass"], args.runs)
+    print(f"python -c pass:          {baseline:6.1f} ms")
+    print(f"pipeline.py --version:   {wall_time([sys.executable, PIPELINE, '--version'], args.runs):6.1f} ms")
+    print(f"pipeline.py --dry-run:   {wall_time([sys.executable, PIPELINE, '--dry-run'], args.runs):6.1f} ms")
+
+    for label, cmd in [
+        ("lazy (--version)", [PIPELINE, "--version"]),
+        ("eager stage imports", ["-c", f"import {STAGE_MODULES}"]),
+    ]:
+        total, top = import_profile(cmd)
+        print(f"\n{label}: {total / 1000:.1f} ms cumulative import time")
+        for self_us, _, name in top:
+            print(f"  {self_us / 1000:6.2f} ms  {name.strip()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark - Top-K job selection with company and location caps
+
+Scores are synthetic: 100k candidates from a few thousand companies
+(some posting dozens of near-identical roles) across 30 locations.
+Compares the old sort-and-threshold step with heap-based top-k selection,
+then times a whole run's downstream work (package generation, plus the
+Notion page creations it implies) for each.
+
+Usage:
+    python benchmarks/bench_top_k.py --candidates 100000 --k 25 --per-company 2 --per-location 8
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+from resume_generator import generate_application_package
+from selection import TopKSelector
+
+# Notion's documented average rate limit
+NOTION_REQUESTS_PER_SECOND = 3
+
+
+def sample_candidates(count: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    companies = [f"Company {i} Inc." for i in range(count // 25)]
+    locations = [f"City {i}, NS" for i in range(30)]
+    return [{
+        "title": f"Data Analyst {i}",
+        # Pareto-weighted: a few companies post a large share of the roles
+        "company": companies[min(len(companies) - 1, int(rng.paretovariate(1.2)) - 1)],
+        "location": rng.choice(locations) + rng.choice(["", " (Hybrid)"]),
+        "url": f"https://ca.indeed.com/viewjob?jk={i:08x}",
+        "description": "SQL, Python and Power BI reporting.",
+        "match_score": round(min(100, rng.gauss(65, 12)), 1)
+    } for i in range(count)]
+
+
+def busiest(jobs: list) -> int:
+    """Most jobs from one company."""
+    counts = {}
+    for job in jobs:
+        counts[job['company']] = counts.get(job['company'], 0) + 1
+    return max(counts.values(), default=0)
+
+
+def old_selection(jobs: list, threshold: float) -> list:
+    jobs = sorted(jobs, key=lambda x: x['match_score'], reverse=True)
+    return [j for j in jobs if j['match_score'] >= threshold]
+
+
+def downstream(jobs: list, directory: str) -> float:
+    """Seconds to generate every package, plus the Notion writes at the rate limit."""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for job in jobs:
+            generate_application_package(job, os.path.join(ROOT, "templates"), directory, layout="sharded")
+    return time.perf_counter() - start + len(jobs) / NOTION_REQUESTS_PER_SECOND
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Top-k selection benchmark")
+    parser.add_argument("--candidates", type=int, default=100000)
+    parser.add_argument("--threshold", type=float, default=80)
+    parser.add_argument("--k", type=int, default=25)
+    parser.add_argument("--per-company", type=int, default=2)
+    parser.add_argument("--per-location", type=int, default=8)
+    args = parser.parse_args()
+
+    jobs = sample_candidates(args.candidates)
+    print(f"{len(jobs)} scored candidates, threshold {args.threshold}, k {args.k}")
+
+    start = time.perf_counter()
+    old = old_selection(jobs, args.threshold)
+    old_seconds = time.perf_counter() - start
+    print(f"  sort + threshold     {old_seconds * 1000:7.1f}ms  {len(old)} selected, "
+          f"at most {busiest(old[:args.k])} per company in the first {args.k}")
+
+    rows = [("top-k", {}), ("top-k + caps", {"per_company": args.per_company, "per_location": args.per_location})]
+    selected = None
+    for label, caps in rows:
+        start = time.perf_counter()
+        selector = TopKSelector(args.k, args.threshold, **caps)
+        for job in jobs:
+            selector.push(job)
+        selected = selector.result()
+        seconds = time.perf_counter() - start
+        print(f"  {label:20} {seconds * 1000:7.1f}ms  {len(selected)} selected, kept {selector.kept} candidates, "
+              f"at most {busiest(selected)} per company")
+
+    with tempfile.TemporaryDirectory(prefix="bench_top_k_") as directory:
+        old_run = downstream(old, os.path.join(directory, "old"))
+        new_run = downstream(selected, os.path.join(directory, "new"))
+    print(f"\nDownstream work (generation + Notion writes at {NOTION_REQUESTS_PER_SECOND}/s):")
+    print(f"  sort + threshold     {len(old):6d} packages  {old_run:8.1f}s")
+    print(f"  top-k + caps         {len(selected):6d} packages  {new_run:8.1f}s")
+
+
+if __name__ == "__main__":
+    main()
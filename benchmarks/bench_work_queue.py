@@ -0,0 +1,134 @@
+"""
+Benchmark - Work queue throughput with 1 to 8 workers
+
+Queues generate and sync tasks for a batch of scored jobs, then drains the
+queue with N `pipeline.py worker --drain` processes and reports tasks per
+second for each N. Sync tasks write to a local mock of the Notion API that
+adds a fixed per-request latency, so the run mixes local CPU work
+(rendering packages) with waiting on the network, like a real sweep.
+
+Usage:
+    python benchmarks/bench_work_queue.py --jobs 80 --latency 0.2 --workers 1 2 4 8
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+from work_queue import WorkQueue
+
+SCHEMA = {
+    "Company": {"type": "title"},
+    "Role": {"type": "rich_text"},
+    "Location": {"type": "select", "select": {"options": [{"name": "Halifax, NS"}, {"name": "Canada"}]}},
+    "Match Score": {"type": "number"},
+    "Status": {"type": "select", "select": {"options": [{"name": "Not Applied"}]}},
+    "Job URL": {"type": "url"},
+    "Date Found": {"type": "date"}
+}
+
+
+def make_handler(latency: float, counter: list):
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self, body: dict):
+            payload = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_GET(self):
+            self._reply({"properties": SCHEMA})
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            time.sleep(latency)
+            counter.append(1)
+            self._reply({"id": f"page-{len(counter)}"})
+
+        def log_message(self, *args):
+            pass
+    return Handler
+
+
+def sample_jobs(count: int) -> list:
+    return [{
+        "title": f"Data Analyst {i}",
+        "company": f"Company {i}",
+        "url": f"https://example.com/jobs/{i}",
+        "location": "Halifax, NS",
+        "description": "SQL, Python and Power BI reporting for operations teams.",
+        "match_score": 85
+    } for i in range(count)]
+
+
+def run_workers(count: int, directory: str, jobs: list, env: dict) -> tuple:
+    """Queue the tasks afresh and drain them with `count` worker processes."""
+    queue_path = os.path.join(directory, f"queue_{count}.db")
+    config_path = os.path.join(directory, "config.json")
+    with open(config_path, 'w') as f:
+        json.dump({
+            "templates_dir": os.path.join(ROOT, "templates"),
+            "output_dir": os.path.join(directory, f"applications_{count}"),
+            "store_path": os.path.join(directory, f"jobs_{count}.db"),
+            "notion_database_id": "mock-db",
+            "queue": {"path": queue_path, "poll_seconds": 0.2}
+        }, f)
+
+    with WorkQueue(queue_path) as queue:
+        queue.enqueue("generate", [{"job": job} for job in jobs])
+        queue.enqueue("sync", [{"jobs": [job]} for job in jobs])
+
+    start = time.perf_counter()
+    processes = [subprocess.Popen([sys.executable, os.path.join(ROOT, "scripts", "pipeline.py"),
+                                   "--config", config_path, "worker", "--drain"],
+                                  cwd=directory, stdout=subprocess.DEVNULL,
+                                  env=dict(env, PIPELINE_QUOTA_PATH=os.path.join(directory, f"quota_{count}.db")))
+                 for _ in range(count)]
+    for process in processes:
+        process.wait()
+    seconds = time.perf_counter() - start
+
+    with WorkQueue(queue_path) as queue:
+        return seconds, queue.counts()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Work queue scaling benchmark")
+    parser.add_argument("--jobs", type=int, default=80, help="Jobs (one generate and one sync task each)")
+    parser.add_argument("--latency", type=float, default=0.2, help="Mock Notion seconds per page create")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    created = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(args.latency, created))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    env = dict(os.environ, NOTION_API_BASE=f"http://127.0.0.1:{server.server_address[1]}/v1",
+               NOTION_TOKEN="ntn_mock")
+    jobs = sample_jobs(args.jobs)
+    tasks = 2 * len(jobs)
+
+    print(f"{tasks} tasks ({len(jobs)} generate + {len(jobs)} sync), Notion latency {args.latency * 1000:.0f}ms")
+    baseline = None
+    with tempfile.TemporaryDirectory(prefix="bench_queue_") as directory:
+        for count in args.workers:
+            seconds, counts = run_workers(count, directory, jobs, env)
+            rate = tasks / seconds
+            baseline = baseline or rate
+            print(f"  {count} worker(s): {seconds:6.2f}s  {rate:6.1f} tasks/s  ({rate / baseline:.1f}x)  {counts}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,368 @@
+"""
+API Server Module - Read-only Local HTTP API over Pipeline Output
+
+Serves the job store, generated packages and run results as JSON, so a
+dashboard can poll the pipeline instead of opening files:
+
+    GET /jobs?location=halifax&min_score=80&status=Not+Applied&q=tableau&limit=50&offset=0
+    GET /jobs/<id>
+    GET /scores          score histogram and counts per status
+    GET /packages        generated application packages (job_details.json)
+    GET /runs            summary of each pipeline_results_*.json
+    GET /health
+
+Every 200 response carries an ETag derived from what it was built from (the
+job store's file sizes and modification times, the package listing, the
+results files) plus the request itself. A client that sends it back in
+If-None-Match gets 304 Not Modified, and unchanged responses are served
+from a small in-memory cache without the server touching SQLite. Errors
+carry no ETag.
+
+    python scripts/pipeline.py serve --port 8765
+"""
+
+import glob
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import List, Dict, Optional, Tuple
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+from job_store import JobStore, QueryError, normalize_query
+
+
+# Columns returned in job listings; /jobs/<id> adds the description
+LIST_COLUMNS = ("id", "url", "title", "company", "location", "source", "match_score", "first_seen",
+                "last_seen", "status", "status_updated", "notion_page_id")
+
+# How long directory scans (packages, results files) are reused
+SCAN_SECONDS = 5
+
+
+class BadRequest(Exception):
+    """Raised for query parameters the API cannot use; answered with 400."""
+
+
+class JobAPI:
+    """Builds API responses; shared by every request thread."""
+
+    def __init__(self, store_path: str, output_dir: str = "applications",
+                 results_glob: str = "pipeline_results_*.json", page_size: int = 50,
+                 max_page_size: int = 500, cache_size: int = 256):
+        """
+        Args:
+            store_path: Job store database
+            output_dir: Applications directory with the generated packages
+            results_glob: Pattern matching the per-run results files
+            page_size: Default page size for listings
+            max_page_size: Largest page size a client may ask for
+            cache_size: Responses kept in memory
+        """
+        self.store_path = store_path
+        self.output_dir = output_dir
+        self.results_glob = results_glob
+        self.page_size = page_size
+        self.max_page_size = max_page_size
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.scans = {}
+        self.run_summaries = {}
+
+        # Creates the database and applies migrations once; requests only read
+        JobStore(store_path).close()
+
+    def _conn(self) -> sqlite3.Connection:
+        """Read-only connection for the current thread."""
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(f"file:{os.path.abspath(self.store_path)}?mode=ro", uri=True,
+                                   check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            self.local.conn = conn
+        return conn
+
+    def _store_version(self) -> str:
+        """Changes whenever a write to the job store is committed (or checkpointed)."""
+        parts = []
+        for path in (self.store_path, f"{self.store_path}-wal"):
+            try:
+                stat = os.stat(path)
+                parts.append(f"{stat.st_size}:{stat.st_mtime_ns}")
+            except OSError:
+                parts.append("-")
+        return "|".join(parts)
+
+    def _scan(self, name: str, pattern: str) -> List[Tuple[str, int]]:
+        """(path, mtime) of files matching pattern, rescanned at most every SCAN_SECONDS."""
+        with self.lock:
+            scanned_at, files = self.scans.get(name, (0, None))
+        if files is None or time.monotonic() - scanned_at >= SCAN_SECONDS:
+            files = []
+            for path in sorted(glob.glob(pattern, recursive=True)):
+                try:
+                    files.append((path, os.stat(path).st_mtime_ns))
+                except OSError:
+                    continue
+            with self.lock:
+                self.scans[name] = (time.monotonic(), files)
+        return files
+
+    def _package_files(self) -> List[Tuple[str, int]]:
+        return self._scan("packages", os.path.join(self.output_dir, "**", "job_details.json"))
+
+    def _results_files(self) -> List[Tuple[str, int]]:
+        return self._scan("runs", self.results_glob)
+
+    def version(self, path: str) -> str:
+        """Version of the data behind an endpoint."""
+        if path == "/packages":
+            return hashlib.sha1(repr(self._package_files()).encode()).hexdigest()
+        if path == "/runs":
+            return hashlib.sha1(repr(self._results_files()).encode()).hexdigest()
+        if path == "/health":
+            return "health"
+        return self._store_version()
+
+    def _page(self, params: Dict) -> Tuple[int, int]:
+        try:
+            limit = int(params.get("limit", self.page_size))
+            offset = int(params.get("offset", 0))
+        except ValueError:
+            raise BadRequest("limit and offset must be integers")
+        if limit < 1 or offset < 0:
+            raise BadRequest("limit must be positive and offset not negative")
+        return min(limit, self.max_page_size), offset
+
+    def _paged(self, key: str, items: List, total: int, limit: int, offset: int, params: Dict) -> Dict:
+        body = {key: items, "total": total, "limit": limit, "offset": offset, "next": None}
+        if offset + limit < total:
+            body["next"] = "?" + urlencode({**params, "limit": limit, "offset": offset + limit})
+        return body
+
+    def jobs(self, params: Dict) -> Dict:
+        """Stored jobs, best match first, filtered by location, score, status, company and text."""
+        limit, offset = self._page(params)
+        where, args = [], []
+        if params.get("location"):
+            where.append("location LIKE ?")
+            args.append(f"%{params['location']}%")
+        if params.get("company"):
+            where.append("company LIKE ?")
+            args.append(f"%{params['company']}%")
+        if params.get("status"):
+            where.append("status = ?")
+            args.append(params["status"])
+        for name, operator in (("min_score", ">="), ("max_score", "<=")):
+            if params.get(name):
+                try:
+                    args.append(float(params[name]))
+                except ValueError:
+                    raise BadRequest(f"{name} must be a number")
+                where.append(f"match_score {operator} ?")
+        if params.get("q"):
+            where.append("id IN (SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH ?)")
+            try:
+                args.append(normalize_query(params["q"]))
+            except QueryError as e:
+                raise BadRequest(str(e))
+        clause = f"WHERE {' AND '.join(where)}" if where else ""
+
+        conn = self._conn()
+        try:
+            total = conn.execute(f"SELECT COUNT(*) FROM jobs {clause}", args).fetchone()[0]
+            rows = conn.execute(
+                f"SELECT {', '.join(LIST_COLUMNS)} FROM jobs {clause} "
+                "ORDER BY match_score DESC, id LIMIT ? OFFSET ?",
+                args + [limit, offset]
+            ).fetchall()
+        except sqlite3.OperationalError as e:
+            raise BadRequest(f"invalid query: {e}")
+        return self._paged("jobs", [dict(row) for row in rows], total, limit, offset, params)
+
+    def job(self, job_id: str) -> Optional[Dict]:
+        """One stored job with its description, or None."""
+        if not job_id.isdigit():
+            return None
+        row = self._conn().execute("SELECT * FROM jobs WHERE id = ?", (int(job_id),)).fetchone()
+        return dict(row) if row else None
+
+    def scores(self, params: Dict) -> Dict:
+        """Match score histogram (buckets of 10) and job counts per status."""
+        conn = self._conn()
+        buckets = {f"{low}-{low + 9}": 0 for low in range(0, 100, 10)}
+        buckets["100"] = 0
+        for bucket, count in conn.execute(
+            "SELECT MIN(CAST(match_score / 10 AS INTEGER), 10), COUNT(*) FROM jobs "
+            "WHERE match_score IS NOT NULL GROUP BY 1"
+        ):
+            buckets["100" if bucket >= 10 else f"{bucket * 10}-{bucket * 10 + 9}"] = count
+        total, scored, average = conn.execute(
+            "SELECT COUNT(*), COUNT(match_score), AVG(match_score) FROM jobs"
+        ).fetchone()
+        statuses = dict(conn.execute("SELECT COALESCE(status, 'Not Applied'), COUNT(*) FROM jobs GROUP BY 1"))
+        return {"total": total, "scored": scored,
+                "average": round(average, 1) if average is not None else None,
+                "histogram": buckets, "statuses": statuses}
+
+    def packages(self, params: Dict) -> Dict:
+        """Generated packages, most recently generated first."""
+        limit, offset = self._page(params)
+        packages = []
+        for path, _ in self._package_files():
+            try:
+                with open(path, 'r') as f:
+                    details = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                continue
+            details["path"] = os.path.relpath(os.path.dirname(path), self.output_dir)
+            packages.append(details)
+        if params.get("location"):
+            needle = params["location"].lower()
+            packages = [p for p in packages if needle in str(p.get("location", "")).lower()]
+        if params.get("min_score"):
+            try:
+                minimum = float(params["min_score"])
+            except ValueError:
+                raise BadRequest("min_score must be a number")
+            packages = [p for p in packages if (p.get("match_score") or 0) >= minimum]
+        packages.sort(key=lambda p: p.get("generated_at", ""), reverse=True)
+        return self._paged("packages", packages[offset:offset + limit], len(packages), limit, offset, params)
+
+    def _run_summary(self, path: str, mtime: int) -> Optional[Dict]:
+        cached = self.run_summaries.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        try:
+            with open(path, 'r') as f:
+                results = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        name = os.path.basename(path)
+        summary = {
+            "run": name[len("pipeline_results_"):-len(".json")] if name.startswith("pipeline_results_") else name,
+            "jobs_found": len(results.get("jobs_found", [])),
+            "jobs_scored": len(results.get("jobs_scored", [])),
+            "applications_generated": len(results.get("applications_generated", [])),
+            "errors": len(results.get("errors", []))
+        }
+        self.run_summaries[path] = (mtime, summary)
+        return summary
+
+    def runs(self, params: Dict) -> Dict:
+        """Counts from each run's results file, newest first."""
+        limit, offset = self._page(params)
+        summaries = [self._run_summary(path, mtime) for path, mtime in self._results_files()]
+        summaries = sorted((s for s in summaries if s), key=lambda s: s["run"], reverse=True)
+        return self._paged("runs", summaries[offset:offset + limit], len(summaries), limit, offset, params)
+
+    def handle(self, target: str, if_none_match: Optional[str] = None) -> Tuple[int, Optional[bytes], Optional[str]]:
+        """
+        Answer a GET request.
+
+        Only 200 responses carry an ETag, so If-None-Match can never turn a
+        404 or 400 into 304 Not Modified. Unexpected errors are answered
+        with 500 and a JSON body instead of dropping the connection.
+
+        Args:
+            target: Request path with query string
+            if_none_match: The client's If-None-Match header
+
+        Returns:
+            (HTTP status, JSON body or None for 304, ETag or None)
+        """
+        try:
+            return self._handle(target, if_none_match)
+        except Exception as e:
+            return 500, json.dumps({"error": f"internal error: {e}"}).encode(), None
+
+    def _handle(self, target: str, if_none_match: Optional[str]) -> Tuple[int, Optional[bytes], Optional[str]]:
+        parts = urlsplit(target)
+        path = parts.path.rstrip("/") or "/"
+        params = dict(parse_qsl(parts.query))
+        key = f"{path}?{urlencode(sorted(params.items()))}"
+        etag = '"' + hashlib.sha1(f"{self.version(path)}#{key}".encode()).hexdigest()[:20] + '"'
+        matches = bool(if_none_match) and etag in [tag.strip() for tag in if_none_match.split(",")]
+
+        with self.lock:
+            cached = self.cache.get(key)
+            if cached and cached[0] == etag:
+                self.cache.move_to_end(key)
+                # A cached entry is a 200 for this version, so the client's copy is current
+                return (304, None, etag) if matches else (200, cached[1], etag)
+
+        try:
+            if path == "/jobs":
+                body = self.jobs(params)
+            elif path.startswith("/jobs/"):
+                body = self.job(path[len("/jobs/"):])
+                if body is None:
+                    return 404, json.dumps({"error": "job not found"}).encode(), None
+            elif path == "/scores":
+                body = self.scores(params)
+            elif path == "/packages":
+                body = self.packages(params)
+            elif path == "/runs":
+                body = self.runs(params)
+            elif path == "/health":
+                body = {"status": "ok"}
+            else:
+                return 404, json.dumps({"error": f"unknown endpoint {path}"}).encode(), None
+        except BadRequest as e:
+            return 400, json.dumps({"error": str(e)}).encode(), None
+
+        payload = json.dumps(body, separators=(",", ":")).encode()
+        with self.lock:
+            self.cache[key] = (etag, payload)
+            self.cache.move_to_end(key)
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        if matches:
+            return 304, None, etag
+        return 200, payload, etag
+
+
+def make_handler(api: JobAPI):
+    class Handler(BaseHTTPRequestHandler):
+        # Keep-alive, so polling clients reuse one connection; without
+        # TCP_NODELAY the body waits ~40ms for the headers' delayed ACK
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            status, payload, etag = api.handle(self.path, self.headers.get("If-None-Match"))
+            self.send_response(status)
+            if etag:
+                self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+            if payload is None:
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+    return Handler
+
+
+def serve(api: JobAPI, host: str = "127.0.0.1", port: int = 8765) -> None:
+    """Serve the API until interrupted."""
+    server = ThreadingHTTPServer((host, port), make_handler(api))
+    server.daemon_threads = True
+    print(f"🌐 Serving job API on http://{host}:{server.server_address[1]}/ (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,388 @@
+"""
+Archive Import Module - Streaming Backfill of Historical Results
+
+Imports old result dumps into the local job store without loading whole
+documents into memory:
+
+    pipeline_results_*.json    {"jobs_found": [...], "jobs_scored": [...], ...}
+    job_search_results.json    {"jobs": [...]} from search_plan.py
+    job_leads_top_8.json       [{"company", "role", "location", "url", "notes"}, ...]
+    job_search_detailed.json   [{"category", "title", "url", "description"}, ...]
+    search_results_ontario.json  raw Brave results
+
+Each file is read in chunks and the job arrays are decoded one element at
+a time. Worker processes parse files in parallel and hand normalized
+batches to the parent, which deduplicates by URL (the job store's key)
+and writes each batch to SQLite in one transaction. Records that cannot
+be normalized are counted and skipped; a file that cannot be parsed is
+reported and the rest of the import goes on.
+
+Usage:
+    python archive_import.py ../pipeline_results_*.json ../job_leads_top_8.json
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+import time
+from datetime import datetime
+from typing import List, Dict, Iterator, Optional
+
+from job_search import extract_source, extract_company, extract_location
+
+JOB_ARRAY_KEYS = ("jobs_found", "jobs_scored", "jobs")
+
+DEFAULT_PATTERNS = [
+    "pipeline_results_*.json", "job_search_results.json", "job_leads_top_8.json",
+    "job_search_detailed.json", "search_results_ontario.json"
+]
+
+NON_WHITESPACE = re.compile(r"\S")
+RUN_TIMESTAMP = re.compile(r"(\d{8})_(\d{6})")
+
+
+class JsonStream:
+    """Incremental reader that decodes a JSON document one value at a time."""
+
+    def __init__(self, f, chunk_size: int = 1 << 20):
+        """
+        Args:
+            f: Text file object
+            chunk_size: Characters read per refill
+        """
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _more(self) -> bool:
+        """Append the next chunk, dropping consumed text. False at end of file."""
+        if self.eof:
+            return False
+        # Read at least as much as is pending so one huge value costs linear time
+        chunk = self.f.read(max(self.chunk_size, len(self.buffer) - self.pos))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ('' at end of file)."""
+        while True:
+            match = NON_WHITESPACE.search(self.buffer, self.pos)
+            if match:
+                self.pos = match.start()
+                return self.buffer[self.pos]
+            self.pos = len(self.buffer)
+            if not self._more():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} but found {found!r}")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._more():
+                    raise
+                continue
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self.buffer) and self._more():
+                continue
+            self.pos = end
+            return value
+
+    def elements(self) -> Iterator:
+        """Yield the elements of the array starting at the current position."""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            separator = self.peek()
+            self.pos += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise ValueError(f"Expected ',' or ']' but found {separator!r}")
+
+    def records(self, keys=JOB_ARRAY_KEYS) -> Iterator[tuple]:
+        """
+        Yield (key, element) for a top-level array, or for the arrays under
+        `keys` of a top-level object. Other values are decoded and dropped.
+        """
+        start = self.peek()
+        if start == "[":
+            for element in self.elements():
+                yield None, element
+            return
+        self.expect("{")
+        if self.peek() == "}":
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            if key in keys and self.peek() == "[":
+                for element in self.elements():
+                    yield key, element
+            else:
+                self.value()
+            separator = self.peek()
+            self.pos += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                raise ValueError(f"Expected ',' or '}}' but found {separator!r}")
+
+
+def file_timestamp(path: str) -> str:
+    """Run time encoded in pipeline_results_YYYYMMDD_HHMMSS.json, else the file's mtime."""
+    match = RUN_TIMESTAMP.search(os.path.basename(path))
+    if match:
+        try:
+            return datetime.strptime("".join(match.groups()), "%Y%m%d%H%M%S").isoformat()
+        except ValueError:
+            pass
+    return datetime.fromtimestamp(os.path.getmtime(path)).isoformat(timespec='seconds')
+
+
+def _text(record: Dict, *keys: str) -> str:
+    """First non-empty string among record[key] (other types count as missing)."""
+    for key in keys:
+        value = record.get(key)
+        if isinstance(value, str) and value.strip():
+            return value
+    return ""
+
+
+def normalize_record(record: Dict) -> Optional[Dict]:
+    """
+    Map any archived record shape onto the pipeline job schema.
+
+    Returns:
+        Job dictionary, or None for records without a URL
+    """
+    if not isinstance(record, dict):
+        return None
+    url = _text(record, "url").strip()
+    if not url:
+        return None
+
+    title = _text(record, "title", "role")
+    description = _text(record, "description", "notes")
+    location = _text(record, "location")
+    # Re-derive free-form or missing locations ("Halifax, Nova Scotia") as gazetteer labels
+    label = extract_location(location or f"{title} | {description}")
+    score = record.get("match_score")
+
+    job = {
+        "title": title,
+        "url": url,
+        "description": description,
+        "source": _text(record, "source") or extract_source(url),
+        "location": location if label == "Canada" and location else label,
+        "company": _text(record, "company") or extract_company(title, url),
+        "match_score": score if isinstance(score, (int, float)) and not isinstance(score, bool) else None
+    }
+    if _text(record, "category"):
+        job["categories"] = [record["category"]]
+    return job
+
+
+def iter_batches(path: str, batch_size: int = 1000) -> Iterator[tuple]:
+    """
+    Stream a dump file as batches of normalized jobs.
+
+    Yields:
+        (jobs, failed) where failed counts the records in that stretch of
+        the file that could not be normalized
+    """
+    batch, failed = [], 0
+    with open(path, 'r', encoding='utf-8') as f:
+        for _, record in JsonStream(f).records():
+            try:
+                job = normalize_record(record)
+            except Exception:
+                failed += 1
+                continue
+            if job:
+                batch.append(job)
+                if len(batch) >= batch_size:
+                    yield batch, failed
+                    batch, failed = [], 0
+    if batch or failed:
+        yield batch, failed
+
+
+def _parse_file(path: str, batch_size: int) -> Iterator[tuple]:
+    """(path, seen_at, jobs, failed) per batch, or one (path, None, error, 0) if the file is unreadable."""
+    try:
+        seen_at = file_timestamp(path)
+        for batch, failed in iter_batches(path, batch_size):
+            yield path, seen_at, batch, failed
+    except Exception as e:
+        yield path, None, f"{type(e).__name__}: {e}", 0
+
+
+def _parse_worker(tasks, batches, batch_size: int) -> None:
+    """Worker process: parse files from `tasks` and send their batches; None when done."""
+    try:
+        while True:
+            path = tasks.get()
+            if path is None:
+                return
+            for item in _parse_file(path, batch_size):
+                batches.put(item)
+    finally:
+        # The parent counts sentinels, so one must arrive however this worker ends
+        batches.put(None)
+
+
+def _url_key(url: str) -> int:
+    # Same key as the job store's UNIQUE url column, so "unique jobs" means rows
+    return int.from_bytes(hashlib.blake2b(url.encode(), digest_size=8).digest(), "big")
+
+
+class Deduplicator:
+    """
+    Drops sightings that add nothing: the same job again on the same day,
+    unless the new copy carries a match score the first one lacked.
+
+    Keeps 8-byte URL digests rather than URLs, so memory stays small.
+    """
+
+    def __init__(self):
+        self.seen = {}
+
+    def fresh(self, jobs: List[Dict], seen_at: str) -> List[Dict]:
+        day = int(seen_at[:10].replace("-", ""))
+        fresh = []
+        for job in jobs:
+            key = _url_key(job["url"])
+            scored = job.get("match_score") is not None
+            previous = self.seen.get(key)
+            if previous is not None and previous >> 1 == day and (previous & 1 or not scored):
+                continue
+            self.seen[key] = (day << 1) | scored
+            fresh.append(job)
+        return fresh
+
+
+def import_archives(paths: List[str], store_path: str, workers: int = 4,
+                    batch_size: int = 1000) -> Dict:
+    """
+    Stream dump files into the job store.
+
+    Args:
+        paths: Dump files to import
+        store_path: SQLite job store
+        workers: Parser processes (1 parses in this process)
+        batch_size: Jobs per batch / transaction
+
+    Returns:
+        Stats dictionary (files, records, written, duplicates, unique_jobs, bad_records,
+        errors, seconds, records_per_second)
+    """
+    from job_store import JobStore
+
+    start = time.perf_counter()
+    stats = {"files": len(paths), "records": 0, "written": 0, "duplicates": 0, "bad_records": 0,
+             "errors": []}
+    dedup = Deduplicator()
+
+    def outcomes():
+        if workers <= 1 or len(paths) < 2:
+            for path in paths:
+                yield from _parse_file(path, batch_size)
+            return
+
+        context = multiprocessing.get_context("spawn")
+        tasks = context.Queue()
+        # Bounded so fast parsers cannot pile batches up in memory ahead of the writer
+        batches = context.Queue(maxsize=workers * 4)
+        count = min(workers, len(paths))
+        processes = [context.Process(target=_parse_worker, args=(tasks, batches, batch_size), daemon=True)
+                     for _ in range(count)]
+        for process in processes:
+            process.start()
+        for path in paths:
+            tasks.put(path)
+        for _ in processes:
+            tasks.put(None)
+
+        finished = 0
+        while finished < count:
+            item = batches.get()
+            if item is None:
+                finished += 1
+            else:
+                yield item
+        for process in processes:
+            process.join()
+
+    with JobStore(store_path) as store:
+        for path, seen_at, batch, failed in outcomes():
+            if seen_at is None:
+                stats["errors"].append(f"{path}: {batch}")
+                continue
+            stats["bad_records"] += failed
+            fresh = dedup.fresh(batch, seen_at)
+            stats["records"] += len(batch)
+            stats["duplicates"] += len(batch) - len(fresh)
+            if fresh:
+                stats["written"] += store.upsert_jobs(fresh, seen_at=seen_at)
+
+    stats["unique_jobs"] = len(dedup.seen)
+    stats["seconds"] = round(time.perf_counter() - start, 2)
+    stats["records_per_second"] = round(stats["records"] / stats["seconds"]) if stats["seconds"] else 0
+    return stats
+
+
+def default_paths(root: str = ".") -> List[str]:
+    """Dump files present under root, oldest run first."""
+    paths = []
+    for pattern in DEFAULT_PATTERNS:
+        paths.extend(sorted(glob.glob(os.path.join(root, pattern))))
+    return paths
+
+
+def main():
+    """Main entry point for CLI usage."""
+    parser = argparse.ArgumentParser(description="Stream historical result dumps into the job store")
+    parser.add_argument("paths", nargs="*", help="Dump files (default: known dumps in the current directory)")
+    parser.add_argument("--store", default="jobs.db", help="SQLite job store")
+    parser.add_argument("--workers", "-w", type=int, default=4, help="Parser processes")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Jobs per transaction")
+    args = parser.parse_args()
+
+    paths = args.paths or default_paths()
+    if not paths:
+        print("❌ No dump files found")
+        return
+
+    stats = import_archives(paths, args.store, workers=args.workers, batch_size=args.batch_size)
+    for error in stats["errors"]:
+        print(f"  ⚠️  Skipped {error}")
+    print(f"✅ {stats['records']} records from {stats['files']} file(s): {stats['written']} written, "
+          f"{stats['duplicates']} duplicates, {stats['bad_records']} unreadable "
+          f"({stats['records_per_second']}/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""
+Build Gazetteer - Compile data/canada_gazetteer.json from GeoNames
+
+Regenerates the place lists of the gazetteer from a GeoNames dump of
+populated places (cities500.txt, cities1000.txt or CA.txt from
+https://download.geonames.org/export/dump/) and keeps the curated
+sections of the existing file: provinces, communities, aliases, ambiguous
+names, homonyms, foreign places and work-mode phrases.
+
+    python scripts/build_gazetteer.py cities1000.txt
+
+Rules applied to the dump:
+    - Canadian rows of feature class P, except sections of cities (PPLX,
+      which are neighbourhoods such as "Downtown" or "Annex") and
+      historical, abandoned or destroyed places
+    - Names are the ASCII spelling ("Montreal", "Trois-Rivieres"); a name
+      equal to a province ("Quebec") is renamed (RENAMES) or dropped, so
+      the province keeps its meaning
+    - "largest" records the most populous province of a name shared by
+      several provinces
+    - Names whose largest place has fewer than --min-population residents
+      are added to "ambiguous": they only count when the province is also
+      in the text, since small-town names ("Hope", "Unity", "Outlook") are
+      ordinary words in job postings
+    - With a worldwide dump, names of foreign cities at least as populous
+      as the Canadian place (and over --foreign-population) are added to
+      "homonyms" ("Paris", "Perth"), so "Paris, France" is not Paris, ON
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from typing import Dict, List
+
+from gazetteer import DEFAULT_GAZETTEER, tokenize
+
+
+# GeoNames admin1 codes for Canada
+ADMIN1_PROVINCES = {
+    "01": "AB", "02": "BC", "03": "MB", "04": "NB", "05": "NL", "07": "NS", "08": "ON",
+    "09": "PE", "10": "QC", "11": "SK", "12": "YT", "13": "NT", "14": "NU",
+}
+
+# Populated-place feature codes that are not places in their own right
+SKIPPED_CODES = {"PPLX", "PPLH", "PPLQ", "PPLW", "PPLCH"}
+
+# GeoNames names that clash with a province name, as job postings write them
+RENAMES = {"Quebec": "Quebec City"}
+
+# Column positions in a GeoNames dump
+NAME, ASCII_NAME, FEATURE_CLASS, FEATURE_CODE, COUNTRY, ADMIN1, POPULATION = 1, 2, 6, 7, 8, 10, 14
+
+CURATED_KEYS = ["provinces", "communities", "aliases", "ambiguous", "homonyms", "foreign_places",
+                "foreign_codes", "remote_terms", "hybrid_terms", "work_mode_exclusions", "work_mode_negations"]
+
+COMMENT = (
+    "Canadian places for scripts/gazetteer.py, generated by scripts/build_gazetteer.py from the GeoNames "
+    "{source} dump (populated places, neighbourhoods excluded); do not edit 'places' or 'largest' by hand. "
+    "Places are listed per province, most populous first; a name listed under several provinces resolves "
+    "to the province in 'largest' unless the text names the province. 'communities' are curated places "
+    "the dump lacks or lists only as city sections (Kanata, Don Mills). Names in 'ambiguous' (every place under {floor:,} residents, "
+    "plus curated common words and surnames) only count when the province is also mentioned. Names in "
+    "'homonyms' (curated, plus every name of a foreign city over {foreign:,} residents and at least as large) "
+    "are shared with well-known places abroad; they resolve to the Canadian place when nothing "
+    "else is found, unless the text mentions a place in 'foreign_places' or the name is followed by one of "
+    "'foreign_codes' (\"London, UK\", \"Burlington, VT\")."
+)
+
+
+def read_places(path: str, foreign_population: int) -> tuple:
+    """
+    Populated places from a GeoNames dump.
+
+    Returns:
+        (Canadian places as {name, code, population}, {tokenized name: population}
+        of the largest foreign place with each name over foreign_population)
+    """
+    places, foreign = [], {}
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.reader(f, delimiter='\t', quoting=csv.QUOTE_NONE):
+            if len(row) <= POPULATION or row[FEATURE_CLASS] != "P" or row[FEATURE_CODE] in SKIPPED_CODES:
+                continue
+            name = (row[ASCII_NAME] or row[NAME]).strip()
+            population = int(row[POPULATION] or 0)
+            if row[COUNTRY] != "CA":
+                key = tuple(tokenize(name))
+                if population >= foreign_population and population > foreign.get(key, 0):
+                    foreign[key] = population
+            elif row[ADMIN1] in ADMIN1_PROVINCES:
+                places.append({"name": RENAMES.get(name, name), "code": ADMIN1_PROVINCES[row[ADMIN1]],
+                               "population": population})
+    return places, foreign
+
+
+def build(places: List[Dict], foreign: Dict, curated: Dict, min_population: int, foreign_population: int,
+          source: str) -> Dict:
+    """
+    Gazetteer data from GeoNames places plus the curated sections.
+
+    Args:
+        places: Canadian places (see read_places)
+        foreign: Populations of large foreign places by tokenized name
+        curated: Existing gazetteer data
+        min_population: Floor for matching a place without its province
+        foreign_population: Floor used when reading foreign places
+        source: Dump file name recorded in the comment
+
+    Returns:
+        Dictionary in the data/canada_gazetteer.json layout
+    """
+    reserved = set()
+    for province in curated["provinces"].values():
+        for name in [province["name"]] + province.get("aliases", []):
+            reserved.add(tuple(tokenize(name)))
+
+    by_code = {code: {} for code in curated["provinces"]}
+    for place in sorted(places, key=lambda p: -p["population"]):
+        if not tokenize(place["name"]) or tuple(tokenize(place["name"])) in reserved:
+            continue
+        by_code[place["code"]].setdefault(place["name"], place["population"])
+
+    # Curated communities only fill in what the dump lacks
+    communities = {}
+    for code, names in curated.get("communities", {}).items():
+        missing = [name for name in names if name not in by_code[code]]
+        if missing:
+            communities[code] = missing
+
+    populations = {}
+    for code, names in by_code.items():
+        for name, population in names.items():
+            populations.setdefault(name, {})[code] = population
+
+    largest = {name: max(codes, key=codes.get) for name, codes in sorted(populations.items()) if len(codes) > 1}
+    small = {name for name, codes in populations.items() if max(codes.values()) < min_population}
+    # Small places stay ambiguous even when they share a name abroad ("Delhi, ON")
+    found_abroad = {name for name, codes in populations.items()
+                    if foreign.get(tuple(tokenize(name)), 0) >= max(codes.values())} - small
+    homonyms = list(curated.get("homonyms", []))
+    homonyms += sorted(found_abroad - set(homonyms) - set(curated.get("ambiguous", [])))
+    ambiguous = list(curated.get("ambiguous", []))
+    ambiguous += sorted(small - set(homonyms) - set(ambiguous))
+
+    data = {"_comment": COMMENT.format(source=source, floor=min_population, foreign=foreign_population),
+            "provinces": curated["provinces"],
+            "places": {code: list(names) for code, names in by_code.items()}}
+    data["communities"] = communities
+    data["aliases"] = curated.get("aliases", {})
+    data["largest"] = largest
+    data["ambiguous"] = ambiguous
+    data["homonyms"] = homonyms
+    for key in CURATED_KEYS[5:]:
+        data[key] = curated.get(key, [])
+    return data
+
+
+def dump(data: Dict) -> str:
+    """JSON in the gazetteer's layout: one line per list, one line per province entry."""
+    lines = ["{"]
+    items = list(data.items())
+    for i, (key, value) in enumerate(items):
+        comma = "," if i < len(items) - 1 else ""
+        if isinstance(value, dict) and key == "provinces":
+            lines.append(f"  {json.dumps(key)}: {{")
+            entries = list(value.items())
+            for j, (code, province) in enumerate(entries):
+                fields = [f"      {json.dumps(k)}: {json.dumps(v, ensure_ascii=False)}" for k, v in province.items()]
+                lines.append(f"    {json.dumps(code)}: {{")
+                lines.append(",\n".join(fields))
+                lines.append("    }" + ("," if j < len(entries) - 1 else ""))
+            lines.append("  }" + comma)
+        elif isinstance(value, dict) and key != "largest":
+            lines.append(f"  {json.dumps(key)}: {{")
+            entries = [f"    {json.dumps(k)}: {json.dumps(v, ensure_ascii=False)}" for k, v in value.items()]
+            lines.append(",\n".join(entries))
+            lines.append("  }" + comma)
+        else:
+            lines.append(f"  {json.dumps(key)}: {json.dumps(value, ensure_ascii=False)}{comma}")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    """Main entry point for CLI usage."""
+    parser = argparse.ArgumentParser(description="Compile the Canadian gazetteer from a GeoNames dump")
+    parser.add_argument("dump", help="GeoNames cities500.txt, cities1000.txt or CA.txt")
+    parser.add_argument("--output", "-o", default=DEFAULT_GAZETTEER,
+                        help="Gazetteer file; its curated sections are kept (default: data/canada_gazetteer.json)")
+    parser.add_argument("--min-population", type=int, default=5000,
+                        help="Places below this only count with the province in the text")
+    parser.add_argument("--foreign-population", type=int, default=100000,
+                        help="Foreign cities this large make a shared Canadian name a homonym")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.dump):
+        print(f"❌ GeoNames dump not found: {args.dump}")
+        sys.exit(1)
+
+    curated = {}
+    if os.path.exists(args.output):
+        with open(args.output, 'r', encoding='utf-8') as f:
+            curated = json.load(f)
+
+    places, foreign = read_places(args.dump, args.foreign_population)
+    data = build(places, foreign, curated, args.min_population, args.foreign_population,
+                 os.path.basename(args.dump))
+    with open(args.output, 'w', encoding='utf-8') as f:
+        f.write(dump(data))
+
+    counts = {code: len(names) for code, names in data["places"].items()}
+    print(f"✅ {sum(counts.values())} places from {len(places)} GeoNames rows → {args.output}")
+    print("  " + ", ".join(f"{code} {count}" for code, count in counts.items()))
+
+
+if __name__ == "__main__":
+    main()
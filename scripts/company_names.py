@@ -0,0 +1,215 @@
+"""
+Company Names Module - Company Name Extraction and Normalization
+
+Turns the company a search result names, however it is spelled, into
+one canonical name, so "RBC", "RBC Royal Bank" and "Royal Bank of Canada
+Ltd." dedupe together, group together in Notion and read properly in a
+cover letter:
+
+    >>> extract_company("Data Analyst - RBC - Toronto, ON - Indeed.com", "https://ca.indeed.com/viewjob?jk=1")
+    'Royal Bank of Canada'
+
+Sources, in order: the result title ("X at Company", "Company hiring X",
+"X - Company - City"), a LinkedIn posting slug ("...-at-company-123"),
+then the posting's own domain when it is a careers site rather than a
+job board. Names are mapped through the alias table in
+data/company_aliases.json after the same normalization the email
+correlation uses (case, punctuation, leading "The", trailing Inc./Ltd.).
+
+Companies missing from the table keep their own spelling minus legal
+forms ("Acme Analytics Inc." → "Acme Analytics"), so the result depends
+only on the name, never on what else a process has seen. Title parses
+and canonical names are kept in LRU caches and domain lookups are
+memoized per host, since a sweep sees the same titles and job-board
+hosts over and over.
+"""
+
+import json
+import os
+import re
+from functools import lru_cache
+from typing import Optional
+from urllib.parse import urlsplit
+
+from normalize import GENERIC_DOMAINS, UNKNOWN_COMPANY, company_key, domain_stem
+
+
+DEFAULT_ALIASES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data",
+                               "company_aliases.json")
+
+# Job boards and aggregators whose domain says nothing about the employer
+JOB_BOARDS = GENERIC_DOMAINS | {
+    "talent", "jooble", "monster", "simplyhired", "eluta", "careerbeacon", "jobillico", "neuvoo",
+    "wowjobs", "builtin", "wellfound", "dice", "remoteok", "weworkremotely", "careerjet", "adzuna",
+    "google", "bing", "facebook", "reddit",
+}
+
+# " - Indeed.com", " | LinkedIn" and similar board names trailing a result title
+BOARD_SUFFIX = re.compile(
+    r"\s*[-|–—]\s*(?:indeed(?:\.com)?|linkedin|glassdoor|ziprecruiter|workopolis|job ?bank(?: canada)?|"
+    r"monster(?:\.ca)?|simplyhired|eluta(?:\.ca)?|talent\.com|careerbeacon)\b.*$",
+    re.IGNORECASE
+)
+TITLE_SEPARATOR = re.compile(r"\s+[-|–—]\s+")
+HIRING = re.compile(r"^(.+?)\s+(?:is\s+|are\s+)?(?:now\s+|urgently\s+|actively\s+)?hiring\b", re.IGNORECASE)
+
+# "Now hiring", "We are hiring", "Urgently hiring": words before "hiring" that are not an employer
+NOT_EMPLOYER_WORDS = {"now", "we", "we're", "were", "i", "i'm", "they", "they're", "you", "our", "us", "is", "are",
+                      "am", "urgently", "immediately", "actively", "currently", "still", "also", "always", "who",
+                      "who's", "job", "jobs", "hiring", "help", "wanted"}
+LINKEDIN_SLUG = re.compile(r"-at-([a-z0-9-]+?)(?:-\d+)?/?$")
+
+# Words that mark a title segment as the role rather than the employer
+ROLE_WORDS = {"analyst", "analysts", "engineer", "developer", "scientist", "manager", "specialist",
+              "coordinator", "associate", "intern", "internship", "consultant", "administrator",
+              "officer", "architect", "technician", "assistant", "lead", "director", "jobs", "job",
+              "co-op", "coop", "student", "advisor", "representative", "clerk", "designer"}
+
+# Words that mark a segment as part of the page rather than a name ("Careers", "Job Openings")
+PAGE_WORDS = {"careers", "career", "home", "apply", "opportunities", "openings", "vacancies", "search",
+              "postings", "posting"}
+
+# A segment like "Toronto, ON", "Remote" or "Halifax, Nova Scotia" is a location, not a company
+LOCATION_SEGMENT = re.compile(
+    r",\s*(?:[A-Z]{2}|Canada|Nova Scotia|Ontario|Quebec|Alberta|British Columbia|Manitoba|"
+    r"Saskatchewan|New Brunswick|Newfoundland(?: and Labrador)?|Prince Edward Island)\b|"
+    r"^(?:remote|hybrid|canada|on-site|onsite)\b",
+    re.IGNORECASE
+)
+
+
+def _is_role(segment: str) -> bool:
+    return any(word in ROLE_WORDS for word in segment.lower().split())
+
+
+def _is_page(segment: str) -> bool:
+    return any(word in PAGE_WORDS for word in segment.lower().split())
+
+
+def _is_employer(name: str) -> bool:
+    """False for phrases like "We are" or "Now" that precede "hiring" in ads."""
+    words = re.findall(r"[a-z']+", name.lower())
+    return bool(words) and not all(word in NOT_EMPLOYER_WORDS for word in words)
+
+
+# Legal forms dropped from displayed names ("Acme Analytics Inc." → "Acme Analytics")
+LEGAL_SUFFIX = re.compile(r"(?:,?\s+(?:inc|ltd|llc|llp|plc|corp|corporation|limited|incorporated|lt[ée]e)\.?)+$",
+                          re.IGNORECASE)
+
+
+def _tidy(name: str) -> str:
+    """Trim whitespace, stray punctuation and legal forms; title-case URL slugs and all-lowercase names."""
+    name = " ".join(name.split()).strip(" -|,:;–—()")
+    name = LEGAL_SUFFIX.sub("", name).strip(" ,.")
+    if name and name == name.lower():
+        name = name.title()
+    return name
+
+
+class CompanyNormalizer:
+    """Alias table plus the caches used to extract and normalize company names."""
+
+    def __init__(self, aliases_path: str = DEFAULT_ALIASES, cache_size: int = 65536):
+        """
+        Args:
+            aliases_path: JSON alias table (canonical name → aliases and domains)
+            cache_size: Title parses kept in the LRU cache
+        """
+        with open(aliases_path, 'r', encoding='utf-8') as f:
+            companies = json.load(f)["companies"]
+
+        self.by_key = {}
+        self.by_domain = {}
+        for canonical, entry in companies.items():
+            for name in [canonical] + entry.get("aliases", []):
+                self.by_key[company_key(name)] = canonical
+            for domain in entry.get("domains", []):
+                self.by_domain[domain_stem(domain)] = canonical
+        self.domains = {}
+        self.canonical = lru_cache(maxsize=cache_size)(self._canonical)
+        self.title_company = lru_cache(maxsize=cache_size)(self._title_company)
+
+    def _canonical(self, name: str) -> str:
+        """Canonical form of a company name ("" for an empty name)."""
+        name = _tidy(name or "")
+        if not name or name == UNKNOWN_COMPANY:
+            return name
+        return self.by_key.get(company_key(name), name)
+
+    @staticmethod
+    def _title_company(title: str) -> str:
+        """Company named in a search result title, or ""."""
+        title = BOARD_SUFFIX.sub("", title).strip()
+        match = HIRING.match(title)
+        if match and _is_employer(match.group(1)):
+            return match.group(1)
+        if " at " in title:
+            company = title.split(" at ")[-1]
+            company = TITLE_SEPARATOR.split(company)[0].split(" (")[0].split(",")[0]
+            # "Work at Home Data Analyst": what follows "at" is the role, not an employer
+            if not _is_role(company):
+                return company
+
+        segments = TITLE_SEPARATOR.split(title)
+        if len(segments) < 2:
+            return ""
+        first, second = segments[0], segments[1]
+        if (_is_role(second) or _is_page(second)) and not (_is_role(first) or _is_page(first)):
+            return first
+        if LOCATION_SEGMENT.search(second) or _is_role(second) or _is_page(second):
+            return ""
+        return second
+
+    def domain_company(self, url: str) -> Optional[str]:
+        """
+        Employer behind a posting's host, memoized per host.
+
+        Returns:
+            Canonical name for known domains, the domain label for other
+            careers sites, or None for job boards
+        """
+        host = urlsplit(url).netloc.lower()
+        if host in self.domains:
+            return self.domains[host]
+        stem = domain_stem(host) if host else ""
+        if not stem or stem in JOB_BOARDS:
+            company = None
+        else:
+            company = self.by_domain.get(stem) or _tidy(stem.replace("-", " "))
+        self.domains[host] = company
+        return company
+
+    def extract(self, title: str, url: str = "") -> str:
+        """
+        Canonical company name for a search result.
+
+        Args:
+            title: Result title
+            url: Posting URL
+
+        Returns:
+            Company name, or "Unknown Company"
+        """
+        company = self.title_company(title or "")
+        if not company and "linkedin.com/jobs/view/" in url:
+            match = LINKEDIN_SLUG.search(url.split("?")[0])
+            company = match.group(1).replace("-", " ") if match else ""
+        if not company and url:
+            company = self.domain_company(url) or ""
+        return self.canonical(company) or UNKNOWN_COMPANY
+
+
+@lru_cache(maxsize=None)
+def load_normalizer(aliases_path: str = DEFAULT_ALIASES) -> CompanyNormalizer:
+    """Build the normalizer once per process."""
+    return CompanyNormalizer(aliases_path)
+
+
+def extract_company(title: str, url: str = "") -> str:
+    """Canonical company name from a result title and URL (see CompanyNormalizer.extract)."""
+    return load_normalizer().extract(title, url)
+
+
+def normalize_company(name: str) -> str:
+    """Canonical form of a company name: "RBC Royal Bank" → "Royal Bank of Canada"."""
+    return load_normalizer().canonical(name or "")
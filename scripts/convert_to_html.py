@@ -1,16 +1,26 @@
-from markdown import markdown
-import os
+"""
+Markdown to HTML Converter - Batch Conversion of Application Documents
+
+Discovers every .md file under a configured root (e.g. hand-edited resumes
+and cover letters in each application folder), converts only the files
+whose content changed since the last run, and spreads the work across a
+process pool with one configured Markdown instance per worker.
+
+Usage:
+    python convert_to_html.py --root ../applications
+    python convert_to_html.py --config ../config.json --force
+"""
 
-# Define the applications
-applications = [
-    ("01_Altus_Group", "Resume_Altus_Group.md", "Cover_Letter_Altus_Group.md"),
-    ("02_RBC_Analyst_Program", "Resume_RBC.md", "Cover_Letter_RBC.md"),
-    ("03_CGI_Entry_Level_Analyst", "Resume_CGI.md", "Cover_Letter_CGI.md"),
-    ("04_NS_Government_Data_Analyst", "Resume_NS_Gov.md", "Cover_Letter_NS_Gov.md"),
-    ("05_TD_Bank_Data_Analyst", "Resume_TD.md", "Cover_Letter_TD.md"),
-]
+import argparse
+import glob
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Optional, Tuple
 
-base_path = "C:/Users/vrajb/Documents/MAYAI-Knowledge/Career/Applications"
+MANIFEST_NAME = ".html_manifest.json"
 
 html_template = """<!DOCTYPE html>
 <html>
@@ -61,34 +71,198 @@ html_template = """<!DOCTYPE html>
 </body>
 </html>"""
 
-for folder, resume, cover in applications:
-    folder_path = os.path.join(base_path, folder)
-    
-    # Convert Resume
-    resume_path = os.path.join(folder_path, resume)
-    if os.path.exists(resume_path):
-        with open(resume_path, 'r', encoding='utf-8') as f:
-            md_content = f.read()
-        html_content = markdown(md_content, extensions=['extra'])
-        full_html = html_template.format(content=html_content)
-        
-        output_html = os.path.join(folder_path, resume.replace('.md', '.html'))
-        with open(output_html, 'w', encoding='utf-8') as f:
-            f.write(full_html)
-        print(f"Created: {output_html}")
-    
-    # Convert Cover Letter
-    cover_path = os.path.join(folder_path, cover)
-    if os.path.exists(cover_path):
-        with open(cover_path, 'r', encoding='utf-8') as f:
-            md_content = f.read()
-        html_content = markdown(md_content, extensions=['extra'])
-        full_html = html_template.format(content=html_content)
-        
-        output_html = os.path.join(folder_path, cover.replace('.md', '.html'))
-        with open(output_html, 'w', encoding='utf-8') as f:
-            f.write(full_html)
-        print(f"Created: {output_html}")
-
-print("\nAll HTML files created successfully!")
-print("To convert to PDF, open HTML files in Chrome and print to PDF, or use a PDF converter.")
+# One Markdown instance per worker process, created by _init_worker
+_markdown = None
+
+
+def _init_worker():
+    """Build the worker's Markdown converter once instead of per file."""
+    global _markdown
+    from markdown import Markdown
+    _markdown = Markdown(extensions=['extra'])
+
+
+def _markdown_importable() -> bool:
+    """
+    Whether Markdown imports here. Without it the pool's initializer fails
+    and breaks the pool; in-process conversion reports that per file instead.
+    """
+    try:
+        import markdown  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _file_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def convert_file(md_path: str) -> Tuple[str, str]:
+    """
+    Convert one Markdown file to a styled HTML file next to it.
+
+    Args:
+        md_path: Path to the .md file
+
+    Returns:
+        Tuple of (md_path, sha256 of the source)
+    """
+    if _markdown is None:
+        _init_worker()
+
+    with open(md_path, 'rb') as f:
+        source = f.read()
+
+    html_content = _markdown.reset().convert(source.decode('utf-8'))
+    full_html = html_template.format(content=html_content)
+
+    output_html = os.path.splitext(md_path)[0] + ".html"
+    with open(output_html, 'w', encoding='utf-8') as f:
+        f.write(full_html)
+
+    return md_path, _file_hash(source)
+
+
+def _convert_safely(md_path: str) -> Tuple[str, Optional[str], Optional[str]]:
+    """
+    convert_file that reports failures instead of raising, so one bad file
+    (undecodable, unreadable) cannot abort the rest of the batch.
+
+    Returns:
+        Tuple of (md_path, sha256 or None, error or None)
+    """
+    try:
+        return (*convert_file(md_path), None)
+    except Exception as e:
+        return md_path, None, f"{type(e).__name__}: {e}"
+
+
+def load_manifest(root: str) -> Dict[str, Dict]:
+    """Load the record of previously converted sources."""
+    try:
+        with open(os.path.join(root, MANIFEST_NAME), 'r') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def save_manifest(root: str, manifest: Dict[str, Dict]) -> None:
+    """Write the manifest atomically."""
+    path = os.path.join(root, MANIFEST_NAME)
+    with open(f"{path}.tmp", 'w') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(f"{path}.tmp", path)
+
+
+def find_stale(root: str, manifest: Dict[str, Dict], force: bool = False) -> List[str]:
+    """
+    Return .md files that are new or changed since their last conversion.
+
+    The mtime/size check is free; a file is only hashed when its stat
+    changed, so touched-but-unchanged files are not reconverted.
+
+    Args:
+        root: Directory to scan recursively
+        manifest: Previous conversion records
+        force: Treat every file as stale
+
+    Returns:
+        List of Markdown paths to convert
+    """
+    stale = []
+    for md_path in glob.glob(os.path.join(root, "**", "*.md"), recursive=True):
+        key = os.path.relpath(md_path, root)
+        html_path = os.path.splitext(md_path)[0] + ".html"
+        record = manifest.get(key)
+        if force or not record or not os.path.exists(html_path):
+            stale.append(md_path)
+            continue
+
+        stat = os.stat(md_path)
+        if record.get("mtime") == stat.st_mtime and record.get("size") == stat.st_size:
+            continue
+
+        with open(md_path, 'rb') as f:
+            if _file_hash(f.read()) != record.get("sha256"):
+                stale.append(md_path)
+            else:
+                record.update(mtime=stat.st_mtime, size=stat.st_size)
+
+    return sorted(stale)
+
+
+def convert_tree(root: str, workers: Optional[int] = None, force: bool = False) -> Dict:
+    """
+    Convert all new or changed Markdown files under root.
+
+    Args:
+        root: Directory to scan recursively
+        workers: Process pool size (default: CPU count); 1 converts in-process
+        force: Reconvert every file
+
+    Returns:
+        Stats dictionary with converted, skipped, failed ("path: error" per
+        file left unconverted, retried next run) and seconds
+    """
+    start = time.perf_counter()
+    manifest = load_manifest(root)
+    total = len(glob.glob(os.path.join(root, "**", "*.md"), recursive=True))
+    stale = find_stale(root, manifest, force=force)
+
+    outcomes = []
+    try:
+        if workers == 1 or len(stale) < 2 or not _markdown_importable():
+            outcomes.extend(_convert_safely(md_path) for md_path in stale)
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+                outcomes.extend(executor.map(_convert_safely, stale, chunksize=16))
+    finally:
+        # Record whatever finished, even if the pool itself broke
+        for md_path, digest, _ in outcomes:
+            if digest is None:
+                continue
+            stat = os.stat(md_path)
+            manifest[os.path.relpath(md_path, root)] = {
+                "mtime": stat.st_mtime, "size": stat.st_size, "sha256": digest
+            }
+        save_manifest(root, manifest)
+
+    return {
+        "converted": sum(1 for _, digest, _ in outcomes if digest is not None),
+        "skipped": total - len(stale),
+        "failed": [f"{md_path}: {error}" for md_path, _, error in outcomes if error],
+        "seconds": round(time.perf_counter() - start, 3)
+    }
+
+
+def main():
+    """Main entry point for CLI usage."""
+    parser = argparse.ArgumentParser(description="Convert Markdown application documents to HTML")
+    parser.add_argument("--config", "-c", help="Path to configuration file (default: $PIPELINE_CONFIG or config.json)")
+    parser.add_argument("--root", help="Directory to scan (default: output_dir from config)")
+    parser.add_argument("--workers", "-w", type=int, help="Number of worker processes")
+    parser.add_argument("--force", action="store_true", help="Reconvert every file")
+    args = parser.parse_args()
+
+    from settings import load_config
+    config = load_config(args.config)
+    settings = config.get("markdown_conversion", {})
+
+    root = args.root or settings.get("root") or config.get("output_dir", "applications")
+    workers = args.workers or settings.get("workers")
+
+    if not os.path.isdir(root):
+        print(f"❌ Directory not found: {root}")
+        return
+
+    stats = convert_tree(root, workers=workers, force=args.force)
+    for failure in stats["failed"]:
+        print(f"  ⚠️  Skipped {failure}")
+    print(f"✅ Converted {stats['converted']} file(s), {stats['skipped']} unchanged "
+          f"({stats['seconds']}s)")
+    print("To create PDFs, run: python pipeline.py --pdf")
+
+
+if __name__ == "__main__":
+    main()
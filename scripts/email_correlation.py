@@ -0,0 +1,268 @@
+"""
+Email Correlation Module - Linking Recruiter Emails to Stored Jobs
+
+Builds an in-memory index of stored jobs keyed by normalized company name,
+company email domain and role tokens, then matches each incoming email
+with a few dictionary lookups and one pass over its text:
+
+    1. Sender domain ("careers.rbc.com" → "rbc") against company domains
+       and acronyms, unless the domain is a mail provider, ATS or job
+       board; for ATS senders, the address's local part
+       ("cooperators@myworkday.com")
+    2. Company names found in the sender's display name and subject, and
+       in the body only when the sender is the employer's own or unknown
+       domain (word-trie longest match, so "CGI" does not fire inside
+       "CGI Federal")
+    3. Role-token overlap with the subject/body to pick between several
+       jobs at the same company
+
+Job alerts, newsletters and other bulk mail are never matched, and job
+boards can only confirm or reject an application, never report an
+interview or offer: their mail names companies that are hiring, not ones
+that replied. The email's status (interview invite, rejection, offer,
+application received) is then applied to the matched job in the job
+store; changes are flagged so the next Notion sync pushes them.
+"""
+
+import re
+from datetime import datetime
+from typing import List, Dict, Optional
+
+from gazetteer import tokenize
+from normalize import (ATS_DOMAINS, EMAIL_ADDRESS, GENERIC_DOMAINS, JOB_BOARDS, MAIL_PROVIDERS, UNKNOWN_KEY,
+                       company_key, domain_stem)
+
+
+# Newsletter and mailing-list senders, and the address words that mark bulk mail ("jobalerts-noreply@")
+BULK_DOMAINS = {"medium", "substack", "beehiiv", "mailchimp", "mcsv", "sendgrid", "hubspotemail", "convertkit",
+                "mailerlite", "quora", "reddit"}
+BULK_WORDS = {"alert", "alerts", "jobalert", "jobalerts", "newsletter", "newsletters", "digest", "news",
+              "marketing", "promo", "promotions", "community"}
+
+# Statuses a job board's own mail may set: its alerts and tips mention interviews and offers in passing
+BOARD_STATUSES = {"Applied", "Rejected"}
+
+# Words ignored when building acronyms and role tokens
+MINOR_WORDS = {"of", "and", "the", "for", "a", "an", "at", "in", "de", "du", "des", "la", "le", "et", "to"}
+
+# Checked in order: a rejection that mentions the interview is still a rejection
+STATUS_PHRASES = [
+    ("Offer", ["pleased to offer", "offer of employment", "offer letter", "job offer", "extend an offer"]),
+    ("Rejected", ["unfortunately", "not moving forward", "not be moving forward", "other candidates",
+                  "regret to inform", "position has been filled", "decided to pursue", "not selected",
+                  "will not be proceeding", "not to proceed"]),
+    ("Interview", ["interview", "phone screen", "schedule a call", "your availability", "meet with",
+                   "next steps in the process", "assessment"]),
+    ("Applied", ["thank you for applying", "application received", "received your application",
+                 "thanks for applying", "application has been submitted", "application was sent"]),
+]
+
+# A status only replaces one of lower rank, so a late "application received" cannot undo an interview
+STATUS_RANK = {"Not Applied": 0, "Applied": 1, "Interview": 2, "Offer": 3, "Rejected": 3}
+
+BODY_CHARS = 2000
+
+
+def sender_kind(sender: str, bulk: bool = False) -> str:
+    """
+    Who sent an email, judged from the From header.
+
+    Args:
+        sender: From header ("RBC Talent <talent@rbc.com>")
+        bulk: The message carried mailing-list headers (List-Unsubscribe, Precedence: bulk)
+
+    Returns:
+        "bulk", "board", "ats", "mail" (personal mail provider) or "other"
+    """
+    match = EMAIL_ADDRESS.search(sender)
+    local = sender[:match.start(1)].rsplit("<", 1)[-1].lower() if match else ""
+    stem = domain_stem(sender) if match else ""
+    if bulk or stem in BULK_DOMAINS or any(word in BULK_WORDS for word in re.split(r"[^a-z]+", local)):
+        return "bulk"
+    if stem in JOB_BOARDS:
+        return "board"
+    if stem in ATS_DOMAINS:
+        return "ats"
+    if stem in MAIL_PROVIDERS:
+        return "mail"
+    return "other"
+
+
+def classify_status(subject: str, body: str) -> Optional[str]:
+    """Application status implied by an email, or None."""
+    content = f"{subject} {body[:BODY_CHARS]}".lower()
+    for status, phrases in STATUS_PHRASES:
+        if any(phrase in content for phrase in phrases):
+            return status
+    return None
+
+
+class CorrelationIndex:
+    """Lookup structures over stored jobs for matching emails."""
+
+    def __init__(self, jobs: List[Dict]):
+        """
+        Args:
+            jobs: Stored jobs (url, title, company, status), most recent first
+        """
+        self.jobs = jobs
+        self.by_company = {}
+        self.by_stem = {}
+        self.trie = {}
+        self.role_tokens = []
+
+        for i, job in enumerate(jobs):
+            key = company_key(job.get("company") or "")
+            tokens = key.split()
+            self.role_tokens.append({t for t in tokenize(job.get("title") or "") if t not in MINOR_WORDS})
+            if not key or key == UNKNOWN_KEY:
+                continue
+
+            self.by_company.setdefault(key, []).append(i)
+            stems = {key.replace(" ", "")}
+            significant = [t for t in tokens if t not in MINOR_WORDS]
+            if len(significant) >= 2:
+                stems.add("".join(t[0] for t in significant))
+            url_stem = domain_stem(re.sub(r"^\w+://", "", job.get("url") or "").split("/")[0])
+            if url_stem and url_stem not in GENERIC_DOMAINS:
+                stems.add(url_stem)
+            for stem in stems:
+                self.by_stem.setdefault(stem, []).append(i)
+
+            node = self.trie
+            for token in tokens:
+                node = node.setdefault(token, {})
+            node[None] = key
+
+    def _companies_in(self, tokens: List[str]) -> List[str]:
+        """Company keys mentioned in tokens (non-overlapping longest matches)."""
+        found = []
+        position, count = 0, len(tokens)
+        while position < count:
+            node = self.trie.get(tokens[position])
+            best, end = None, position + 1
+            scan = position + 1
+            while node is not None:
+                if None in node:
+                    best, end = node[None], scan
+                if scan >= count:
+                    break
+                node = node.get(tokens[scan])
+                scan += 1
+            if best:
+                found.append(best)
+                position = end
+            else:
+                position += 1
+        return found
+
+    def match(self, sender: str, subject: str, body: str, bulk: bool = False) -> Optional[Dict]:
+        """
+        Find the stored job an email is about.
+
+        Args:
+            sender: From header ("RBC Talent <talent@rbc.com>")
+            subject: Subject line
+            body: Plain-text body
+            bulk: The message carried mailing-list headers
+
+        Returns:
+            {"job", "method", "sender"} or None when no stored company
+            matches or the email is bulk mail
+        """
+        kind = sender_kind(sender, bulk)
+        if kind == "bulk":
+            return None
+
+        candidates = []
+        method = None
+        address = EMAIL_ADDRESS.search(sender)
+        if address:
+            stem = domain_stem(sender)
+            if kind == "ats":
+                # "cooperators@myworkday.com": the tenant name stands in for the domain
+                stem = re.sub(r"[^a-z0-9]", "", sender[:address.start(1)].rsplit("<", 1)[-1].lower())
+            if kind in ("ats", "other") and stem in self.by_stem:
+                candidates = self.by_stem[stem]
+                method = "domain"
+
+        header_tokens = tokenize(f"{sender.split('<')[0]} | {subject}")
+        body_tokens = tokenize(body[:BODY_CHARS])
+        if not candidates:
+            # Boards, ATS and mail providers quote other companies in their bodies
+            # (alerts, "similar jobs"); only the employer's own mail is read in full
+            searched = header_tokens + ["|"] + body_tokens if kind == "other" else header_tokens
+            for key in self._companies_in(searched):
+                candidates = self.by_company[key]
+                method = "company"
+                break
+        if not candidates:
+            return None
+
+        best = candidates[0]
+        if len(candidates) > 1:
+            words = set(header_tokens) | set(body_tokens)
+            # Most role words in common wins; ties keep the most recently seen job
+            best = max(candidates, key=lambda i: len(self.role_tokens[i] & words))
+            method += "+role"
+        return {"job": self.jobs[best], "method": method, "sender": kind}
+
+
+def correlate(emails: List[Dict], index: CorrelationIndex) -> List[Dict]:
+    """
+    Match emails to jobs and work out status changes.
+
+    Args:
+        emails: Dictionaries with sender, subject, body and optional date (ISO)
+            and bulk (mailing-list headers present)
+        index: Index over stored jobs
+
+    Returns:
+        Status updates: {"url", "status", "previous", "when", "subject", "method"}
+    """
+    updates = {}
+    for email in emails:
+        status = classify_status(email.get("subject", ""), email.get("body", ""))
+        if not status:
+            continue
+        matched = index.match(email.get("sender", ""), email.get("subject", ""), email.get("body", ""),
+                              bulk=email.get("bulk", False))
+        if not matched:
+            continue
+        if matched["sender"] == "board" and status not in BOARD_STATUSES:
+            continue
+
+        job = matched["job"]
+        current = updates.get(job["url"], {}).get("status") or job.get("status") or "Not Applied"
+        if STATUS_RANK[status] <= STATUS_RANK.get(current, 0):
+            continue
+        updates[job["url"]] = {
+            "url": job["url"],
+            "status": status,
+            "previous": job.get("status") or "Not Applied",
+            "when": email.get("date") or datetime.now().isoformat(timespec='seconds'),
+            "subject": email.get("subject", ""),
+            "method": matched["method"]
+        }
+    return list(updates.values())
+
+
+def correlate_with_store(emails: List[Dict], store_path: str, days: int = 180) -> List[Dict]:
+    """
+    Match emails against the job store and record status changes there.
+
+    Args:
+        emails: See correlate()
+        store_path: SQLite job store
+        days: Only consider jobs seen within this many days
+
+    Returns:
+        Applied status updates
+    """
+    from job_store import JobStore
+
+    with JobStore(store_path) as store:
+        index = CorrelationIndex(store.recent_jobs(days))
+        updates = correlate(emails, index)
+        store.set_local_statuses(updates)
+    return updates
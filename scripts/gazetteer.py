@@ -0,0 +1,324 @@
+"""
+Gazetteer Module - Canadian Location Extraction
+
+Finds the job location in free text using a gazetteer of Canadian
+municipalities and provinces (data/canada_gazetteer.json). All names are
+compiled into a word-level trie, so one left-to-right pass over the
+tokens finds every place with longest-match semantics ("North Vancouver"
+beats "Vancouver", "remote sensing" beats "remote"). Remote and hybrid
+work arrangements are detected in the same pass, and negated ones
+("not remote", "remote work is not available") are not.
+
+Province abbreviations only confirm a place when written as codes
+("Kingston, ON", not "Kingston on the lake"). Names shared with places
+abroad resolve to the Canadian place unless the text puts them abroad
+("London, UK", "Burlington, VT", or another country named in the text).
+
+    >>> extract_location("Hybrid role based in Dartmouth, NS")
+    'Dartmouth, NS (Hybrid)'
+"""
+
+import json
+import os
+import re
+import unicodedata
+from functools import lru_cache
+from typing import List, Dict, Optional
+
+
+DEFAULT_GAZETTEER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data",
+                                 "canada_gazetteer.json")
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+CASED_TOKEN_PATTERN = re.compile(r"[A-Za-z0-9]+(?:'[A-Za-z]+)?")
+CLAUSE_BREAK = re.compile(r"[.,;:!?()|\n]")
+
+# Tokens after a remote/hybrid phrase, within one clause, that can negate it ("remote work is not available")
+NEGATION_WINDOW = 4
+
+# Spelling variants generated for every name, so "St. John's" also matches "Saint John's"
+VARIANTS = {"st": "saint", "saint": "st", "ste": "sainte", "sainte": "ste"}
+
+END = None  # Trie key holding a node's payload; tokens are never None
+
+# Match strength when choosing between several places in one text
+CONFIRMED, PROVINCE_IN_TEXT, UNCONFIRMED, HOMONYM = 4, 3, 2, 1
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase, strip accents and split text into word tokens."""
+    text = text.lower()
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text.replace("’", "'"))
+        text = text.encode("ascii", "ignore").decode()
+    return TOKEN_PATTERN.findall(text)
+
+
+def _cased_tokens(text: str) -> tuple:
+    """
+    Tokens as tokenize() finds them, keeping their case, and the clause each
+    token is in (clauses end at punctuation: "Remote. Not" are two clauses).
+    """
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text.replace("’", "'"))
+        text = text.encode("ascii", "ignore").decode()
+    tokens, clauses = [], []
+    clause, last = 0, 0
+    for match in CASED_TOKEN_PATTERN.finditer(text):
+        if CLAUSE_BREAK.search(text, last, match.start()):
+            clause += 1
+        tokens.append(match.group())
+        clauses.append(clause)
+        last = match.end()
+    return tokens, clauses
+
+
+def _written_as_code(tokens: List[str]) -> bool:
+    """Whether tokens are written like an abbreviation: "NS", "B.C.", "Ont", but not "on"."""
+    return all(token[0].isupper() and (len(token) > 2 or token.isupper()) for token in tokens)
+
+
+def _variants(tokens: List[str]) -> List[List[str]]:
+    """All St./Saint spellings of a token sequence."""
+    results = [[]]
+    for token in tokens:
+        options = [token, VARIANTS[token]] if token in VARIANTS else [token]
+        results = [prefix + [option] for prefix in results for option in options]
+    return results
+
+
+class Gazetteer:
+    """Word-trie over place names, province names and work-mode phrases."""
+
+    def __init__(self, path: str = DEFAULT_GAZETTEER):
+        """
+        Load the gazetteer file and compile the tries.
+
+        Args:
+            path: Gazetteer JSON file (see data/canada_gazetteer.json)
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        self.trie = {}
+        self.abbreviations = {}
+        self.foreign_codes = {}
+        self.province_names = {}
+        largest = data.get("largest", {})
+        kinds = {name: "ambiguous" for name in data.get("ambiguous", [])}
+        kinds.update({name: "homonym" for name in data.get("homonyms", [])})
+
+        for code, province in data["provinces"].items():
+            self.province_names[code] = province["name"]
+            for name in [province["name"]] + province.get("aliases", []):
+                self._add(self.trie, name, ("province", code))
+            for abbreviation in [code] + province.get("abbreviations", []):
+                self._add(self.abbreviations, abbreviation, code)
+
+        for section in ("places", "communities"):
+            for code, names in data.get(section, {}).items():
+                for name in names:
+                    self._add_place(name, f"{name}, {code}", code, kinds.get(name), largest.get(name) == code)
+        for label, aliases in data.get("aliases", {}).items():
+            code = label.rsplit(", ", 1)[1]
+            for alias in aliases:
+                self._add_place(alias, label, code)
+
+        for name in data.get("foreign_places", []):
+            self._add(self.trie, name, ("foreign",))
+        for code in data.get("foreign_codes", []):
+            self._add(self.foreign_codes, code, True)
+
+        for phrase in data.get("remote_terms", []):
+            self._add(self.trie, phrase, ("remote",))
+        for phrase in data.get("hybrid_terms", []):
+            self._add(self.trie, phrase, ("hybrid",))
+        for phrase in data.get("work_mode_exclusions", []):
+            self._add(self.trie, phrase, ("ignore",))
+        self.negations = set(data.get("work_mode_negations", []))
+
+    @staticmethod
+    def _add(trie: Dict, phrase: str, payload) -> None:
+        for tokens in _variants(tokenize(phrase)):
+            node = trie
+            for token in tokens:
+                node = node.setdefault(token, {})
+            node[END] = payload
+
+    def _add_place(self, name: str, label: str, code: str, kind: Optional[str] = None,
+                   largest: bool = False) -> None:
+        """
+        Add a place; a name shared by several provinces keeps every candidate,
+        the most populous first.
+
+        Args:
+            name: Place name as written in text
+            label: Location label ("Windsor, ON")
+            code: Province code
+            kind: None, "ambiguous" (needs the province in the text) or
+                "homonym" (also a place abroad)
+            largest: This is the most populous of several places with the name
+        """
+        for tokens in _variants(tokenize(name)):
+            node = self.trie
+            for token in tokens:
+                node = node.setdefault(token, {})
+            payload = node.get(END)
+            if not payload or payload[0] != "place":
+                payload = ("place", [])
+                node[END] = payload
+            if all(candidate[1] != code for candidate in payload[1]):
+                payload[1].insert(0 if largest else len(payload[1]), (label, code, kind))
+
+    @staticmethod
+    def _longest(trie: Dict, tokens: List[str], start: int):
+        """Longest phrase in trie starting at tokens[start] as (payload, end) or None."""
+        node = trie.get(tokens[start])
+        if node is None:
+            return None
+        best = (node[END], start + 1) if END in node else None
+        for position in range(start + 1, len(tokens)):
+            node = node.get(tokens[position])
+            if node is None:
+                break
+            if END in node:
+                best = (node[END], position + 1)
+        return best
+
+    def scan(self, tokens: List[str]) -> List[tuple]:
+        """
+        Single pass over tokens collecting non-overlapping longest matches.
+
+        Returns:
+            List of (start, end, payload)
+        """
+        matches = []
+        trie = self.trie
+        position, count = 0, len(tokens)
+        while position < count:
+            if tokens[position] not in trie:
+                position += 1
+                continue
+            found = self._longest(trie, tokens, position)
+            if found is None:
+                position += 1
+                continue
+            matches.append((position, found[1], found[0]))
+            position = found[1]
+        return matches
+
+    def locate(self, text: str) -> Dict:
+        """
+        Extract location details from text.
+
+        Args:
+            text: Job title and/or description
+
+        Returns:
+            Dictionary with city, province (code), label, remote, hybrid
+        """
+        tokens = tokenize(text)
+        cased, clauses = _cased_tokens(text)
+        if len(cased) != len(tokens):
+            cased, clauses = [token.upper() for token in tokens], [0] * len(tokens)
+        matches = self.scan(tokens)
+        starts = {m[0] for m in matches}
+
+        def negated(end: int) -> bool:
+            # "Remote work not available"; a following "not hybrid" is its own phrase
+            for position in range(end, min(end + NEGATION_WINDOW, len(tokens))):
+                if clauses[position] != clauses[end - 1]:
+                    return False
+                if tokens[position] in self.negations and position not in starts:
+                    return True
+            return False
+
+        remote = any(m[2][0] == "remote" and not negated(m[1]) for m in matches)
+        hybrid = any(m[2][0] == "hybrid" and not negated(m[1]) for m in matches)
+        provinces_named = {m[2][1] for m in matches if m[2][0] == "province"}
+        following = {m[0]: m[2][1] for m in matches if m[2][0] == "province"}
+        foreign = {m[0] for m in matches if m[2][0] == "foreign"}
+
+        best = None
+        for start, end, payload in matches:
+            if payload[0] != "place":
+                continue
+            # "Halifax, NS" / "Windsor, Ontario": province right after the name
+            confirmed = following.get(end)
+            if confirmed is None and end < len(tokens):
+                abbreviation = self._longest(self.abbreviations, tokens, end)
+                if abbreviation and _written_as_code(cased[end:abbreviation[1]]):
+                    confirmed = abbreviation[0]
+            if confirmed is None and end < len(tokens):
+                # "London, UK", "Vancouver, Washington", "Burlington, VT": not the Canadian place
+                code = self._longest(self.foreign_codes, tokens, end)
+                if end in foreign or (code and _written_as_code(cased[end:code[1]])):
+                    continue
+
+            choice = None
+            for label, code, kind in payload[1]:
+                if code == confirmed:
+                    choice = (CONFIRMED, label, code)
+                    break
+                if code in provinces_named and (choice is None or choice[0] < PROVINCE_IN_TEXT):
+                    choice = (PROVINCE_IN_TEXT, label, code)
+                elif choice is None and kind is None:
+                    choice = (UNCONFIRMED, label, code)
+                elif choice is None and kind == "homonym" and not foreign:
+                    choice = (HOMONYM, label, code)
+
+            if choice and (best is None or choice[0] > best[0]):
+                best = choice
+
+        city = province = None
+        if best:
+            label, province = best[1], best[2]
+            city = label.rsplit(", ", 1)[0]
+        elif len(provinces_named) == 1:
+            province = provinces_named.pop()
+            label = self.province_names[province]
+        else:
+            label = None
+
+        if label is None:
+            label = "Remote, Canada" if remote else "Hybrid, Canada" if hybrid else "Canada"
+        elif remote:
+            label += " (Remote)"
+        elif hybrid:
+            label += " (Hybrid)"
+
+        return {"city": city, "province": province, "label": label, "remote": remote, "hybrid": hybrid}
+
+
+@lru_cache(maxsize=None)
+def load_gazetteer(path: str = DEFAULT_GAZETTEER) -> Gazetteer:
+    """Build the gazetteer once per process."""
+    return Gazetteer(path)
+
+
+def extract_location(text: str, gazetteer: Optional[Gazetteer] = None) -> str:
+    """
+    Extract a location label such as "Dartmouth, NS", "Toronto, ON (Hybrid)",
+    "Remote, Canada" or "Canada" when nothing is found.
+
+    Args:
+        text: Job title and/or description
+        gazetteer: Gazetteer to use (default: the shipped Canadian gazetteer)
+
+    Returns:
+        Location label
+    """
+    return (gazetteer or load_gazetteer()).locate(text)["label"]
+
+
+if __name__ == "__main__":
+    # Extract locations from sample snippets
+    samples = [
+        "Junior Data Analyst - Dartmouth, NS. Full-time, hybrid.",
+        "Data Analyst, Mississauga, Ontario. 1-2 years experience.",
+        "Fully remote within Canada; team based in Waterloo.",
+        "Remote sensing analyst in London, UK",
+        "Analyste de données - Montréal (QC)",
+    ]
+    for sample in samples:
+        print(f"  {extract_location(sample):28} ← {sample}")
@@ -10,34 +10,23 @@ from urllib.parse import urlencode
 from urllib.request import Request, urlopen
 from urllib.error import HTTPError
 
+from quota import spend
+from settings import get_credential, load_config
+
 # Gmail API endpoints
 GMAIL_API_BASE = "https://www.googleapis.com/gmail/v1/users/me"
 TOKEN_URL = "https://oauth2.googleapis.com/token"
 
+# Gmail quota units per call (messages.list and messages.get)
+LIST_UNITS = 5
+GET_UNITS = 5
+
 def load_credentials():
     """Load Google OAuth credentials from environment or credentials file."""
-    # Try environment variables first
-    client_id = os.getenv('GOOGLE_CLIENT_ID', '')
-    client_secret = os.getenv('GOOGLE_CLIENT_SECRET', '')
-    refresh_token = os.getenv('GOOGLE_REFRESH_TOKEN', '')
-    
-    # If not in env, try credentials file
-    if not all([client_id, client_secret, refresh_token]):
-        creds_paths = ["../credentials/google-workspace.md", "credentials/google-workspace.md"]
-        for creds_path in creds_paths:
-            if os.path.exists(creds_path):
-                with open(creds_path, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line.startswith('client_id:'):
-                            client_id = line.split(':', 1)[1].strip()
-                        elif line.startswith('client_secret:'):
-                            client_secret = line.split(':', 1)[1].strip()
-                        elif line.startswith('refresh_token:'):
-                            refresh_token = line.split(':', 1)[1].strip()
-                break
-    
-    return client_id, client_secret, refresh_token
+    return tuple(
+        get_credential("google-workspace", [key], env=f"GOOGLE_{key.upper()}")
+        for key in ("client_id", "client_secret", "refresh_token")
+    )
 
 def refresh_access_token():
     """Refresh OAuth access token using refresh token"""
@@ -67,6 +56,7 @@ def get_unread_emails(access_token, minutes=30):
     time_ago = (datetime.utcnow() - timedelta(minutes=minutes)).strftime('%Y/%m/%d %H:%M:%S')
     query = f"is:unread after:{time_ago}"
     
+    spend("gmail", cost=LIST_UNITS)
     url = f"{GMAIL_API_BASE}/messages?q={urlencode({'q': query})}"
     req = Request(url)
     req.add_header("Authorization", f"Bearer {access_token}")
@@ -79,6 +69,7 @@ def get_unread_emails(access_token, minutes=30):
 
 def get_email_details(access_token, msg_id):
     """Get full email details"""
+    spend("gmail", cost=GET_UNITS)
     url = f"{GMAIL_API_BASE}/messages/{msg_id}"
     req = Request(url)
     req.add_header("Authorization", f"Bearer {access_token}")
@@ -93,6 +84,7 @@ def extract_content(email_data):
     """Extract subject and body from email"""
     subject = ""
     body = ""
+    sender = ""
     
     headers = email_data.get("payload", {}).get("headers", [])
     for header in headers:
@@ -112,6 +104,12 @@ def extract_content(email_data):
     
     return subject, body, sender
 
+def is_bulk(email_data):
+    """True for mailing-list mail (job alerts, newsletters), judged from its headers"""
+    headers = {header["name"].lower(): header["value"].lower()
+               for header in email_data.get("payload", {}).get("headers", [])}
+    return "list-unsubscribe" in headers or headers.get("precedence") in ("bulk", "list", "junk")
+
 def categorize_email(subject, body):
     """Categorize email based on content"""
     content = (subject + " " + body).lower()
@@ -127,8 +125,31 @@ def categorize_email(subject, body):
     else:
         return "Personal"
 
+def email_date(email_data):
+    """ISO timestamp of when Gmail received the message"""
+    received = int(email_data.get("internalDate", 0)) / 1000
+    return datetime.fromtimestamp(received).isoformat(timespec='seconds') if received else ""
+
+def correlate_job_emails(emails):
+    """Match job-related emails to stored jobs and record status changes"""
+    from email_correlation import correlate_with_store
+    
+    store_path = load_config().get("store_path", "jobs.db")
+    updates = correlate_with_store(emails, store_path)
+    for update in updates:
+        print(f"  📌 {update['previous']} → {update['status']}: {update['url']} ({update['subject']})")
+    if updates:
+        print(f"Updated {len(updates)} job(s); Notion picks the changes up on the next sync.")
+    return updates
+
+def load_notifier(config_path=None):
+    """Create the Telegram digest notifier if enabled in config.json"""
+    from notifier import notifier_from_config
+    return notifier_from_config(load_config(config_path))
+
 def main():
     """Main function"""
+    notifier = load_notifier()
     try:
         access_token = refresh_access_token()
         
@@ -142,6 +163,7 @@ def main():
         
         print(f"Found {len(messages)} unread email(s):")
         
+        job_emails = []
         for msg in messages:
             msg_id = msg["id"]
             email_data = get_email_details(access_token, msg_id)
@@ -151,8 +173,20 @@ def main():
             print(f"\n  [{category}] From: {sender}")
             print(f"  Subject: {subject}")
             
+            if notifier and category == "URGENT":
+                notifier.notify(f"Email from {sender}: {subject}", urgent=True)
+            # Rejections often avoid job keywords, so every message goes to correlation
+            job_emails.append({"sender": sender, "subject": subject, "body": body,
+                               "date": email_date(email_data), "bulk": is_bulk(email_data)})
+        
+        if job_emails:
+            correlate_job_emails(job_emails)
+            
     except Exception as e:
         print(f"Error: {e}")
+    finally:
+        if notifier:
+            notifier.close()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,329 @@
+"""
+History Export Module - Columnar Job History for Analytics
+
+Writes jobs, match scores and the pipeline stage each job reached (found,
+scored, generated) from pipeline runs to a partitioned Parquet dataset so
+match-score trends can be analyzed without opening thousands of per-run
+JSON dumps and job_details.json files. Application statuses from Notion
+live in the job store, not here.
+
+Layout:
+    history/
+    ├── run_month=2026-02/
+    │   ├── part-20260212_060000.parquet
+    │   └── part-20260213_060000.parquet
+    └── run_month=2026-03/
+        └── compact-1741000000.parquet
+"""
+
+import glob
+import json
+import os
+import time
+from datetime import datetime
+from typing import List, Dict, Optional
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+
+HISTORY_COLUMNS = [
+    "run_id", "run_date", "url", "title", "company", "location",
+    "source", "match_score", "stage", "package_path"
+]
+
+# Columns renamed since the first release: old name -> new name
+RENAMED_COLUMNS = {"status": "stage"}
+
+
+def _require_pandas():
+    """Raise a helpful error when pandas/pyarrow are missing."""
+    if pd is None:
+        raise ImportError("pandas is required for history export. Install with: pip install pandas pyarrow")
+
+
+def _run_date(run_id: str) -> str:
+    """Convert a run id (YYYYmmdd_HHMMSS) to an ISO date string."""
+    try:
+        return datetime.strptime(run_id, "%Y%m%d_%H%M%S").date().isoformat()
+    except ValueError:
+        return datetime.now().date().isoformat()
+
+
+def collect_job_records(results: Dict, run_id: str) -> List[Dict]:
+    """
+    Flatten a pipeline results dictionary into one record per job.
+
+    Args:
+        results: Results dictionary produced by JobPipeline.run
+        run_id: Run identifier (timestamp used in pipeline_results_*.json)
+
+    Returns:
+        List of flat job records with a stage of found/scored/generated
+    """
+    run_date = _run_date(run_id)
+    scored_urls = {j.get("url", "") for j in results.get("jobs_scored", [])}
+
+    records = {}
+    for job in results.get("jobs_found", []) + results.get("jobs_scored", []):
+        url = job.get("url", "")
+        if job.get("package_path"):
+            stage = "generated"
+        elif url in scored_urls:
+            stage = "scored"
+        else:
+            stage = "found"
+
+        records[url] = {
+            "run_id": run_id,
+            "run_date": run_date,
+            "url": url,
+            "title": job.get("title", ""),
+            "company": job.get("company", ""),
+            "location": job.get("location", ""),
+            "source": job.get("source", ""),
+            "match_score": int(job.get("match_score", 0) or 0),
+            "stage": stage,
+            "package_path": job.get("package_path", "")
+        }
+
+    return list(records.values())
+
+
+def collect_package_records(applications_dir: str) -> List[Dict]:
+    """
+    Collect records from job_details.json files written by generate_application_package.
+
+    Args:
+        applications_dir: Root directory containing generated packages
+
+    Returns:
+        List of flat job records with stage "generated"
+    """
+    records = []
+    pattern = os.path.join(applications_dir, "**", "job_details.json")
+    for details_path in glob.glob(pattern, recursive=True):
+        try:
+            with open(details_path, 'r') as f:
+                details = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            continue
+
+        generated_at = details.get("generated_at", "")
+        try:
+            generated = datetime.fromisoformat(generated_at)
+        except ValueError:
+            generated = datetime.fromtimestamp(os.path.getmtime(details_path))
+
+        records.append({
+            "run_id": generated.strftime("%Y%m%d_%H%M%S"),
+            "run_date": generated.date().isoformat(),
+            "url": details.get("url", ""),
+            "title": details.get("role", ""),
+            "company": details.get("company", ""),
+            "location": details.get("location", ""),
+            "source": "",
+            "match_score": int(details.get("match_score", 0) or 0),
+            "stage": "generated",
+            "package_path": os.path.dirname(details_path)
+        })
+
+    return records
+
+
+def write_records(records: List[Dict], history_dir: str, part_name: str) -> List[str]:
+    """
+    Append records to the partitioned dataset as new part files.
+
+    Args:
+        records: Flat job records
+        history_dir: Root directory of the Parquet dataset
+        part_name: Suffix for the part files (usually the run id)
+
+    Returns:
+        List of written part file paths
+    """
+    _require_pandas()
+    if not records:
+        return []
+
+    df = pd.DataFrame(records, columns=HISTORY_COLUMNS)
+    df["match_score"] = df["match_score"].astype("int16")
+    df["run_month"] = df["run_date"].str[:7]
+
+    written = []
+    for month, part in df.groupby("run_month"):
+        partition_dir = os.path.join(history_dir, f"run_month={month}")
+        os.makedirs(partition_dir, exist_ok=True)
+        part_path = os.path.join(partition_dir, f"part-{part_name}.parquet")
+        part.drop(columns=["run_month"]).to_parquet(part_path, index=False)
+        written.append(part_path)
+
+    return written
+
+
+def export_run(results: Dict, history_dir: str, run_id: Optional[str] = None) -> List[str]:
+    """
+    Append a single pipeline run to the history dataset.
+
+    Args:
+        results: Results dictionary produced by JobPipeline.run
+        history_dir: Root directory of the Parquet dataset
+        run_id: Run identifier (defaults to the current timestamp)
+
+    Returns:
+        List of written part file paths
+    """
+    run_id = run_id or datetime.now().strftime('%Y%m%d_%H%M%S')
+    return write_records(collect_job_records(results, run_id), history_dir, run_id)
+
+
+def _package_key(url: str, package_path: str) -> tuple:
+    """Identity of a generated package, the same whether it came from a run or its job_details.json."""
+    return url, os.path.normpath(os.path.abspath(package_path))
+
+
+def _imported(history_dir: str) -> tuple:
+    """
+    What the history dataset already holds.
+
+    Returns:
+        (run ids, package keys of generated jobs), both empty if there is no dataset yet
+    """
+    _require_pandas()
+    if not glob.glob(os.path.join(history_dir, "run_month=*", "*.parquet")):
+        return set(), set()
+    df = load_history(history_dir, columns=["run_id", "url", "package_path"])
+    packaged = df[df["package_path"].fillna("") != ""]
+    return set(df["run_id"]), {_package_key(u, p) for u, p in zip(packaged["url"], packaged["package_path"])}
+
+
+def backfill(results_files: List[str], applications_dir: str, history_dir: str) -> int:
+    """
+    Import existing pipeline_results_*.json dumps and package details.
+
+    Runs already in the dataset (from an earlier backfill or `--export`)
+    are skipped, and so are packages already recorded by a run, so the
+    command can be re-run after every new run.
+
+    Args:
+        results_files: Paths to pipeline_results_*.json files
+        applications_dir: Root directory containing generated packages
+        history_dir: Root directory of the Parquet dataset
+
+    Returns:
+        Number of records written
+    """
+    run_ids, packaged = _imported(history_dir)
+    records = []
+    for path in results_files:
+        run_id = os.path.basename(path).replace("pipeline_results_", "").replace(".json", "")
+        if run_id in run_ids:
+            continue
+        try:
+            with open(path, 'r') as f:
+                records.extend(collect_job_records(json.load(f), run_id))
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"  ⚠️  Skipping {path}: {e}")
+
+    if applications_dir and os.path.isdir(applications_dir):
+        # A package's job_details.json has no run id, so it is matched on url and folder
+        packaged |= {_package_key(r["url"], r["package_path"]) for r in records if r["package_path"]}
+        records.extend(r for r in collect_package_records(applications_dir)
+                       if _package_key(r["url"], r["package_path"]) not in packaged)
+
+    write_records(records, history_dir, f"backfill-{int(time.time())}")
+    return len(records)
+
+
+def upgrade_history(history_dir: str) -> int:
+    """
+    Rename columns in part files written before RENAMED_COLUMNS changed,
+    so every part shares one schema and the dataset reads as a whole.
+
+    Returns:
+        Number of part files rewritten
+    """
+    _require_pandas()
+    import pyarrow.parquet as pq
+
+    upgraded = 0
+    for part_path in glob.glob(os.path.join(history_dir, "run_month=*", "*.parquet")):
+        names = pq.read_schema(part_path).names
+        renames = {old: new for old, new in RENAMED_COLUMNS.items() if old in names and new not in names}
+        if not renames:
+            continue
+        # Hidden name while writing: dataset readers skip dot files
+        temp_path = os.path.join(os.path.dirname(part_path), "." + os.path.basename(part_path))
+        pd.read_parquet(part_path).rename(columns=renames).to_parquet(temp_path, index=False)
+        os.replace(temp_path, part_path)
+        upgraded += 1
+    return upgraded
+
+
+def compact_history(history_dir: str) -> int:
+    """
+    Merge the small per-run part files of each month into one file.
+
+    Duplicate (run_id, url) rows are dropped during compaction.
+
+    Args:
+        history_dir: Root directory of the Parquet dataset
+
+    Returns:
+        Number of partitions compacted
+    """
+    upgrade_history(history_dir)
+    compacted = 0
+    for partition_dir in sorted(glob.glob(os.path.join(history_dir, "run_month=*"))):
+        parts = sorted(glob.glob(os.path.join(partition_dir, "*.parquet")))
+        if len(parts) < 2:
+            continue
+
+        df = pd.concat([pd.read_parquet(p) for p in parts], ignore_index=True)
+        df = df.drop_duplicates(subset=["run_id", "url"], keep="last")
+
+        # Write the merged file before removing parts so a crash never loses data
+        merged_path = os.path.join(partition_dir, f"compact-{int(time.time())}.parquet")
+        df.to_parquet(merged_path, index=False)
+        for part_path in parts:
+            if part_path != merged_path:
+                os.remove(part_path)
+        compacted += 1
+
+    return compacted
+
+
+def load_history(history_dir: str, since: Optional[str] = None,
+                 columns: Optional[List[str]] = None) -> "pd.DataFrame":
+    """
+    Load the history dataset, pruning partitions older than `since`.
+
+    Args:
+        history_dir: Root directory of the Parquet dataset
+        since: Optional ISO date (YYYY-MM-DD); earlier months are not read
+        columns: Optional subset of columns to load
+
+    Returns:
+        DataFrame of job records
+    """
+    _require_pandas()
+    if not os.path.isdir(history_dir):
+        return pd.DataFrame(columns=columns or HISTORY_COLUMNS)
+
+    upgrade_history(history_dir)
+    filters = [("run_month", ">=", since[:7])] if since else None
+    df = pd.read_parquet(history_dir, columns=columns, filters=filters)
+    if since and "run_date" in df.columns:
+        df = df[df["run_date"] >= since]
+    return df
+
+
+if __name__ == "__main__":
+    # Summarize the local history dataset
+    history = load_history("history", columns=["run_date", "stage", "match_score"])
+    print(f"Loaded {len(history)} records")
+    if len(history):
+        print(history.groupby("run_date")["match_score"].describe())
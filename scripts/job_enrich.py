@@ -0,0 +1,262 @@
+"""
+Job Enrichment Module - Posting Page Fetcher
+
+Fetches the actual posting page for shortlisted jobs, extracts the main
+description text and caches it on disk. Repeat fetches send ETag /
+Last-Modified validators so an unchanged page costs a 304.
+"""
+
+import hashlib
+import json
+import os
+import ssl
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from html.parser import HTMLParser
+from typing import List, Dict, Optional
+
+from quota import spend, QuotaExceeded
+
+
+USER_AGENT = "Mozilla/5.0 (compatible; MAYAI-JobPipeline/1.0)"
+
+# Tags whose text is never part of a job description
+SKIP_TAGS = {"script", "style", "noscript", "nav", "header", "footer", "aside", "form", "svg", "template"}
+BLOCK_TAGS = {"p", "div", "li", "br", "h1", "h2", "h3", "h4", "h5", "h6", "tr", "section", "article", "main"}
+VOID_TAGS = {"br", "img", "hr", "input", "meta", "link", "source", "wbr"}
+
+
+class _DescriptionParser(HTMLParser):
+    """Collect visible text, JSON-LD blocks and <main>/<article> text."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.skip_depth = 0
+        self.main_depth = 0
+        self.in_json_ld = False
+        self.json_ld = []
+        self.body_text = []
+        self.main_text = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "script" and dict(attrs).get("type") == "application/ld+json":
+            self.in_json_ld = True
+            self.json_ld.append("")
+            return
+        if tag in VOID_TAGS:
+            if tag == "br":
+                self._append("\n")
+            return
+        if tag in SKIP_TAGS:
+            self.skip_depth += 1
+        elif tag in ("main", "article") or self.main_depth:
+            self.main_depth += 1
+        if tag in BLOCK_TAGS:
+            self._append("\n")
+
+    def handle_endtag(self, tag):
+        if self.in_json_ld and tag == "script":
+            self.in_json_ld = False
+            return
+        if tag in VOID_TAGS:
+            return
+        if tag in SKIP_TAGS:
+            self.skip_depth = max(0, self.skip_depth - 1)
+        elif self.main_depth:
+            self.main_depth -= 1
+        if tag in BLOCK_TAGS:
+            self._append("\n")
+
+    def handle_data(self, data):
+        if self.in_json_ld:
+            self.json_ld[-1] += data
+        elif not self.skip_depth:
+            self._append(data)
+
+    def _append(self, text):
+        self.body_text.append(text)
+        if self.main_depth:
+            self.main_text.append(text)
+
+
+def _clean_text(text: str) -> str:
+    """Collapse whitespace while keeping paragraph breaks."""
+    lines = [" ".join(line.split()) for line in text.splitlines()]
+    return "\n".join(line for line in lines if line)
+
+
+def _json_ld_description(blocks: List[str]) -> str:
+    """Return the description of the first schema.org JobPosting, if any."""
+    for block in blocks:
+        try:
+            data = json.loads(block)
+        except json.JSONDecodeError:
+            continue
+        items = data if isinstance(data, list) else data.get("@graph", [data])
+        for item in items:
+            if isinstance(item, dict) and item.get("@type") == "JobPosting" and item.get("description"):
+                parser = _DescriptionParser()
+                parser.feed(item["description"])
+                return _clean_text("".join(parser.body_text))
+    return ""
+
+
+def extract_description(html: str) -> str:
+    """
+    Extract the main job description text from a posting page.
+
+    Prefers the schema.org JobPosting description most job boards embed,
+    then the <main>/<article> element, then all visible body text.
+
+    Args:
+        html: Raw HTML of the posting page
+
+    Returns:
+        Plain-text description
+    """
+    parser = _DescriptionParser()
+    parser.feed(html)
+    parser.close()
+
+    description = _json_ld_description(parser.json_ld)
+    if description:
+        return description
+
+    main_text = _clean_text("".join(parser.main_text))
+    if len(main_text) >= 200:
+        return main_text
+    return _clean_text("".join(parser.body_text))
+
+
+class PageCache:
+    """On-disk cache of extracted posting text plus HTTP validators."""
+
+    def __init__(self, cache_dir: str = "page_cache"):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, url: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.sha1(url.encode()).hexdigest() + ".json")
+
+    def get(self, url: str) -> Optional[Dict]:
+        """Return the cached entry for a URL, or None."""
+        try:
+            with open(self._path(url), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def put(self, url: str, entry: Dict) -> None:
+        """Store an entry atomically."""
+        path = self._path(url)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+
+
+def fetch_posting(url: str, cache: PageCache, timeout: float = 10.0,
+                  ctx: Optional[ssl.SSLContext] = None) -> Dict:
+    """
+    Fetch one posting page using a conditional GET when cached.
+
+    Args:
+        url: Posting URL
+        cache: Page cache
+        timeout: Socket timeout in seconds
+        ctx: Shared SSL context (loading CA certificates is costly per call)
+
+    Returns:
+        Dictionary with url, status ("fetched", "not_modified", "error"),
+        description and error message
+    """
+    cached = cache.get(url)
+    headers = {"User-Agent": USER_AGENT, "Accept": "text/html,application/xhtml+xml"}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    req = urllib.request.Request(url, headers=headers)
+    ctx = ctx or ssl.create_default_context()
+
+    try:
+        with urllib.request.urlopen(req, context=ctx, timeout=timeout) as response:
+            charset = response.headers.get_content_charset() or "utf-8"
+            html = response.read().decode(charset, errors="replace")
+            entry = {
+                "etag": response.headers.get("ETag", ""),
+                "last_modified": response.headers.get("Last-Modified", ""),
+                "description": extract_description(html),
+                "fetched_at": datetime.now().isoformat(timespec='seconds')
+            }
+            cache.put(url, entry)
+            return {"url": url, "status": "fetched", "description": entry["description"]}
+
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and cached:
+            return {"url": url, "status": "not_modified", "description": cached.get("description", "")}
+        error = f"HTTP {e.code}"
+    except Exception as e:
+        error = str(e)
+
+    # Fall back to a stale cached copy on failure
+    description = cached.get("description", "") if cached else ""
+    return {"url": url, "status": "error", "description": description, "error": error}
+
+
+def enrich_jobs(jobs: List[Dict], cache_dir: str = "page_cache",
+                workers: int = 8, timeout: float = 10.0) -> Dict[str, int]:
+    """
+    Replace search snippets with full posting descriptions, in place.
+
+    The original snippet is kept under job['snippet'].
+
+    Args:
+        jobs: Shortlisted job dictionaries
+        cache_dir: Directory for the page cache
+        workers: Number of concurrent fetches
+        timeout: Per-request timeout in seconds
+
+    Returns:
+        Counts of fetched / not_modified / error / deferred results
+    """
+    cache = PageCache(cache_dir)
+    ctx = ssl.create_default_context()
+    targets = [job for job in jobs if job.get("url", "").startswith(("http://", "https://"))]
+    stats = {"fetched": 0, "not_modified": 0, "error": 0, "deferred": 0}
+    
+    # Enrichment is optional, so it only uses quota outside the reserve; the rest keep their snippets
+    funded = []
+    for job in targets:
+        try:
+            spend("web", priority="low")
+        except QuotaExceeded:
+            stats["deferred"] = len(targets) - len(funded)
+            break
+        funded.append(job)
+    targets = funded
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(lambda job: fetch_posting(job["url"], cache, timeout, ctx), targets)
+        for job, result in zip(targets, results):
+            stats[result["status"]] += 1
+            description = result["description"]
+            if len(description) > len(job.get("description", "")):
+                job.setdefault("snippet", job.get("description", ""))
+                job["description"] = description
+
+    return stats
+
+
+if __name__ == "__main__":
+    # Test enrichment of a single URL
+    import sys
+    test_url = sys.argv[1] if len(sys.argv) > 1 else "https://example.com"
+    test_jobs = [{"url": test_url, "description": ""}]
+    print(enrich_jobs(test_jobs, cache_dir="../page_cache"))
+    print(test_jobs[0]["description"][:500])
@@ -8,28 +8,33 @@ import urllib.request
 import json
 import ssl
 import os
-from typing import List, Dict
+from typing import List, Dict, Optional
+
+from company_names import extract_company as _extract_company
+from gazetteer import extract_location
+from quota import spend
+from settings import get_credential
+
+# Overridable so searches can be exercised against a local stand-in
+BRAVE_API_BASE = os.getenv("BRAVE_API_BASE", "https://api.search.brave.com/res/v1")
+
+
+class SearchAPIError(Exception):
+    """A failed Brave Search request; status is the HTTP code when Brave answered."""
+
+    def __init__(self, message: str, status: Optional[int] = None, transient: Optional[bool] = None):
+        super().__init__(message)
+        self.status = status
+        self.transient = transient
 
 
 def load_brave_api_key() -> str:
-    """Load Brave Search API key from credentials file."""
-    creds_path = "../credentials/brave-search.md"
-    
-    if not os.path.exists(creds_path):
-        # Try alternative path
-        creds_path = "credentials/brave-search.md"
-    
-    if os.path.exists(creds_path):
-        with open(creds_path, 'r') as f:
-            for line in f:
-                if 'api key:' in line.lower() or 'token:' in line.lower():
-                    return line.split(':', 1)[1].strip()
-    
-    # Fallback to environment variable
-    return os.getenv('BRAVE_API_KEY', '')
+    """Load Brave Search API key from BRAVE_API_KEY or credentials/brave-search.md."""
+    return get_credential("brave-search", ["api key", "token"], env="BRAVE_API_KEY")
 
 
-def search_brave_jobs(query: str, count: int = 10, country: str = 'ca') -> List[Dict]:
+def search_brave_jobs(query: str, count: int = 10, country: str = 'ca', offset: int = 0,
+                      timeout: float = 10, priority: str = "normal") -> List[Dict]:
     """
     Search for jobs using Brave Search API.
     
@@ -37,15 +42,24 @@ def search_brave_jobs(query: str, count: int = 10, country: str = 'ca') -> List[
         query: Search query (e.g., "Data Analyst jobs Halifax")
         count: Number of results to return (max 20)
         country: Country code for search (default: 'ca' for Canada)
+        offset: Zero-based page of results to fetch (max 9)
+        timeout: Socket timeout in seconds for connecting and each read
+        priority: Quota priority ("low" calls leave the quota reserve untouched)
         
     Returns:
         List of job dictionaries with title, url, description, source
+        
+    Raises:
+        QuotaExceeded: If the Brave quota has no room for the call
+        SearchAPIError: If the request failed (status set for HTTP errors)
     """
     api_key = load_brave_api_key()
     
     if not api_key:
         raise ValueError("Brave Search API key not found. Add to credentials/brave-search.md or set BRAVE_API_KEY env var.")
     
+    spend("brave", priority)
+    
     headers = {
         'X-Subscription-Token': api_key,
         'Accept': 'application/json'
@@ -53,14 +67,16 @@ def search_brave_jobs(query: str, count: int = 10, country: str = 'ca') -> List[
     
     # Construct search URL
     encoded_query = urllib.parse.quote(query)
-    url = f'https://api.search.brave.com/res/v1/web/search?q={encoded_query}&count={count}&country={country}'
+    url = f'{BRAVE_API_BASE}/web/search?q={encoded_query}&count={count}&country={country}'
+    if offset:
+        url += f'&offset={offset}'
     
     # Create SSL context
     ctx = ssl.create_default_context()
     
     try:
         req = urllib.request.Request(url, headers=headers)
-        with urllib.request.urlopen(req, context=ctx) as response:
+        with urllib.request.urlopen(req, context=ctx, timeout=timeout) as response:
             data = json.loads(response.read().decode())
             
             jobs = []
@@ -68,9 +84,9 @@ def search_brave_jobs(query: str, count: int = 10, country: str = 'ca') -> List[
                 job = {
                     'title': result.get('title', 'Unknown Title'),
                     'url': result.get('url', ''),
-                    'description': result.get('description', '')[:500],
+                    'description': result.get('description', ''),
                     'source': extract_source(result.get('url', '')),
-                    'location': extract_location(result.get('description', '')),
+                    'location': extract_location(f"{result.get('title', '')} | {result.get('description', '')}"),
                     'company': extract_company(result.get('title', ''), result.get('url', ''))
                 }
                 jobs.append(job)
@@ -78,7 +94,9 @@ def search_brave_jobs(query: str, count: int = 10, country: str = 'ca') -> List[
             return jobs
             
     except urllib.error.HTTPError as e:
-        raise Exception(f"Brave Search API error: {e.code} - {e.reason}")
+        raise SearchAPIError(f"Brave Search API error: {e.code} - {e.reason}", status=e.code)
+    except (urllib.error.URLError, TimeoutError, ConnectionError) as e:
+        raise SearchAPIError(f"Search failed: {e}", transient=True)
     except Exception as e:
         raise Exception(f"Search failed: {e}")
 
@@ -101,38 +119,9 @@ def extract_source(url: str) -> str:
         return 'Other'
 
 
-def extract_location(description: str) -> str:
-    """Extract location from job description."""
-    # Common Canadian cities/provinces
-    locations = [
-        'Toronto, ON', 'Vancouver, BC', 'Montreal, QC', 'Calgary, AB',
-        'Halifax, NS', 'Ottawa, ON', 'Edmonton, AB', 'Winnipeg, MB',
-        'Quebec City, QC', 'Victoria, BC', 'Saskatoon, SK', 'Regina, SK',
-        'St. John\'s, NL', 'Fredericton, NB', 'Charlottetown, PEI',
-        'Remote, Canada', 'Hybrid, Canada'
-    ]
-    
-    desc_lower = description.lower()
-    for location in locations:
-        if location.split(',')[0].lower() in desc_lower:
-            return location
-    
-    return 'Canada'
-
-
 def extract_company(title: str, url: str) -> str:
-    """Extract company name from title or URL."""
-    # Try to extract from LinkedIn URL
-    if 'linkedin.com/jobs/view' in url:
-        parts = url.split('/')
-        if len(parts) > 4:
-            return parts[4].replace('-', ' ').title()
-    
-    # Try to extract from title (common pattern: "Job Title at Company")
-    if ' at ' in title:
-        return title.split(' at ')[-1].split('-')[0].strip()
-    
-    return 'Unknown Company'
+    """Extract the canonical company name from title or URL (see company_names)."""
+    return _extract_company(title, url)
 
 
 if __name__ == "__main__":
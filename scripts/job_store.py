@@ -0,0 +1,459 @@
+"""
+Job Store Module - Local SQLite Job Database with Full-Text Search
+
+Retains every job the pipeline has seen, including the full description,
+and indexes it with SQLite FTS5 so past postings can be searched with
+boolean and phrase queries, e.g.:
+
+    tableau AND "nova scotia"
+    "power bi" OR tableau NOT senior
+"""
+
+import re
+import sqlite3
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    url TEXT UNIQUE NOT NULL,
+    title TEXT,
+    company TEXT,
+    location TEXT,
+    source TEXT,
+    description TEXT,
+    match_score INTEGER,
+    first_seen TEXT,
+    last_seen TEXT,
+    status TEXT DEFAULT 'Not Applied',
+    status_updated TEXT,
+    notion_page_id TEXT,
+    status_pending INTEGER DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS jobs_last_seen ON jobs(last_seen);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    title, company, location, description,
+    content='jobs', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS jobs_ai AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_fts(rowid, title, company, location, description)
+    VALUES (new.id, new.title, new.company, new.location, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_ad AFTER DELETE ON jobs BEGIN
+    INSERT INTO jobs_fts(jobs_fts, rowid, title, company, location, description)
+    VALUES ('delete', old.id, old.title, old.company, old.location, old.description);
+END;
+"""
+
+# Re-sightings rewrite the same text, so the index is only touched when it changed
+UPDATE_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS jobs_au AFTER UPDATE OF title, company, location, description ON jobs
+WHEN old.title IS NOT new.title OR old.company IS NOT new.company
+  OR old.location IS NOT new.location OR old.description IS NOT new.description
+BEGIN
+    INSERT INTO jobs_fts(jobs_fts, rowid, title, company, location, description)
+    VALUES ('delete', old.id, old.title, old.company, old.location, old.description);
+    INSERT INTO jobs_fts(rowid, title, company, location, description)
+    VALUES (new.id, new.title, new.company, new.location, new.description);
+END;
+"""
+
+# Columns added after the first release, applied to older databases on open
+MIGRATIONS = {
+    "status": "ALTER TABLE jobs ADD COLUMN status TEXT DEFAULT 'Not Applied'",
+    "status_updated": "ALTER TABLE jobs ADD COLUMN status_updated TEXT",
+    "notion_page_id": "ALTER TABLE jobs ADD COLUMN notion_page_id TEXT",
+    "status_pending": "ALTER TABLE jobs ADD COLUMN status_pending INTEGER DEFAULT 0",
+}
+
+# Statuses set by hand in Notion that mean a job needs no more pipeline work
+CLOSED_STATUSES = {"Applied", "Interview", "Offer", "Rejected"}
+
+# Column weights for bm25 ranking: title, company, location, description
+RANK_WEIGHTS = (10.0, 5.0, 2.0, 1.0)
+
+# Query pieces: NEAR groups, quoted phrases (possibly unterminated), parentheses, bare tokens
+_QUERY_TOKEN = re.compile(r'(?i:near)\([^()]*\)?|"[^"]*"?|[()]|[^\s()"]+')
+_BARE_TERM = re.compile(r'\w+\*?')
+_OPERATORS = {"and", "or", "not"}
+
+
+class QueryError(ValueError):
+    """Raised for a search query that cannot be turned into an FTS5 expression."""
+
+
+def normalize_query(query: str) -> str:
+    """
+    Convert a user query to FTS5 syntax.
+
+    Bare and/or/not words outside quotes become FTS5 operators, so
+    `tableau and "nova scotia"` behaves like `tableau AND "nova scotia"`.
+    Tokens with punctuation are quoted (`power-bi` → `"power-bi"`, matched
+    as the phrase "power bi"), `NEAR(a b)` groups are passed through, and
+    unbalanced parentheses are dropped or closed. An operator needs a term
+    on both sides: FTS5 has no unary NOT, so `NOT tableau` is an error
+    rather than a search for tableau.
+
+    Args:
+        query: User search query
+
+    Returns:
+        FTS5 MATCH expression
+
+    Raises:
+        QueryError: If the query has no searchable words, an operator
+            without a term on either side, or an unterminated NEAR group
+    """
+    items = []
+    for token in _QUERY_TOKEN.findall(query):
+        if token in "()":
+            items.append((token, token))
+        elif token[:5].lower() == "near(":
+            if not token.endswith(")"):
+                raise QueryError(f"unterminated NEAR group in query: {query!r}")
+            items.append(("term", "NEAR" + token[4:]))
+        elif token.startswith('"'):
+            phrase = token.strip('"')
+            if re.search(r'\w', phrase):
+                items.append(("term", f'"{phrase}"'))
+        elif token.lower() in _OPERATORS:
+            items.append(("op", token.upper()))
+        elif _BARE_TERM.fullmatch(token):
+            items.append(("term", token))
+        elif re.search(r'\w', token):
+            items.append(("term", f'"{token}"'))
+
+    def drop_empty_group():
+        # "()" matches nothing; the AND implied before it goes too
+        out.pop()
+        if out and out[-1][0] == "implied":
+            out.pop()
+
+    out, depth = [], 0
+    for kind, text in items:
+        if kind == "op" and (not out or out[-1][0] in ("op", "(")):
+            raise QueryError(f"{text} needs a search term before it: {query!r}")
+        if kind == ")":
+            if out and out[-1][0] == "op":
+                raise QueryError(f"{out[-1][1]} needs a search term after it: {query!r}")
+            if depth == 0:
+                continue
+            depth -= 1
+            if out[-1][0] == "(":
+                drop_empty_group()
+                continue
+        elif kind == "(":
+            depth += 1
+        # FTS5 only implies AND between phrases, not next to a parenthesized group
+        if out and out[-1][0] in ("term", ")") and (kind == "(" or (kind == "term" and out[-1][0] == ")")):
+            out.append(("implied", "AND"))
+        out.append((kind, text))
+
+    while out and out[-1][0] == "(":
+        drop_empty_group()
+        depth -= 1
+    if out and out[-1][0] == "op":
+        raise QueryError(f"{out[-1][1]} needs a search term after it: {query!r}")
+    if not any(kind == "term" for kind, _ in out):
+        raise QueryError(f"no search terms in query: {query!r}")
+    return " ".join(text for _, text in out) + ")" * depth
+
+
+class JobStore:
+    """SQLite-backed store of every job seen by the pipeline."""
+
+    def __init__(self, db_path: str = "jobs.db"):
+        """Open (and create if needed) the job database."""
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self._migrate()
+        self.conn.execute(UPDATE_TRIGGER)
+
+    def _migrate(self):
+        """Add columns introduced after a database was created."""
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(jobs)")}
+        trigger = self.conn.execute("SELECT sql FROM sqlite_master WHERE name = 'jobs_au'").fetchone()
+        with self.conn:
+            for column, statement in MIGRATIONS.items():
+                if column not in columns:
+                    self.conn.execute(statement)
+            # Older databases have an update trigger without the WHEN guard
+            if trigger and "WHEN" not in trigger[0]:
+                self.conn.execute("DROP TRIGGER jobs_au")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS jobs_notion_page ON jobs(notion_page_id)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS jobs_match_score ON jobs(match_score DESC, id)")
+
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def upsert_jobs(self, jobs: List[Dict], seen_at: Optional[str] = None) -> int:
+        """
+        Insert new jobs and refresh ones seen before.
+
+        Args:
+            jobs: List of job dictionaries (url is required)
+            seen_at: ISO timestamp for this sighting (default: now)
+
+        Returns:
+            Number of jobs written
+        """
+        seen_at = seen_at or datetime.now().isoformat(timespec='seconds')
+        rows = [
+            (
+                job['url'], job.get('title', ''), job.get('company', ''),
+                job.get('location', ''), job.get('source', ''),
+                job.get('description', ''), job.get('match_score'),
+                seen_at, seen_at
+            )
+            for job in jobs if job.get('url')
+        ]
+
+        with self.conn:
+            self.conn.executemany(
+                """
+                INSERT INTO jobs (url, title, company, location, source, description,
+                                  match_score, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    title = excluded.title,
+                    company = excluded.company,
+                    location = excluded.location,
+                    source = excluded.source,
+                    description = CASE
+                        WHEN length(excluded.description) > length(coalesce(jobs.description, ''))
+                        THEN excluded.description ELSE jobs.description END,
+                    match_score = coalesce(excluded.match_score, jobs.match_score),
+                    first_seen = min(jobs.first_seen, excluded.first_seen),
+                    last_seen = max(jobs.last_seen, excluded.last_seen)
+                """,
+                rows
+            )
+        return len(rows)
+
+    def search(self, query: str, days: Optional[int] = None, limit: int = 20) -> List[Dict]:
+        """
+        Run a ranked full-text query over stored jobs.
+
+        Args:
+            query: Boolean/phrase query (see normalize_query)
+            days: Only include jobs seen in the last N days
+            limit: Maximum number of results
+
+        Returns:
+            List of job dictionaries ordered by relevance, with a snippet
+
+        Raises:
+            QueryError: If the query cannot be searched
+        """
+        match = normalize_query(query)
+        sql = """
+            SELECT jobs_fts.rowid AS id, bm25(jobs_fts, ?, ?, ?, ?) AS rank
+            FROM jobs_fts
+        """
+        params = list(RANK_WEIGHTS)
+
+        if days is not None:
+            cutoff = (datetime.now() - timedelta(days=days)).isoformat(timespec='seconds')
+            sql += " JOIN jobs ON jobs.id = jobs_fts.rowid WHERE jobs_fts MATCH ? AND jobs.last_seen >= ?"
+            params += [match, cutoff]
+        else:
+            sql += " WHERE jobs_fts MATCH ?"
+            params.append(match)
+
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+        try:
+            ranked = self.conn.execute(sql, params).fetchall()
+        except sqlite3.OperationalError as e:
+            raise QueryError(f"invalid query {query!r}: {e}") from e
+        if not ranked:
+            return []
+
+        # Snippets are only built for the rows being returned
+        ids = [row['id'] for row in ranked]
+        placeholders = ",".join("?" * len(ids))
+        rows = self.conn.execute(
+            f"""
+            SELECT jobs.*, snippet(jobs_fts, 3, '[', ']', '…', 12) AS snippet
+            FROM jobs_fts JOIN jobs ON jobs.id = jobs_fts.rowid
+            WHERE jobs_fts MATCH ? AND jobs_fts.rowid IN ({placeholders})
+            """,
+            [match] + ids
+        ).fetchall()
+
+        by_id = {row['id']: dict(row) for row in rows}
+        results = []
+        for row in ranked:
+            job = by_id[row['id']]
+            job['rank'] = row['rank']
+            results.append(job)
+        return results
+
+    def get_state(self, key: str, default: str = "") -> str:
+        """Read a sync cursor or other persisted marker."""
+        row = self.conn.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def set_state(self, key: str, value: str) -> None:
+        """Persist a sync cursor or other marker."""
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO sync_state (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (key, value)
+            )
+
+    def set_notion_pages(self, pages: Dict[str, str]) -> None:
+        """Record the Notion page created for each job URL."""
+        with self.conn:
+            self.conn.executemany(
+                "UPDATE jobs SET notion_page_id = ? WHERE url = ?",
+                [(page_id, url) for url, page_id in pages.items()]
+            )
+
+    def apply_status_changes(self, changes: List[Dict]) -> int:
+        """
+        Update job statuses from Notion rows.
+
+        Rows are matched by Notion page id first, then by job URL. Jobs
+        with a local status not yet pushed (status_pending) keep it: Notion
+        only holds the older value, and the next push overwrites it there.
+
+        Args:
+            changes: Dictionaries with page_id, url, status and last_edited
+
+        Returns:
+            Number of jobs updated
+        """
+        updated = 0
+        with self.conn:
+            for change in changes:
+                match = (change["page_id"], change.get("url", ""))
+                cursor = self.conn.execute(
+                    """
+                    UPDATE jobs SET status = ?, status_updated = ?, notion_page_id = ?, status_pending = 0
+                    WHERE (notion_page_id = ? OR (url = ? AND url != '')) AND coalesce(status_pending, 0) = 0
+                    """,
+                    (change["status"], change["last_edited"], change["page_id"]) + match
+                )
+                updated += cursor.rowcount
+                # A pending status still needs the page id to be pushed
+                self.conn.execute(
+                    """
+                    UPDATE jobs SET notion_page_id = ?
+                    WHERE (notion_page_id = ? OR (url = ? AND url != '')) AND status_pending = 1
+                    """,
+                    (change["page_id"],) + match
+                )
+        return updated
+
+    def job_states(self, urls: List[str]) -> Dict[str, Dict]:
+        """
+        Look up status and Notion page for a batch of job URLs.
+
+        Args:
+            urls: Job URLs
+
+        Returns:
+            Mapping of URL to {"status", "notion_page_id"} for known jobs
+        """
+        states = {}
+        for start in range(0, len(urls), 500):
+            chunk = urls[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for row in self.conn.execute(
+                f"SELECT url, status, notion_page_id FROM jobs WHERE url IN ({placeholders})", chunk
+            ):
+                states[row["url"]] = {"status": row["status"], "notion_page_id": row["notion_page_id"]}
+        return states
+
+    def recent_jobs(self, days: int = 180) -> List[Dict]:
+        """
+        Jobs seen within the last `days` days, most recent first.
+
+        Returns:
+            Dictionaries with url, title, company, status and notion_page_id
+        """
+        since = (datetime.now() - timedelta(days=days)).isoformat()
+        rows = self.conn.execute(
+            """
+            SELECT url, title, company, status, notion_page_id FROM jobs
+            WHERE last_seen >= ? ORDER BY last_seen DESC
+            """,
+            (since,)
+        )
+        return [dict(row) for row in rows]
+
+    def set_local_statuses(self, updates: List[Dict]) -> int:
+        """
+        Record status changes found outside Notion (e.g. from email) and
+        flag them for the next Notion sync.
+
+        Args:
+            updates: Dictionaries with url, status and when
+
+        Returns:
+            Number of jobs updated
+        """
+        with self.conn:
+            cursor = self.conn.executemany(
+                "UPDATE jobs SET status = ?, status_updated = ?, status_pending = 1 WHERE url = ?",
+                [(update["status"], update["when"], update["url"]) for update in updates]
+            )
+        return cursor.rowcount
+
+    def pending_statuses(self) -> List[Dict]:
+        """
+        Local status changes not yet pushed to Notion.
+
+        Returns:
+            Dictionaries with url, status and notion_page_id (jobs with a page only)
+        """
+        rows = self.conn.execute(
+            "SELECT url, status, notion_page_id FROM jobs "
+            "WHERE status_pending = 1 AND notion_page_id IS NOT NULL"
+        )
+        return [dict(row) for row in rows]
+
+    def clear_pending_statuses(self, urls: List[str]) -> None:
+        """Mark local status changes as pushed."""
+        with self.conn:
+            self.conn.executemany("UPDATE jobs SET status_pending = 0 WHERE url = ?", [(url,) for url in urls])
+
+    def count(self) -> int:
+        """Return the number of stored jobs."""
+        return self.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+
+if __name__ == "__main__":
+    # Test search against a throwaway in-memory store
+    store = JobStore(":memory:")
+    store.upsert_jobs([
+        {"url": "https://example.com/1", "title": "Data Analyst", "company": "Test Corp",
+         "location": "Halifax, NS", "description": "Tableau dashboards for Nova Scotia health data."},
+        {"url": "https://example.com/2", "title": "BI Analyst", "company": "Other Corp",
+         "location": "Toronto, ON", "description": "Power BI and SQL reporting."}
+    ])
+    for job in store.search('tableau and "nova scotia"'):
+        print(f"  - {job['title']} at {job['company']}: {job['snippet']}")
@@ -0,0 +1,239 @@
+"""
+Journal Module - Append-only Job Event Journal with Compaction
+
+Records what happened to each job as a stream of events, one JSON line
+each, so any run can be audited and the pipeline's view of every job
+rebuilt without reading old results files:
+
+    found       title, company, location, source
+    scored      match_score, profile
+    generated   package_path
+    synced      notion_page_id
+    status      status
+
+Only deltas are written: an event carries just the fields that changed,
+and a job found again with the same details writes nothing at all.
+
+Layout (config.json "journal.path", default journal/):
+
+    events-000001.jsonl    append-only segments
+    snapshot.json          state of every job up to (segment, byte offset)
+
+Once `compact_events` events have piled up since the snapshot, the
+journal starts a new segment, folds everything up to it into a fresh
+snapshot and deletes the segments the snapshot covers. Rebuilding state
+is then one JSON load plus a replay of the short tail. Events appended
+to a segment by another process while it is being compacted sit past the
+snapshot's offset and are replayed, not lost.
+
+A crash mid-append can leave a segment ending in a partial line. Replay
+stops before it, and the next Journal() starts a fresh segment so new
+events are never glued onto the fragment; any line that still fails to
+decode is skipped.
+"""
+
+import json
+import os
+import time
+from datetime import datetime
+from typing import List, Dict, Optional
+
+# Fields each event kind records
+EVENT_FIELDS = {
+    "found": ("title", "company", "location", "source"),
+    "scored": ("match_score", "profile"),
+    "generated": ("package_path",),
+    "synced": ("notion_page_id",),
+    "status": ("status",),
+}
+
+SNAPSHOT_NAME = "snapshot.json"
+SEGMENT_PREFIX = "events-"
+
+
+class Journal:
+    """Append-only event log plus snapshot; keeps the replayed state in memory."""
+
+    def __init__(self, directory: str = "journal", compact_events: int = 20000):
+        """
+        Args:
+            directory: Journal directory (created if needed)
+            compact_events: Events since the last snapshot that trigger compaction
+        """
+        self.directory = directory
+        self.compact_events = compact_events
+        os.makedirs(directory, exist_ok=True)
+        self.state = {}
+        self.position = (0, 0)
+        self.pending_events = 0
+        self.replay_seconds = 0.0
+        self._load()
+
+    def _segments(self) -> List[int]:
+        """Segment numbers present on disk, oldest first."""
+        numbers = []
+        for name in os.listdir(self.directory):
+            if name.startswith(SEGMENT_PREFIX) and name.endswith(".jsonl"):
+                numbers.append(int(name[len(SEGMENT_PREFIX):-len(".jsonl")]))
+        return sorted(numbers)
+
+    def _segment_path(self, number: int) -> str:
+        return os.path.join(self.directory, f"{SEGMENT_PREFIX}{number:06d}.jsonl")
+
+    @staticmethod
+    def _apply(state: Dict[str, Dict], event: Dict) -> None:
+        job = state.get(event["url"])
+        if job is None:
+            job = state[event["url"]] = {"first_seen": event["t"]}
+        job.update(event["d"])
+        job[f"{event['e']}_at"] = event["t"]
+
+    def _replay(self, state: Dict[str, Dict], start: tuple, until: Optional[int] = None) -> tuple:
+        """
+        Apply every event after `start` (segment, offset) to state, up to
+        and including segment `until` (default: all).
+
+        Returns:
+            (position after the last complete event, events applied)
+        """
+        position, applied = start, 0
+        for number in self._segments():
+            if number < start[0]:
+                continue
+            if until is not None and number > until:
+                break
+            offset = start[1] if number == start[0] else 0
+            with open(self._segment_path(number), 'rb') as f:
+                f.seek(offset)
+                for line in f:
+                    # A line without its newline is a write still in progress (or torn by a crash)
+                    if not line.endswith(b"\n"):
+                        break
+                    offset += len(line)
+                    try:
+                        self._apply(state, json.loads(line))
+                    except (ValueError, KeyError, TypeError, AttributeError):
+                        # A fragment a crashed writer left, joined to the next append
+                        continue
+                    applied += 1
+            position = (number, offset)
+        return position, applied
+
+    def _load(self) -> None:
+        start = time.perf_counter()
+        try:
+            with open(os.path.join(self.directory, SNAPSHOT_NAME), 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+            self.state = snapshot["jobs"]
+            self.position = tuple(snapshot["position"])
+        except (OSError, json.JSONDecodeError, KeyError):
+            self.state, self.position = {}, (0, 0)
+        _, self.pending_events = self._replay(self.state, self.position)
+        if self._torn_tail():
+            open(self._segment_path(self._segments()[-1] + 1), 'a').close()
+        self.replay_seconds = time.perf_counter() - start
+
+    def _torn_tail(self) -> bool:
+        """True when the newest segment ends in a partial line."""
+        segments = self._segments()
+        if not segments:
+            return False
+        with open(self._segment_path(segments[-1]), 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return False
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) != b"\n"
+
+    def record(self, kind: str, jobs: List[Dict], run: Optional[str] = None) -> int:
+        """
+        Append events for the jobs whose fields for this kind changed.
+
+        Args:
+            kind: Event kind (found, scored, generated, synced, status)
+            jobs: Job dictionaries (url required)
+            run: Run identifier stored with each event
+
+        Returns:
+            Number of events written
+        """
+        fields = EVENT_FIELDS[kind]
+        when = datetime.now().isoformat(timespec='seconds')
+        events = []
+        for job in jobs:
+            url = job.get("url")
+            if not url:
+                continue
+            known = self.state.get(url, {})
+            delta = {field: job[field] for field in fields
+                     if field in job and known.get(field) != job[field]}
+            if not delta and (kind == "found" or f"{kind}_at" in known):
+                continue
+            event = {"t": when, "e": kind, "url": url, "d": delta}
+            if run:
+                event["run"] = run
+            events.append(event)
+        if not events:
+            return 0
+
+        # One O_APPEND write per batch, so concurrent writers never interleave lines
+        data = "".join(json.dumps(event, separators=(",", ":")) + "\n" for event in events).encode("utf-8")
+        segments = self._segments()
+        path = self._segment_path(segments[-1] if segments else 1)
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+        for event in events:
+            self._apply(self.state, event)
+        self.pending_events += len(events)
+        if self.compact_events and self.pending_events >= self.compact_events:
+            self.compact()
+        return len(events)
+
+    def compact(self) -> Dict:
+        """
+        Fold every event so far into a new snapshot and drop the covered segments.
+
+        Returns:
+            Stats with jobs, events folded and segments removed
+        """
+        segments = self._segments()
+        # New writes go to a fresh segment while this one is folded in
+        current = segments[-1] if segments else 1
+        open(self._segment_path(current + 1), 'a').close()
+
+        # Rebuilt from disk rather than self.state, to pick up other processes' events
+        state = {}
+        try:
+            with open(os.path.join(self.directory, SNAPSHOT_NAME), 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+            state, start = snapshot["jobs"], tuple(snapshot["position"])
+        except (OSError, json.JSONDecodeError, KeyError):
+            start = (0, 0)
+        position, folded = self._replay(state, start, until=current)
+
+        path = os.path.join(self.directory, SNAPSHOT_NAME)
+        with open(f"{path}.tmp", 'w', encoding='utf-8') as f:
+            json.dump({"position": list(position), "compacted_at": datetime.now().isoformat(timespec='seconds'),
+                       "jobs": state}, f, separators=(",", ":"))
+        os.replace(f"{path}.tmp", path)
+
+        # The segment the snapshot ends in stays until the next compaction;
+        # anything appended to it from now on lies past the snapshot's offset
+        removed = 0
+        for number in segments:
+            if number < position[0]:
+                os.remove(self._segment_path(number))
+                removed += 1
+
+        # Events other processes wrote to the new segment meanwhile
+        _, pending = self._replay(state, position)
+        self.state, self.position, self.pending_events = state, position, pending
+        return {"jobs": len(state), "events": folded, "segments_removed": removed}
+
+    def disk_usage(self) -> int:
+        """Bytes used by the snapshot and segments."""
+        return sum(os.path.getsize(os.path.join(self.directory, name)) for name in os.listdir(self.directory))
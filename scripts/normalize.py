@@ -0,0 +1,83 @@
+"""
+Normalize Module - Shared Keys for Job URLs, Companies and Domains
+
+Small, dependency-free helpers that several stages use to recognise the
+same job or employer: the URL dedup key, the normalized company name and
+the registrable label of an email or URL host. Kept apart from the stage
+modules so that importing them (resume generation, top-k selection,
+company names) does not load search, quota or email code.
+"""
+
+import re
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from gazetteer import tokenize
+
+
+TRACKING_PARAMS = {"ref", "refid", "trk", "trackingid", "from", "src", "fbclid", "gclid", "mc_cid", "mc_eid"}
+
+# Placeholder written when a posting names no employer
+UNKNOWN_COMPANY = "Unknown Company"
+
+# Trailing words that recruiters drop ("The Co-operators Group Ltd." writes as "The Co-operators")
+COMPANY_SUFFIXES = {"inc", "ltd", "llc", "llp", "lp", "plc", "corp", "corporation", "limited", "co",
+                    "company", "ltee", "incorporated", "group", "holdings"}
+
+# Hosts whose domain says nothing about the employer
+MAIL_PROVIDERS = {"gmail", "outlook", "hotmail", "yahoo", "icloud", "live", "protonmail"}
+ATS_DOMAINS = {
+    "greenhouse", "lever", "myworkday", "workday", "myworkdayjobs", "icims", "smartrecruiters",
+    "taleo", "successfactors", "bamboohr", "jobvite", "ashbyhq", "workable", "recruitee",
+    "applytojob", "ultipro", "adp", "dayforcehcm", "ceridian", "njoyn",
+}
+JOB_BOARDS = {"indeed", "indeedemail", "linkedin", "glassdoor", "ziprecruiter", "workopolis", "jobbank"}
+GENERIC_DOMAINS = MAIL_PROVIDERS | ATS_DOMAINS | JOB_BOARDS
+
+# Second-level labels under which the registrable name sits one level lower
+PUBLIC_SUFFIXES = {"co", "com", "gc", "gov", "org", "net", "ac"}
+
+EMAIL_ADDRESS = re.compile(r"[\w.+-]+@([\w-]+(?:\.[\w-]+)+)")
+
+
+def normalize_url(url: str) -> str:
+    """
+    Canonical form of a job URL used as the dedup key.
+
+    Query parameters are kept (job boards identify postings by them, e.g.
+    Indeed's ?jk=) except tracking ones, and sorted.
+    """
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    ))
+    return urlunsplit((parts.scheme.lower() or "https", host, parts.path.rstrip("/"), query, ""))
+
+
+def company_key(name: str) -> str:
+    """Normalized company name: "The Co-operators Group Ltd." → "co operators"."""
+    tokens = tokenize(name)
+    while tokens and tokens[-1] in COMPANY_SUFFIXES:
+        tokens.pop()
+    if tokens and tokens[0] == "the":
+        tokens = tokens[1:]
+    return " ".join(tokens)
+
+
+UNKNOWN_KEY = company_key(UNKNOWN_COMPANY)
+
+
+def domain_stem(address: str) -> str:
+    """
+    Registrable label of an email or URL host: "talent@careers.rbc.com" → "rbc",
+    "jobs@novascotia.ca" → "novascotia", "x@tpsgc-pwgsc.gc.ca" → "tpsgc-pwgsc".
+    """
+    match = EMAIL_ADDRESS.search(address)
+    host = match.group(1) if match else address
+    labels = host.lower().split(".")
+    if len(labels) >= 3 and labels[-2] in PUBLIC_SUFFIXES:
+        return labels[-3]
+    return labels[-2] if len(labels) >= 2 else labels[0]
@@ -0,0 +1,252 @@
+"""
+Notifier Module - Batched Telegram Digests
+
+Collects events from the pipeline (new high-score jobs) and the Gmail
+monitor (URGENT emails), coalesces them into digest messages and sends
+them to Telegram from a background thread. Producers only enqueue, so a
+slow or failing Bot API never blocks a pipeline stage.
+
+    notifier = notifier_from_config(config)
+    notifier.notify("New job (92%): Data Analyst at Test Corp")
+    notifier.notify("Interview invite from recruiter@rbc.com", urgent=True)
+    notifier.close()  # flush pending digests before exit
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+import urllib.error
+import urllib.request
+from typing import List, Dict, Optional
+
+from settings import get_credential, load_config
+
+
+TELEGRAM_API_BASE = os.getenv("TELEGRAM_API_BASE", "https://api.telegram.org")
+MESSAGE_LIMIT = 4096
+
+
+def load_telegram_token() -> str:
+    """Load Telegram bot token from TELEGRAM_BOT_TOKEN or credentials/telegram.md."""
+    return get_credential("telegram", ["token"], env="TELEGRAM_BOT_TOKEN")
+
+
+class TelegramNotifier:
+    """Coalescing, rate-limited, retrying Telegram sender running in a daemon thread."""
+
+    def __init__(self, token: str, chat_id: str, window_seconds: float = 30.0,
+                 urgent_window_seconds: float = 2.0, max_batch: int = 20,
+                 min_interval: float = 1.0, max_retries: int = 4,
+                 api_base: str = TELEGRAM_API_BASE):
+        """
+        Start the sender thread.
+
+        Args:
+            token: Bot API token
+            chat_id: Target chat (the Telegram user id for direct messages)
+            window_seconds: How long to gather events into one digest
+            urgent_window_seconds: Shorter window once an urgent event is pending
+            max_batch: Send early once this many events are pending
+            min_interval: Minimum seconds between messages (Telegram allows ~1/s per chat)
+            max_retries: Attempts per message before it is dropped
+            api_base: Bot API base URL (overridable for a local mock)
+        """
+        self.url = f"{api_base}/bot{token}/sendMessage"
+        self.chat_id = chat_id
+        self.window_seconds = window_seconds
+        self.urgent_window_seconds = urgent_window_seconds
+        self.max_batch = max_batch
+        self.min_interval = min_interval
+        self.max_retries = max_retries
+
+        self.events = queue.Queue()
+        self.latencies = []
+        self.sent_messages = 0
+        self.failed_messages = 0
+        self.last_send = 0.0
+        self.closed = False
+
+        self.thread = threading.Thread(target=self._run, name="telegram-notifier", daemon=True)
+        self.thread.start()
+
+    def notify(self, text: str, urgent: bool = False) -> None:
+        """
+        Queue an event for the next digest. Never blocks.
+
+        Args:
+            text: One-line event description
+            urgent: Send within urgent_window_seconds instead of window_seconds
+        """
+        if not self.closed:
+            self.events.put_nowait({"text": text, "urgent": urgent, "created": time.monotonic()})
+
+    def close(self, timeout: float = 30.0) -> None:
+        """Flush pending events and stop the sender thread."""
+        if self.closed:
+            return
+        self.closed = True
+        self.events.put(None)
+        self.thread.join(timeout)
+
+    def stats(self) -> Dict:
+        """Delivery counts and end-to-end latency percentiles in seconds."""
+        latencies = sorted(self.latencies)
+
+        def percentile(p):
+            return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))], 3) if latencies else 0.0
+
+        return {
+            "events_delivered": len(latencies),
+            "messages_sent": self.sent_messages,
+            "messages_failed": self.failed_messages,
+            "latency_p50": percentile(0.50),
+            "latency_p99": percentile(0.99)
+        }
+
+    def _run(self):
+        """Gather events into digests until close() is called."""
+        stopping = False
+        while not stopping:
+            first = self.events.get()
+            if first is None:
+                break
+
+            batch = [first]
+            window = self.urgent_window_seconds if first["urgent"] else self.window_seconds
+            deadline = first["created"] + window
+
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    event = self.events.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if event is None:
+                    stopping = True
+                    break
+                batch.append(event)
+                if event["urgent"]:
+                    deadline = min(deadline, event["created"] + self.urgent_window_seconds)
+
+            self._deliver(batch)
+
+        # Drain anything queued after the stop marker
+        leftover = []
+        while not self.events.empty():
+            event = self.events.get_nowait()
+            if event is not None:
+                leftover.append(event)
+        if leftover:
+            self._deliver(leftover)
+
+    def _deliver(self, batch: List[Dict]) -> None:
+        """Format a batch into one or more messages and send them."""
+        for text, events in format_digest(batch):
+            if self._send(text):
+                now = time.monotonic()
+                self.latencies.extend(now - event["created"] for event in events)
+                self.sent_messages += 1
+            else:
+                self.failed_messages += 1
+
+    def _send(self, text: str) -> bool:
+        """POST one message, honouring the rate limit and retrying failures."""
+        payload = json.dumps({"chat_id": self.chat_id, "text": text,
+                              "disable_web_page_preview": True}).encode()
+        delay = 1.0
+
+        for _ in range(self.max_retries):
+            wait = self.min_interval - (time.monotonic() - self.last_send)
+            if wait > 0:
+                time.sleep(wait)
+            self.last_send = time.monotonic()
+
+            req = urllib.request.Request(self.url, data=payload,
+                                         headers={"Content-Type": "application/json"})
+            try:
+                with urllib.request.urlopen(req, timeout=10) as response:
+                    if response.status == 200:
+                        return True
+            except urllib.error.HTTPError as e:
+                if e.code == 429:
+                    # Telegram says exactly how long to back off
+                    try:
+                        delay = json.loads(e.read()).get("parameters", {}).get("retry_after", delay)
+                    except (ValueError, AttributeError):
+                        pass
+                elif e.code < 500:
+                    return False
+            except Exception:
+                pass
+
+            time.sleep(delay)
+            delay = min(delay * 2, 30)
+
+        return False
+
+
+def format_digest(batch: List[Dict]) -> List[tuple]:
+    """
+    Turn a batch of events into message texts within Telegram's size limit.
+
+    Urgent events are listed first.
+
+    Returns:
+        List of (text, events included in that text)
+    """
+    ordered = sorted(batch, key=lambda e: not e["urgent"])
+    urgent_count = sum(1 for e in batch if e["urgent"])
+    header = f"🔔 MAYAI digest: {len(batch)} update(s)"
+    if urgent_count:
+        header += f", {urgent_count} urgent"
+
+    messages = []
+    lines, included = [header], []
+    for event in ordered:
+        line = ("🚨 " if event["urgent"] else "• ") + event["text"]
+        if len("\n".join(lines + [line])) > MESSAGE_LIMIT and included:
+            messages.append(("\n".join(lines), included))
+            lines, included = [header + " (cont.)"], []
+        lines.append(line[:MESSAGE_LIMIT - len(header) - 20])
+        included.append(event)
+    messages.append(("\n".join(lines), included))
+    return messages
+
+
+def notifier_from_config(config: Dict) -> Optional[TelegramNotifier]:
+    """
+    Build a notifier from config.json notification_settings.
+
+    Returns:
+        A started TelegramNotifier, or None if Telegram is disabled or unconfigured
+    """
+    settings = config.get("notification_settings", {})
+    if not settings.get("telegram_enabled"):
+        return None
+
+    token = load_telegram_token()
+    chat_id = settings.get("telegram_user_id", "")
+    if not token or not chat_id:
+        print("  ⚠️  Telegram enabled but bot token or telegram_user_id missing")
+        return None
+
+    return TelegramNotifier(
+        token,
+        chat_id,
+        window_seconds=settings.get("digest_window_seconds", 30),
+        max_batch=settings.get("digest_max_events", 20)
+    )
+
+
+if __name__ == "__main__":
+    # Send a test digest using config.json
+    test_notifier = notifier_from_config(load_config())
+    if test_notifier:
+        test_notifier.notify("Test event from notifier.py")
+        test_notifier.notify("Test urgent event", urgent=True)
+        test_notifier.close()
+        print(test_notifier.stats())
@@ -5,62 +5,278 @@ Syncs job applications to Notion database for tracking.
 """
 
 import os
+import re
 import json
-from typing import List, Dict
+import time
+from typing import List, Dict, Tuple, Optional
 from datetime import datetime
 
-try:
-    import requests
-except ImportError:
-    requests = None
+from company_names import normalize_company
+from quota import spend, QuotaExceeded
+from settings import settings
+
+# Overridable so the sync can be exercised against a local mock server
+NOTION_API_BASE = os.getenv("NOTION_API_BASE", "https://api.notion.com/v1")
+NOTION_VERSION = "2022-06-28"
+
+# Properties written by sync_to_notion and the Notion type each must have
+EXPECTED_PROPERTIES = {
+    "Company": "title",
+    "Role": "rich_text",
+    "Location": "select",
+    "Match Score": "number",
+    "Status": "select",
+    "Job URL": "url",
+    "Date Found": "date"
+}
+
+DEFAULT_STATUS = "Not Applied"
+SCHEMA_CACHE_PATH = "notion_schema.json"
+SCHEMA_TTL_SECONDS = 6 * 3600
+RICH_TEXT_LIMIT = 2000
+
+# Writes past the per-minute limit wait for the next minute rather than the next run
+MINUTE_WAIT_SECONDS = 65
 
 
 def load_notion_token() -> str:
-    """Load Notion API token from credentials file."""
-    creds_path = "../credentials/notion.md"
+    """Load Notion API token from NOTION_TOKEN or credentials/notion.md."""
+    if os.getenv('NOTION_TOKEN'):
+        return os.environ['NOTION_TOKEN']
+    
+    # The token may sit anywhere in the file; Notion tokens start with ntn_
+    match = re.search(r'ntn_\S+', settings.credential_text("notion"))
+    return match.group(0) if match else ''
+
+
+def load_database_id() -> str:
+    """Load Notion database ID from the active config (NOTION_DATABASE_ID overrides)."""
+    return settings.config().get('notion_database_id', '')
+
+
+def _notion_headers(token: str) -> Dict[str, str]:
+    """Standard headers for Notion API requests."""
+    return {
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json",
+        "Notion-Version": NOTION_VERSION
+    }
+
+
+def schema_cache_path() -> str:
+    """Schema cache file from config.json "notion_schema_path", resolved against the project root."""
+    path = settings.config().get("notion_schema_path", SCHEMA_CACHE_PATH)
+    return settings.resolve(path) if path else ""
+
+
+def fetch_database_schema(token: str, database_id: str, cache_path: Optional[str] = SCHEMA_CACHE_PATH,
+                          ttl_seconds: int = SCHEMA_TTL_SECONDS) -> Dict[str, Dict]:
+    """
+    Get the database's property schema, cached on disk with a TTL.
     
-    if not os.path.exists(creds_path):
-        creds_path = "credentials/notion.md"
+    Args:
+        token: Notion integration token
+        database_id: Notion database ID
+        cache_path: Cache file ("" or None disables caching)
+        ttl_seconds: Maximum age of a cached schema
+        
+    Returns:
+        Mapping of property name to Notion property object (type, options)
+    """
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'r') as f:
+                cached = json.load(f)
+            if cached.get("database_id") == database_id and time.time() - cached["fetched_at"] < ttl_seconds:
+                return cached["properties"]
+        except (OSError, json.JSONDecodeError, KeyError):
+            pass
     
-    if os.path.exists(creds_path):
-        with open(creds_path, 'r') as f:
-            content = f.read()
-            # Look for token pattern
-            if 'ntn_' in content:
-                # Extract token
-                for line in content.split('\n'):
-                    if 'ntn_' in line:
-                        # Extract token from line
-                        parts = line.split('ntn_')
-                        if len(parts) > 1:
-                            return 'ntn_' + parts[1].split()[0].strip()
+    import requests
+    spend("notion")
+    response = requests.get(f"{NOTION_API_BASE}/databases/{database_id}", headers=_notion_headers(token))
+    if response.status_code != 200:
+        raise Exception(f"{response.status_code} - {response.text[:200]}")
+    properties = response.json().get("properties", {})
     
-    # Fallback to environment variable
-    return os.getenv('NOTION_TOKEN', '')
+    if cache_path:
+        with open(cache_path, 'w') as f:
+            json.dump({"database_id": database_id, "fetched_at": time.time(), "properties": properties}, f)
+    return properties
 
 
-def load_database_id() -> str:
-    """Load Notion database ID from config."""
-    config_path = "config.json"
-    if os.path.exists(config_path):
-        with open(config_path, 'r') as f:
-            config = json.load(f)
-            return config.get('notion_database_id', '')
+def check_schema(schema: Dict[str, Dict]) -> List[str]:
+    """
+    Compare the database schema with the properties sync_to_notion writes.
+    
+    Args:
+        schema: Property schema from fetch_database_schema
+        
+    Returns:
+        List of problems (empty if the schema is usable)
+    """
+    problems = []
+    for name, expected_type in EXPECTED_PROPERTIES.items():
+        prop = schema.get(name)
+        if prop is None:
+            problems.append(f"missing property '{name}' ({expected_type})")
+        elif prop.get("type") != expected_type:
+            problems.append(f"property '{name}' is {prop.get('type')}, expected {expected_type}")
+    
+    status_options = _select_options(schema.get("Status", {}))
+    if "Status" in schema and DEFAULT_STATUS.lower() not in {o.lower() for o in status_options}:
+        problems.append(f"Status has no '{DEFAULT_STATUS}' option")
+    return problems
+
+
+def _select_options(prop: Dict) -> List[str]:
+    return [option["name"] for option in prop.get("select", {}).get("options", [])]
+
+
+def match_select_option(value: str, options: List[str], fallback: str = "Canada") -> str:
+    """
+    Map a free-form location onto an existing select option.
+    
+    Tries an exact (case-insensitive) match, then a match on the city part
+    ("Toronto" for "Toronto, ON"), then the fallback option if it exists.
+    Values with no match become a new option, minus the commas Notion
+    rejects in option names.
+    
+    Args:
+        value: Location string from the job
+        options: Existing option names
+        fallback: Option to use when nothing matches
+        
+    Returns:
+        Option name to write
+    """
+    by_name = {option.lower(): option for option in options}
+    if value.lower() in by_name:
+        return by_name[value.lower()]
     
-    return os.getenv('NOTION_DATABASE_ID', '')
+    city = value.split(",")[0].strip().lower()
+    for option in options:
+        if option.split(",")[0].strip().lower() == city:
+            return option
+    
+    return by_name.get(fallback.lower(), value.replace(",", "")[:100])
+
+
+def _rich_text(content: str) -> List[Dict]:
+    return [{"text": {"content": content[:RICH_TEXT_LIMIT]}}]
+
+
+def build_properties(job: Dict, schema: Dict[str, Dict]) -> Dict:
+    """
+    Build a page's properties, normalized to the database schema.
+    
+    Args:
+        job: Job dictionary
+        schema: Property schema from fetch_database_schema
+        
+    Returns:
+        Notion properties object
+    """
+    location = match_select_option(job.get("location") or "Canada", _select_options(schema["Location"]))
+    status = next((o for o in _select_options(schema["Status"]) if o.lower() == DEFAULT_STATUS.lower()),
+                  DEFAULT_STATUS)
+    
+    return {
+        "Company": {"title": _rich_text(normalize_company(job.get("company") or "") or "Unknown")},
+        "Role": {"rich_text": _rich_text(job.get("title") or "Unknown")},
+        "Location": {"select": {"name": location}},
+        "Match Score": {"number": job.get("match_score", 0)},
+        "Status": {"select": {"name": status}},
+        "Job URL": {"url": job.get("url") or None},
+        "Date Found": {"date": {"start": datetime.now().isoformat()[:10]}}
+    }
+
+
+def _page_status(page: Dict) -> Dict:
+    """Extract the fields the pipeline tracks from a Notion page object."""
+    properties = page.get("properties", {})
+    status = (properties.get("Status", {}).get("select") or {}).get("name", "")
+    return {
+        "page_id": page.get("id", ""),
+        "url": properties.get("Job URL", {}).get("url") or "",
+        "status": status,
+        "last_edited": page.get("last_edited_time", "")
+    }
+
+
+def pull_status_changes(since: str = "", page_size: int = 100) -> Tuple[List[Dict], str]:
+    """
+    Fetch rows edited in Notion since the last sync cursor.
+    
+    Queries the database filtered on last_edited_time, so each pull costs
+    requests proportional to the rows that changed, not the database size.
+    
+    Args:
+        since: ISO timestamp cursor from the previous pull ("" for a full pull)
+        page_size: Rows per query request (Notion maximum is 100)
+        
+    Returns:
+        Tuple of (changes, new_cursor); each change has page_id, url,
+        status and last_edited
+    """
+    try:
+        import requests
+    except ImportError:
+        raise ImportError("requests library not installed. Install with: pip install requests")
+    
+    token = load_notion_token()
+    database_id = load_database_id()
+    if not token or not database_id:
+        raise ValueError("Notion token or database ID not configured")
+    
+    query = {
+        "page_size": page_size,
+        "sorts": [{"timestamp": "last_edited_time", "direction": "ascending"}]
+    }
+    if since:
+        # Notion rounds edit times to the minute, so on_or_after may repeat a few rows
+        query["filter"] = {"timestamp": "last_edited_time", "last_edited_time": {"on_or_after": since}}
+    
+    changes = []
+    cursor = since
+    with requests.Session() as session:
+        session.headers.update(_notion_headers(token))
+        while True:
+            spend("notion")
+            response = session.post(f"{NOTION_API_BASE}/databases/{database_id}/query", json=query)
+            if response.status_code != 200:
+                raise Exception(f"Notion query failed: {response.status_code} - {response.text[:200]}")
+            
+            data = response.json()
+            for page in data.get("results", []):
+                change = _page_status(page)
+                if change["status"]:
+                    changes.append(change)
+                cursor = max(cursor, change["last_edited"])
+            
+            if not data.get("has_more"):
+                break
+            query["start_cursor"] = data["next_cursor"]
+    
+    return changes, cursor
 
 
 def sync_to_notion(jobs: List[Dict]) -> bool:
     """
     Sync job applications to Notion database.
     
+    The id of each created page is written back to job["notion_page_id"].
+    
     Args:
         jobs: List of job dictionaries
         
     Returns:
         True if successful, False otherwise
     """
-    if not requests:
+    # Imported here so callers that never sync don't pay for requests at startup
+    try:
+        import requests
+    except ImportError:
         print("  ⚠️  requests library not installed. Install with: pip install requests")
         return False
     
@@ -75,53 +291,61 @@ def sync_to_notion(jobs: List[Dict]) -> bool:
         print("  ⚠️  Notion database ID not found. Add to config.json")
         return False
     
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-        "Notion-Version": "2022-06-28"
-    }
+    headers = _notion_headers(token)
     
-    success_count = 0
+    # Validate every page against the live schema before spending any writes
+    cache_path = schema_cache_path()
+    try:
+        schema = fetch_database_schema(token, database_id, cache_path)
+        problems = check_schema(schema)
+        if problems and cache_path:
+            # The cached copy may predate a fix made in Notion; ask once more before giving up
+            schema = fetch_database_schema(token, database_id, cache_path, ttl_seconds=0)
+            problems = check_schema(schema)
+    except Exception as e:
+        print(f"  ❌ Could not load Notion database schema: {e}")
+        return False
     
+    if problems:
+        print("  ❌ Notion database schema does not match; no pages were written:")
+        for problem in problems:
+            print(f"     - {problem}")
+        return False
+    
+    pages = []
     for job in jobs:
         try:
-            # Prepare page data
-            page_data = {
-                "parent": {"database_id": database_id},
-                "properties": {
-                    "Company": {
-                        "title": [{"text": {"content": job.get("company", "Unknown")}}]
-                    },
-                    "Role": {
-                        "rich_text": [{"text": {"content": job.get("title", "Unknown")}}]
-                    },
-                    "Location": {
-                        "select": {"name": job.get("location", "Canada")}
-                    },
-                    "Match Score": {
-                        "number": job.get("match_score", 0)
-                    },
-                    "Status": {
-                        "select": {"name": "Not Applied"}
-                    },
-                    "Job URL": {
-                        "url": job.get("url", "")
-                    },
-                    "Date Found": {
-                        "date": {"start": datetime.now().isoformat()[:10]}
-                    }
-                }
-            }
-            
+            pages.append({"parent": {"database_id": database_id}, "properties": build_properties(job, schema)})
+        except Exception as e:
+            problems.append(f"{job.get('company')} - {job.get('title')}: {e}")
+    if problems:
+        print("  ❌ Could not build every Notion page; no pages were written:")
+        for problem in problems:
+            print(f"     - {problem}")
+        return False
+    
+    success_count = 0
+    
+    for i, (job, page_data) in enumerate(zip(jobs, pages)):
+        try:
+            spend("notion", max_wait=MINUTE_WAIT_SECONDS)
+        except QuotaExceeded as e:
+            # Only day/month limits get here; unsynced jobs have no page id, so the next sync picks them up
+            print(f"  ⚠️  {e}; {len(jobs) - i} job(s) left for the next sync")
+            break
+        
+        try:
             # Create page in Notion
             response = requests.post(
-                "https://api.notion.com/v1/pages",
+                f"{NOTION_API_BASE}/pages",
                 headers=headers,
                 json=page_data
             )
             
             if response.status_code == 200:
                 success_count += 1
+                # Lets the caller remember the page for later status pulls
+                job["notion_page_id"] = response.json().get("id", "")
             else:
                 print(f"  ⚠️  Failed to sync {job.get('company')}: {response.status_code}")
                 
@@ -132,6 +356,49 @@ def sync_to_notion(jobs: List[Dict]) -> bool:
     return success_count > 0
 
 
+def push_status_changes(changes: List[Dict]) -> List[str]:
+    """
+    Write statuses found outside Notion (e.g. from email) to existing pages.
+
+    Args:
+        changes: Dictionaries with url, status and notion_page_id
+
+    Returns:
+        URLs of the jobs whose page was updated
+    """
+    try:
+        import requests
+    except ImportError:
+        print("  ⚠️  requests library not installed. Install with: pip install requests")
+        return []
+
+    token = load_notion_token()
+    if not token:
+        print("  ⚠️  Notion token not found. Add to credentials/notion.md")
+        return []
+
+    pushed = []
+    with requests.Session() as session:
+        session.headers.update(_notion_headers(token))
+        for change in changes:
+            properties = {"Status": {"select": {"name": change["status"]}}}
+            try:
+                spend("notion", max_wait=MINUTE_WAIT_SECONDS)
+                response = session.patch(f"{NOTION_API_BASE}/pages/{change['notion_page_id']}",
+                                         json={"properties": properties})
+            except QuotaExceeded as e:
+                print(f"  ⚠️  {e}; remaining statuses stay pending")
+                break
+            except Exception as e:
+                print(f"  ⚠️  Error updating status for {change['url']}: {e}")
+                continue
+            if response.status_code == 200:
+                pushed.append(change["url"])
+            else:
+                print(f"  ⚠️  Failed to update status for {change['url']}: {response.status_code}")
+    return pushed
+
+
 def create_database_template():
     """Print instructions for creating Notion database."""
     print("""
@@ -0,0 +1,163 @@
+"""
+PDF Renderer Module - Batch PDF Rendering of Application Packages
+
+Converts the HTML files in every generated package to submit-ready PDFs
+with a single shared headless Chromium instance (via Playwright), rendering
+several pages in parallel. Packages whose HTML has not changed since the
+last render are skipped using a content-hash manifest.
+
+Setup:
+    pip install playwright
+    playwright install chromium
+"""
+
+import asyncio
+import glob
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import List, Dict
+
+try:
+    from playwright.async_api import async_playwright
+except ImportError:
+    async_playwright = None
+
+
+MANIFEST_NAME = ".pdf_manifest.json"
+
+
+def find_html_files(root: str) -> List[str]:
+    """Return every HTML file inside the package directories under root."""
+    return sorted(glob.glob(os.path.join(root, "**", "*.html"), recursive=True))
+
+
+def _file_hash(path: str) -> str:
+    """SHA-256 of a file's contents."""
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _load_manifest(root: str) -> Dict[str, str]:
+    try:
+        with open(os.path.join(root, MANIFEST_NAME), 'r') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _save_manifest(root: str, manifest: Dict[str, str]) -> None:
+    path = os.path.join(root, MANIFEST_NAME)
+    with open(f"{path}.tmp", 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(f"{path}.tmp", path)
+
+
+def count_pdf_pages(pdf_bytes: bytes) -> int:
+    """Count pages in a PDF by its /Type /Page objects."""
+    return max(1, pdf_bytes.count(b"/Type /Page") - pdf_bytes.count(b"/Type /Pages"))
+
+
+def select_changed(root: str, force: bool = False) -> Dict[str, str]:
+    """
+    Find HTML files that are new or changed since their last render.
+
+    Args:
+        root: Applications directory
+        force: Re-render everything
+
+    Returns:
+        Mapping of HTML path to its current content hash
+    """
+    manifest = {} if force else _load_manifest(root)
+    changed = {}
+    for html_path in find_html_files(root):
+        key = os.path.relpath(html_path, root)
+        digest = _file_hash(html_path)
+        pdf_path = os.path.splitext(html_path)[0] + ".pdf"
+        if manifest.get(key) != digest or not os.path.exists(pdf_path):
+            changed[html_path] = digest
+    return changed
+
+
+async def _render_all(html_files: List[str], workers: int, page_format: str) -> Dict[str, int]:
+    """Render files with one browser and up to `workers` concurrent pages."""
+    semaphore = asyncio.Semaphore(workers)
+    results = {}
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch()
+        context = await browser.new_context()
+
+        async def render(html_path: str):
+            async with semaphore:
+                page = await context.new_page()
+                try:
+                    await page.goto(Path(html_path).resolve().as_uri(), wait_until="load")
+                    pdf_bytes = await page.pdf(
+                        path=os.path.splitext(html_path)[0] + ".pdf",
+                        format=page_format,
+                        print_background=True
+                    )
+                    results[html_path] = count_pdf_pages(pdf_bytes)
+                except Exception as e:
+                    print(f"  ⚠️  Failed to render {html_path}: {e}")
+                finally:
+                    await page.close()
+
+        await asyncio.gather(*(render(path) for path in html_files))
+        await browser.close()
+
+    return results
+
+
+def render_packages(root: str, workers: int = 4, page_format: str = "Letter",
+                    force: bool = False) -> Dict:
+    """
+    Render all new or changed package HTML files under root to PDF.
+
+    Args:
+        root: Applications directory
+        workers: Number of pages rendered concurrently
+        page_format: Paper size passed to Chromium (e.g. "Letter", "A4")
+        force: Re-render files even if unchanged
+
+    Returns:
+        Stats dictionary with rendered, skipped, failed, pages, seconds
+        and pages_per_second
+    """
+    if async_playwright is None:
+        raise ImportError("playwright is required for PDF rendering. "
+                          "Install with: pip install playwright && playwright install chromium")
+
+    start = time.perf_counter()
+    all_files = find_html_files(root)
+    changed = select_changed(root, force=force)
+
+    rendered = asyncio.run(_render_all(list(changed), workers, page_format)) if changed else {}
+
+    manifest = {} if force else _load_manifest(root)
+    for html_path, pages in rendered.items():
+        manifest[os.path.relpath(html_path, root)] = changed[html_path]
+    if rendered:
+        _save_manifest(root, manifest)
+
+    seconds = time.perf_counter() - start
+    pages = sum(rendered.values())
+    return {
+        "rendered": len(rendered),
+        "skipped": len(all_files) - len(changed),
+        "failed": len(changed) - len(rendered),
+        "pages": pages,
+        "seconds": round(seconds, 2),
+        "pages_per_second": round(pages / seconds, 1) if seconds and pages else 0.0
+    }
+
+
+if __name__ == "__main__":
+    # Render every package under ../applications
+    stats = render_packages("../applications")
+    print(f"Rendered {stats['rendered']} file(s), {stats['pages']} page(s) in {stats['seconds']}s "
+          f"({stats['pages_per_second']} pages/s); skipped {stats['skipped']}, failed {stats['failed']}")
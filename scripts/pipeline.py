@@ -16,30 +16,27 @@ Date: February 2026
 """
 
 import argparse
+import glob
+import importlib.util
 import json
 import os
 import sys
-from datetime import datetime
-from typing import List, Dict, Any
+import time
+from datetime import datetime, timezone
+from typing import List, Dict, Optional
 
-# Import pipeline modules
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+__version__ = "1.1.0"
 
-try:
-    from job_search import search_brave_jobs
-    from resume_generator import generate_application_package
-    from notion_sync import sync_to_notion
-except ImportError as e:
-    print(f"Error importing modules: {e}")
-    print("Make sure all required scripts are in the scripts/ folder")
-    sys.exit(1)
+# Pipeline stage modules are imported inside the methods that use them so
+# that a run only pays for the stages (and dependencies) it actually needs.
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 
 class JobPipeline:
     """Main pipeline orchestrator for job application automation."""
     
-    def __init__(self, config_path: str = "config.json"):
-        """Initialize pipeline with configuration."""
+    def __init__(self, config_path: Optional[str] = None):
+        """Initialize pipeline with configuration (default: PIPELINE_CONFIG or config.json)."""
         self.config = self._load_config(config_path)
         self.results = {
             "jobs_found": [],
@@ -47,8 +44,14 @@ class JobPipeline:
             "applications_generated": [],
             "errors": []
         }
+        self.search_stats = {}
+        self.yield_tracker = None
+        self.new_urls = set()
+        self.notifier = None
+        self.journal = None
+        self.run_id = datetime.now().strftime('%Y%m%d_%H%M%S')
     
-    def _load_config(self, config_path: str) -> Dict:
+    def _load_config(self, config_path: Optional[str]) -> Dict:
         """Load configuration from JSON file."""
         default_config = {
             "search_terms": [
@@ -60,13 +63,97 @@ class JobPipeline:
             "match_threshold": 80,
             "max_jobs": 50,
             "output_dir": "applications",
-            "templates_dir": "templates"
+            "templates_dir": "templates",
+            "history_dir": "history",
+            "store_path": "jobs.db",
+            "notion_schema_path": "notion_schema.json",
+            "profiles": [],
+            "search": {
+                "plan": None,
+                "workers": 6,
+                "cache_path": "search_cache.json",
+                "cache_ttl_hours": 12,
+                "timeout": 10,
+                # Each hedged duplicate is a billed Brave call
+                "hedge": False,
+                "hedge_percentile": 95,
+                "breaker_failures": 5,
+                "breaker_reset_seconds": 60,
+                "latency_path": "search_latency.json"
+            },
+            "search_budget": {
+                "enabled": False,
+                # None: the requests the plan makes without a budget, so spend does not change
+                "requests_per_run": None,
+                "exploration": 0.5,
+                # Pages a productive term may take from unproductive ones within the budget
+                "default_pages": 3,
+                "stats_path": "search_yield.json"
+            },
+            "enrichment": {
+                "cache_dir": "page_cache",
+                "workers": 8,
+                "timeout": 10
+            },
+            "queue": {
+                "path": "work_queue.db",
+                "lease_seconds": 300,
+                "max_attempts": 3,
+                "retry_delay": 30,
+                "poll_seconds": 2
+            },
+            "quota": {
+                "path": "quota.db",
+                "reserve": 0.2,
+                "providers": {
+                    "brave": {"per_minute": 60, "per_month": 2000},
+                    "notion": {"per_minute": 180},
+                    "gmail": {"per_minute": 15000},
+                    "web": {"per_minute": 120}
+                }
+            },
+            "packages": {
+                "layout": "flat",
+                "bundle": False
+            },
+            "journal": {
+                "enabled": True,
+                "path": "journal",
+                "compact_events": 20000
+            },
+            "api": {
+                "host": "127.0.0.1",
+                "port": 8765,
+                "page_size": 50,
+                "max_page_size": 500
+            },
+            "pdf": {
+                "workers": 4,
+                "format": "Letter"
+            },
+            "selection": {
+                "top_k": 0,
+                "per_company": None,
+                "per_location": None
+            },
+            "similarity": {
+                "enabled": False,
+                "boost": 10,
+                "floor": 0.03,
+                "ceiling": 0.2
+            },
+            "notification_settings": {
+                "telegram_enabled": False,
+                "telegram_user_id": "",
+                "digest_window_seconds": 30
+            }
         }
         
-        if os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                return {**default_config, **json.load(f)}
-        return default_config
+        # The shared registry caches the file, merges it over the defaults,
+        # applies environment overrides, resolves paths and makes this the
+        # config every other module sees
+        from settings import load_config
+        return load_config(config_path, defaults=default_config)
     
     def search_jobs(self) -> List[Dict]:
         """
@@ -76,28 +163,97 @@ class JobPipeline:
             List of job dictionaries with title, company, url, description
         """
         print("🔍 Searching for jobs...")
+        from search_plan import SearchEngine, expand_plan, load_plan, plan_from_terms
         
-        jobs = []
-        for term in self.config["search_terms"]:
-            try:
-                results = search_brave_jobs(term, count=10)
-                jobs.extend(results)
-                print(f"  Found {len(results)} jobs for: {term}")
-            except Exception as e:
-                self.results["errors"].append(f"Search error for '{term}': {e}")
+        settings = self.config["search"]
+        # A plan file (e.g. search_plan.json) replaces search_terms rather than adding to them
+        if settings.get("plan") and os.path.exists(settings["plan"]):
+            plan = load_plan(settings["plan"])
+        else:
+            if settings.get("plan"):
+                print(f"⚠️  Search plan {settings['plan']} not found; using search_terms")
+            plan = plan_from_terms(self.config["search_terms"])
         
-        # Remove duplicates based on URL
-        seen_urls = set()
-        unique_jobs = []
-        for job in jobs:
-            if job['url'] not in seen_urls:
-                seen_urls.add(job['url'])
-                unique_jobs.append(job)
+        budget = self.config["search_budget"]
+        if budget.get("enabled"):
+            from search_budget import YieldTracker
+            self.yield_tracker = YieldTracker(budget.get("stats_path", "search_yield.json"))
+            requests = budget.get("requests_per_run") or len(expand_plan(plan))
+            plan = self.yield_tracker.allocate(
+                plan,
+                budget=requests,
+                exploration=budget.get("exploration", 0.5),
+                default_pages=budget.get("default_pages", 3)
+            )
+        
+        engine = SearchEngine(
+            cache_path=settings.get("cache_path") or None,
+            ttl_hours=settings.get("cache_ttl_hours", 12),
+            workers=settings.get("workers", 6),
+            timeout=settings.get("timeout", 10),
+            hedge=settings.get("hedge", False),
+            hedge_percentile=settings.get("hedge_percentile", 95),
+            breaker_failures=settings.get("breaker_failures", 5),
+            breaker_reset_seconds=settings.get("breaker_reset_seconds", 60),
+            latency_path=settings.get("latency_path") or None
+        )
+        outcome = engine.run(plan)
+        self.search_stats = outcome["stats"]
+        
+        health = outcome["health"]
+        if health["hedged"] or health["timeouts"] or health["short_circuited"]:
+            print(f"  Brave health: {health['hedged']} hedged ({health['hedge_wins']} won), "
+                  f"{health['timeouts']} timed out, {health['short_circuited']} short-circuited, "
+                  f"circuit {health['breaker']}")
+        if health["deferred"] or health["hedges_skipped"]:
+            print(f"  Deferred {health['deferred']} low-priority request(s) and skipped "
+                  f"{health['hedges_skipped']} hedge(s) to save Brave quota")
+        
+        for term, term_stats in outcome["stats"].items():
+            print(f"  Found {term_stats['new_jobs']} new jobs for: {term}")
+        self.results["errors"].extend(outcome["errors"])
+        
+        # The engine already removed duplicate URLs across all queries
+        unique_jobs = outcome["jobs"]
+        
+        self.new_urls = self._store_jobs(unique_jobs)
+        self._journal("found", unique_jobs)
+        
+        if self.yield_tracker and not unique_jobs:
+            # Nothing reaches scoring, but terms that found nothing still need their calls recorded
+            self._record_search_yield([])
         
         self.results["jobs_found"] = unique_jobs[:self.config["max_jobs"]]
         print(f"✅ Total unique jobs found: {len(self.results['jobs_found'])}")
         return self.results["jobs_found"]
     
+    def enrich_jobs(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Replace search snippets with the full text of each posting page.
+        
+        Args:
+            jobs: List of shortlisted job dictionaries
+            
+        Returns:
+            The same jobs with full descriptions where available
+        """
+        print("🌐 Fetching posting pages...")
+        from job_enrich import enrich_jobs
+        
+        settings = self.config["enrichment"]
+        stats = enrich_jobs(
+            jobs,
+            cache_dir=settings.get("cache_dir", "page_cache"),
+            workers=settings.get("workers", 8),
+            timeout=settings.get("timeout", 10)
+        )
+        if stats["error"]:
+            self.results["errors"].append(f"Enrichment failed for {stats['error']} posting(s)")
+        
+        print(f"✅ Enriched {stats['fetched']} fetched, {stats['not_modified']} unchanged, "
+              f"{stats['error']} failed" + (f", {stats['deferred']} deferred (quota)" if stats['deferred'] else ""))
+        return jobs
+    
     def score_jobs(self, jobs: List[Dict]) -> List[Dict]:
         """
         Score jobs based on relevance to candidate profile.
@@ -108,6 +264,14 @@ class JobPipeline:
         - Company: 20%
         - Salary/Other: 10%
         
+        Every job is scored against all configured profiles in one pass
+        and routed to the best-fitting one (job['profile']).
+        
+        With similarity scoring enabled, the rule-based score gets a boost
+        of up to similarity.boost points from its TF-IDF similarity to the
+        candidate profile, scaled between similarity.floor and
+        similarity.ceiling.
+        
         Args:
             jobs: List of job dictionaries
             
@@ -115,70 +279,118 @@ class JobPipeline:
             List of jobs with match_score added
         """
         print("📊 Scoring job matches...")
+        from profile_matcher import ProfileScorer
         
-        scored_jobs = []
-        for job in jobs:
-            score = self._calculate_match_score(job)
-            job['match_score'] = score
-            scored_jobs.append(job)
+        scorer = ProfileScorer(self.config["profiles"])
+        scored_jobs = scorer.score(list(jobs))
+        
+        if len(scorer.profiles) > 1:
+            routed = {}
+            for job in scored_jobs:
+                routed[job['profile']] = routed.get(job['profile'], 0) + 1
+            print("  Routed: " + ", ".join(f"{name} {count}" for name, count in routed.items()))
+        
+        if self.config["similarity"].get("enabled") and scored_jobs:
+            self._blend_similarity(scored_jobs)
         
-        # Sort by score descending
-        scored_jobs.sort(key=lambda x: x['match_score'], reverse=True)
+        self._store_jobs(scored_jobs)
+        self._journal("scored", scored_jobs)
         
-        # Filter by threshold
-        filtered = [j for j in scored_jobs if j['match_score'] >= self.config['match_threshold']]
+        selection = self.config["selection"]
+        if selection.get("top_k"):
+            # Bounded work downstream: only the best top_k (within caps) go on
+            from selection import select_top_k
+            filtered = select_top_k(
+                scored_jobs,
+                k=selection["top_k"],
+                threshold=self.config['match_threshold'],
+                per_company=selection.get("per_company"),
+                per_location=selection.get("per_location")
+            )
+        else:
+            # Sort by score descending
+            scored_jobs.sort(key=lambda x: x['match_score'], reverse=True)
+            
+            # Filter by threshold
+            filtered = [j for j in scored_jobs if j['match_score'] >= self.config['match_threshold']]
         
         self.results["jobs_scored"] = filtered
-        print(f"✅ Jobs above {self.config['match_threshold']}% threshold: {len(filtered)}")
+        if selection.get("top_k"):
+            print(f"✅ Selected top {len(filtered)} of {len(scored_jobs)} jobs "
+                  f"(threshold {self.config['match_threshold']}%, limit {selection['top_k']})")
+        else:
+            print(f"✅ Jobs above {self.config['match_threshold']}% threshold: {len(filtered)}")
+        
+        if self.yield_tracker and self.search_stats:
+            # Credit every above-threshold job, not just those top_k kept
+            threshold = self.config['match_threshold']
+            self._record_search_yield([j for j in scored_jobs if j['match_score'] >= threshold])
+        if self.notifier:
+            self._notify_new_jobs(filtered)
         return filtered
     
-    def _calculate_match_score(self, job: Dict) -> int:
+    def _blend_similarity(self, jobs: List[Dict]) -> None:
+        """Boost each job's match_score by its profile similarity, in place."""
+        from similarity import SimilarityScorer, blend_scores, profile_text
+        from resume_generator import CANDIDATE_PROFILE
+        
+        settings = self.config["similarity"]
+        profile = f"{profile_text(CANDIDATE_PROFILE)} {profile_text(self.config.get('candidate_profile', {}))}"
+        scorer = SimilarityScorer(profile)
+        
+        similarities = scorer.score([f"{j.get('title', '')} {j.get('description', '')}" for j in jobs])
+        blended = blend_scores(
+            [j['match_score'] for j in jobs],
+            similarities,
+            boost=settings.get("boost", 10),
+            floor=settings.get("floor", 0.03),
+            ceiling=settings.get("ceiling", 0.2)
+        )
+        for job, similarity, score in zip(jobs, similarities, blended):
+            job['similarity'] = round(float(similarity), 3)
+            job['match_score'] = score
+    
+    def _notify_new_jobs(self, jobs: List[Dict]) -> None:
+        """Queue a Telegram alert for each high-scoring job first seen this run."""
+        settings = self.config["notification_settings"]
+        alert_score = settings.get("alert_score", self.config["match_threshold"])
+        for job in jobs:
+            if job["match_score"] >= alert_score and job.get("url") in self.new_urls:
+                self.notifier.notify(
+                    f"New job ({job['match_score']}%): {job.get('title', 'Unknown')[:80]} — "
+                    f"{job.get('company', 'Unknown')}, {job.get('location', '')}\n{job.get('url', '')}"
+                )
+    
+    def _record_search_yield(self, above_threshold: List[Dict]) -> None:
+        """Credit above-threshold jobs to their search terms for budget allocation."""
+        from search_budget import credit_terms
+        
+        summary = self.yield_tracker.record(self.search_stats, credit_terms(above_threshold))
+        try:
+            self.yield_tracker.save()
+        except OSError as e:
+            self.results["errors"].append(f"Search yield save error: {e}")
+        
+        self.results["search_yield"] = summary
+        print(f"  Above-threshold jobs per API call: {summary['above_threshold_per_call']} "
+              f"({summary['above_threshold']}/{summary['api_calls']})")
+    
+    def _store_jobs(self, jobs: List[Dict]) -> set:
         """
-        Calculate match score for a single job.
+        Persist jobs (with full descriptions) to the local search index.
         
-        Args:
-            job: Job dictionary with title, description, location
-            
         Returns:
-            Match score (0-100)
+            URLs of jobs the store had never seen before
         """
-        score = 0
-        content = f"{job.get('title', '')} {job.get('description', '')}".lower()
-        location = job.get('location', '').lower()
-        
-        # Location scoring (40%)
-        location_score = 0
-        if 'halifax' in location or 'nova scotia' in location:
-            location_score = 40  # Top priority
-        elif 'toronto' in location or 'ontario' in location:
-            location_score = 30  # Secondary
-        elif 'remote' in location or 'canada' in location:
-            location_score = 25
-        
-        # Skills scoring (30%)
-        skills_score = 0
-        skills_keywords = ['python', 'sql', 'power bi', 'data analysis', 'excel']
-        for skill in skills_keywords:
-            if skill in content:
-                skills_score += 6  # Max 30
-        skills_score = min(30, skills_score)
-        
-        # Experience level (20%)
-        experience_score = 0
-        if any(term in content for term in ['entry level', 'junior', '1-2 years', 'recent grad']):
-            experience_score = 20
-        elif '0-2 years' in content or 'new grad' in content:
-            experience_score = 18
-        
-        # Other factors (10%)
-        other_score = 0
-        if 'data analyst' in job.get('title', '').lower():
-            other_score += 5
-        if 'full-time' in content or 'permanent' in content:
-            other_score += 5
-        
-        total_score = location_score + skills_score + experience_score + other_score
-        return min(100, total_score)
+        try:
+            from job_store import JobStore
+            with JobStore(self.config["store_path"]) as store:
+                known = store.job_states([job.get("url", "") for job in jobs])
+                store.upsert_jobs(jobs)
+        except Exception as e:
+            self.results["errors"].append(f"Job store error: {e}")
+            return set()
+        return {job.get("url", "") for job in jobs} - set(known)
     
     def generate_applications(self, jobs: List[Dict]) -> List[str]:
         """
@@ -191,7 +403,12 @@ class JobPipeline:
             List of paths to generated application packages
         """
         print("📄 Generating application packages...")
+        from resume_generator import generate_application_package
+        from profile_matcher import ProfileScorer
         
+        profiles = ProfileScorer(self.config["profiles"])
+        packages = self.config["packages"]
+        jobs = self._skip_handled(jobs)
         generated = []
         for i, job in enumerate(jobs, 1):
             try:
@@ -200,17 +417,49 @@ class JobPipeline:
                 package_path = generate_application_package(
                     job=job,
                     template_dir=self.config['templates_dir'],
-                    output_dir=self.config['output_dir']
+                    output_dir=self.config['output_dir'],
+                    profile=profiles.get(job.get('profile', '')),
+                    layout=packages.get('layout', 'flat'),
+                    bundle=packages.get('bundle', False)
                 )
+                job['package_path'] = package_path
                 generated.append(package_path)
                 
             except Exception as e:
                 self.results["errors"].append(f"Generation error for {job.get('title', 'Unknown')}: {e}")
         
         self.results["applications_generated"] = generated
+        self._journal("generated", [job for job in jobs if job.get("package_path")])
         print(f"✅ Generated {len(generated)} application packages")
         return generated
     
+    def render_pdfs(self) -> Dict:
+        """
+        Render new or changed application packages to PDF.
+        
+        Returns:
+            Render stats (files, pages, seconds, pages per second)
+        """
+        print("🖨️  Rendering PDFs...")
+        
+        settings = self.config["pdf"]
+        try:
+            from pdf_renderer import render_packages
+            stats = render_packages(
+                self.config['output_dir'],
+                workers=settings.get("workers", 4),
+                page_format=settings.get("format", "Letter")
+            )
+        except Exception as e:
+            self.results["errors"].append(f"PDF render error: {e}")
+            print(f"❌ PDF rendering failed: {e}")
+            return {}
+        
+        self.results["pdf_render"] = stats
+        print(f"✅ Rendered {stats['rendered']} file(s) ({stats['skipped']} unchanged) — "
+              f"{stats['pages']} pages in {stats['seconds']}s ({stats['pages_per_second']} pages/s)")
+        return stats
+    
     def sync_to_notion(self, jobs: List[Dict]) -> bool:
         """
         Sync job data to Notion database.
@@ -222,9 +471,19 @@ class JobPipeline:
             True if successful, False otherwise
         """
         print("📓 Syncing to Notion...")
+        self.push_local_statuses()
+        
+        # Rows already in Notion (including ones moved to Applied/Rejected) are left alone
+        jobs = [job for job in self._skip_handled(jobs) if not job.get("notion_page_id")]
+        if not jobs:
+            print("✅ Nothing new to sync")
+            return True
         
         try:
+            from notion_sync import sync_to_notion
             success = sync_to_notion(jobs)
+            self._remember_notion_pages(jobs)
+            self._journal("synced", [job for job in jobs if job.get("notion_page_id")])
             if success:
                 print("✅ Notion sync complete")
             return success
@@ -233,8 +492,228 @@ class JobPipeline:
             print(f"❌ Notion sync failed: {e}")
             return False
     
+    def pull_from_notion(self) -> int:
+        """
+        Pull status changes made in Notion since the last pull.
+        
+        Returns:
+            Number of local jobs whose status was updated
+        """
+        print("📥 Pulling status changes from Notion...")
+        
+        try:
+            from notion_sync import pull_status_changes
+            from job_store import JobStore
+            with JobStore(self.config["store_path"]) as store:
+                cursor = store.get_state("notion_cursor")
+                changes, new_cursor = pull_status_changes(since=cursor)
+                updated = store.apply_status_changes(changes)
+                store.set_state("notion_cursor", new_cursor)
+            self._journal("status", [change for change in changes if change.get("status")])
+        except Exception as e:
+            self.results["errors"].append(f"Notion pull error: {e}")
+            print(f"❌ Notion pull failed: {e}")
+            return 0
+        
+        print(f"✅ {len(changes)} changed row(s) in Notion, {updated} local job(s) updated")
+        return updated
+    
+    def push_local_statuses(self) -> int:
+        """
+        Push statuses recorded locally (e.g. from recruiter emails) to their Notion pages.
+        
+        Returns:
+            Number of Notion pages updated
+        """
+        try:
+            from notion_sync import push_status_changes
+            from job_store import JobStore
+            with JobStore(self.config["store_path"]) as store:
+                pending = store.pending_statuses()
+                if not pending:
+                    return 0
+                pushed = push_status_changes(pending)
+                store.clear_pending_statuses(pushed)
+        except Exception as e:
+            self.results["errors"].append(f"Notion status push error: {e}")
+            print(f"❌ Notion status push failed: {e}")
+            return 0
+        
+        print(f"  Updated status on {len(pushed)}/{len(pending)} Notion page(s) from email")
+        return len(pushed)
+    
+    def _skip_handled(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Drop jobs already closed in Notion and attach known Notion page ids.
+        
+        Args:
+            jobs: List of job dictionaries
+            
+        Returns:
+            Jobs that still need pipeline work
+        """
+        try:
+            from job_store import JobStore, CLOSED_STATUSES
+            with JobStore(self.config["store_path"]) as store:
+                states = store.job_states([job.get("url", "") for job in jobs])
+        except Exception as e:
+            self.results["errors"].append(f"Job store error: {e}")
+            return jobs
+        
+        open_jobs = []
+        for job in jobs:
+            state = states.get(job.get("url", ""), {})
+            if state.get("status") in CLOSED_STATUSES:
+                continue
+            if state.get("notion_page_id"):
+                job["notion_page_id"] = state["notion_page_id"]
+            open_jobs.append(job)
+        
+        skipped = len(jobs) - len(open_jobs)
+        if skipped:
+            print(f"  Skipping {skipped} job(s) already handled in Notion")
+        return open_jobs
+    
+    def _remember_notion_pages(self, jobs: List[Dict]) -> None:
+        """Store the Notion page id of each newly synced job."""
+        pages = {job["url"]: job["notion_page_id"] for job in jobs
+                 if job.get("url") and job.get("notion_page_id")}
+        if not pages:
+            return
+        try:
+            from job_store import JobStore
+            with JobStore(self.config["store_path"]) as store:
+                store.set_notion_pages(pages)
+        except Exception as e:
+            self.results["errors"].append(f"Job store error: {e}")
+    
+    def _journal(self, kind: str, jobs: List[Dict]) -> None:
+        """Append this stage's changes to the event journal (see journal.py)."""
+        settings = self.config["journal"]
+        if not settings.get("enabled") or not jobs:
+            return
+        try:
+            if self.journal is None:
+                from journal import Journal
+                self.journal = Journal(settings.get("path", "journal"),
+                                       compact_events=settings.get("compact_events", 20000))
+            self.journal.record(kind, jobs, run=self.run_id)
+        except Exception as e:
+            self.results["errors"].append(f"Journal error: {e}")
+    
+    def _open_queue(self):
+        """Open the shared work queue configured under "queue"."""
+        from work_queue import WorkQueue
+        
+        settings = self.config["queue"]
+        return WorkQueue(
+            settings.get("path", "work_queue.db"),
+            lease_seconds=settings.get("lease_seconds", 300),
+            max_attempts=settings.get("max_attempts", 3),
+            retry_delay=settings.get("retry_delay", 30)
+        )
+    
+    def enqueue(self, kind: str, payloads: List[Dict], keys: List[str] = None) -> int:
+        """
+        Hand tasks to `pipeline.py worker` processes instead of running them here.
+        
+        Args:
+            kind: Task kind (search, generate or sync)
+            payloads: Task arguments
+            keys: Dedupe keys; tasks whose key is already pending are skipped
+            
+        Returns:
+            Number of tasks added
+        """
+        with self._open_queue() as queue:
+            added = queue.enqueue(kind, payloads, keys)
+        print(f"📮 Queued {added} {kind} task(s)" + (f" ({len(payloads) - added} already pending)"
+                                                    if added < len(payloads) else ""))
+        return added
+    
+    def run_task(self, task: Dict) -> None:
+        """
+        Execute one queued task.
+        
+        A search task runs search, enrichment and scoring here and queues
+        generate/sync tasks for the jobs it keeps.
+        
+        Raises:
+            RuntimeError: If the stage reported an error, so the task is retried
+        """
+        payload = task["payload"]
+        errors = len(self.results["errors"])
+        
+        if task["kind"] == "search":
+            self.run(search=True, score=payload.get("score", True), generate=payload.get("generate", True),
+                     sync=payload.get("sync", False), enrich=payload.get("enrich", False), queue=True)
+            # Search errors for single terms are normal; only a run that found nothing is retried
+            if not self.results["jobs_found"] and len(self.results["errors"]) > errors:
+                raise RuntimeError(self.results["errors"][-1])
+            return
+        
+        if task["kind"] == "generate":
+            self.generate_applications([payload["job"]])
+            ok = len(self.results["errors"]) == errors
+        elif task["kind"] == "sync":
+            ok = self.sync_to_notion(payload["jobs"])
+        else:
+            raise RuntimeError(f"Unknown task kind: {task['kind']}")
+        
+        if not ok:
+            raise RuntimeError(self.results["errors"][-1] if len(self.results["errors"]) > errors
+                               else f"{task['kind']} task failed")
+    
+    def work(self, drain: bool = False, max_tasks: int = None, kinds: List[str] = None) -> Dict:
+        """
+        Lease and run queued tasks until stopped.
+        
+        Args:
+            drain: Exit once no task is runnable instead of polling
+            max_tasks: Exit after this many tasks
+            kinds: Only take these task kinds
+            
+        Returns:
+            Counts of done, retried and failed tasks
+        """
+        from work_queue import worker_name
+        
+        worker = worker_name()
+        poll = self.config["queue"].get("poll_seconds", 2)
+        stats = {"done": 0, "retried": 0, "failed": 0}
+        print(f"👷 Worker {worker} started")
+        
+        with self._open_queue() as queue:
+            while max_tasks is None or sum(stats.values()) < max_tasks:
+                task = queue.lease(worker, kinds)
+                if task is None:
+                    if drain:
+                        break
+                    time.sleep(poll)
+                    continue
+                
+                print(f"⚙️  Task {task['id']} [{task['kind']}] attempt {task['attempts']}")
+                try:
+                    # Long searches and renders outlive one lease; keep it renewed until done
+                    with queue.heartbeat(task["id"], worker):
+                        self.run_task(task)
+                except Exception as e:
+                    state = queue.fail(task["id"], worker, str(e))
+                    stats["failed" if state == "failed" else "retried"] += 1
+                    print(f"  ❌ {e} ({state or 'lease lost'})")
+                else:
+                    if queue.complete(task["id"], worker):
+                        stats["done"] += 1
+                    else:
+                        print(f"  ⚠️  Lease on task {task['id']} expired before it finished")
+        
+        print(f"✅ Worker {worker}: {stats['done']} done, {stats['retried']} retried, {stats['failed']} failed")
+        return stats
+    
     def run(self, search: bool = True, score: bool = True, 
-            generate: bool = True, sync: bool = False) -> Dict:
+            generate: bool = True, sync: bool = False,
+            enrich: bool = False, pdf: bool = False,
+            pull: bool = False, queue: bool = False) -> Dict:
         """
         Run the complete pipeline.
         
@@ -243,6 +722,11 @@ class JobPipeline:
             score: Whether to score matches
             generate: Whether to generate applications
             sync: Whether to sync to Notion
+            enrich: Whether to fetch full posting pages before scoring
+            pdf: Whether to render generated packages to PDF
+            pull: Whether to pull status changes from Notion first
+            queue: Queue generation and sync as tasks for workers instead
+                of running them in this process
             
         Returns:
             Results dictionary
@@ -252,7 +736,17 @@ class JobPipeline:
         print(f"⏰ Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print("=" * 60)
         
+        if self.config["notification_settings"].get("telegram_enabled"):
+            from notifier import notifier_from_config
+            self.notifier = notifier_from_config(self.config)
+        
         try:
+            # Step 0: Learn which jobs were already handled in Notion, after
+            # pushing email-derived statuses so the pull cannot undo them
+            if pull:
+                self.push_local_statuses()
+                self.pull_from_notion()
+            
             # Step 1: Search
             if search:
                 jobs = self.search_jobs()
@@ -262,6 +756,10 @@ class JobPipeline:
             else:
                 jobs = self.results.get("jobs_found", [])
             
+            # Step 1b: Enrich
+            if enrich and jobs:
+                jobs = self.enrich_jobs(jobs)
+            
             # Step 2: Score
             if score and jobs:
                 jobs = self.score_jobs(jobs)
@@ -270,17 +768,35 @@ class JobPipeline:
                     return self.results
             
             # Step 3: Generate
-            if generate and jobs:
+            if generate and jobs and queue:
+                open_jobs = self._skip_handled(jobs)
+                self.enqueue("generate", [{"job": job} for job in open_jobs],
+                             keys=[f"generate:{job.get('url', '')}" for job in open_jobs])
+            elif generate and jobs:
                 self.generate_applications(jobs)
             
+            # Step 3b: Render PDFs
+            if pdf:
+                self.render_pdfs()
+            
             # Step 4: Sync to Notion
-            if sync and jobs:
+            if sync and jobs and queue:
+                self.enqueue("sync", [{"jobs": [job]} for job in jobs],
+                             keys=[f"sync:{job.get('url', '')}" for job in jobs])
+            elif sync and jobs:
                 self.sync_to_notion(jobs)
             
         except Exception as e:
             self.results["errors"].append(f"Pipeline error: {e}")
             print(f"❌ Pipeline error: {e}")
         
+        finally:
+            # Step 5: Flush pending alerts (sent in the background while stages
+            # ran), also when a stage stopped the pipeline early
+            if self.notifier:
+                self.notifier.close()
+                self.results["notifications"] = self.notifier.stats()
+        
         # Print summary
         print("=" * 60)
         print("📊 PIPELINE SUMMARY")
@@ -304,10 +820,15 @@ def main():
     parser = argparse.ArgumentParser(
         description="MAYAI Job Application Pipeline"
     )
+    parser.add_argument(
+        "--version", "-V",
+        action="version",
+        version=f"%(prog)s {__version__}"
+    )
     parser.add_argument(
         "--config", "-c",
-        default="config.json",
-        help="Path to configuration file"
+        default=None,
+        help="Path to configuration file (default: $PIPELINE_CONFIG or config.json)"
     )
     parser.add_argument(
         "--search", "-s",
@@ -334,32 +855,347 @@ def main():
         action="store_true",
         help="Run complete pipeline (search, score, generate)"
     )
+    parser.add_argument(
+        "--enrich", "-f",
+        action="store_true",
+        help="Fetch full posting pages before scoring"
+    )
+    parser.add_argument(
+        "--pull", "-u",
+        action="store_true",
+        help="Pull status changes from Notion before generating"
+    )
+    parser.add_argument(
+        "--pdf", "-p",
+        action="store_true",
+        help="Render new or changed application packages to PDF"
+    )
+    parser.add_argument(
+        "--export", "-e",
+        action="store_true",
+        help="Append this run to the columnar job history"
+    )
+    parser.add_argument(
+        "--queue", "-q",
+        action="store_true",
+        help="Queue the run as tasks for `pipeline.py worker` processes"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show the planned stages and configuration without running them"
+    )
+    
+    subparsers = parser.add_subparsers(dest="command")
+    
+    export_parser = subparsers.add_parser(
+        "export",
+        help="Backfill and compact the columnar job history"
+    )
+    export_parser.add_argument(
+        "results_files",
+        nargs="*",
+        help="pipeline_results_*.json files to import (default: ./pipeline_results_*.json)"
+    )
+    export_parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Merge per-run part files into one file per month"
+    )
+    
+    import_parser = subparsers.add_parser(
+        "import",
+        help="Stream old result dumps into the local job store"
+    )
+    import_parser.add_argument(
+        "paths",
+        nargs="*",
+        help="Dump files (default: pipeline_results_*.json, job_leads_top_8.json and other known dumps)"
+    )
+    import_parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=4,
+        help="Parser processes"
+    )
+    
+    worker_parser = subparsers.add_parser(
+        "worker",
+        help="Run queued search/generate/sync tasks (start one per process)"
+    )
+    worker_parser.add_argument(
+        "--drain",
+        action="store_true",
+        help="Exit when no task is runnable instead of waiting for more"
+    )
+    worker_parser.add_argument(
+        "--max-tasks",
+        type=int,
+        help="Exit after this many tasks"
+    )
+    worker_parser.add_argument(
+        "--kinds",
+        nargs="+",
+        choices=["search", "generate", "sync"],
+        help="Only run these task kinds"
+    )
+    
+    subparsers.add_parser(
+        "quota",
+        help="Show API quota used per provider this minute, day and month"
+    )
+    
+    journal_parser = subparsers.add_parser(
+        "journal",
+        help="Show event journal size and replay time, optionally compacting it"
+    )
+    journal_parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Fold all events into a new snapshot and drop covered segments"
+    )
+    
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Serve jobs, scores, packages and run stats over a read-only local HTTP API"
+    )
+    serve_parser.add_argument(
+        "--host",
+        help="Interface to bind (default: config api.host, 127.0.0.1)"
+    )
+    serve_parser.add_argument(
+        "--port", "-p",
+        type=int,
+        help="Port to listen on (default: config api.port, 8765)"
+    )
+    
+    query_parser = subparsers.add_parser(
+        "query",
+        help="Full-text search over stored job descriptions"
+    )
+    query_parser.add_argument(
+        "query",
+        help='Search query, e.g. \'tableau AND "nova scotia"\''
+    )
+    query_parser.add_argument(
+        "--days", "-d",
+        type=int,
+        help="Only include jobs seen in the last N days"
+    )
+    query_parser.add_argument(
+        "--limit", "-l",
+        type=int,
+        default=20,
+        help="Maximum number of results"
+    )
     
     args = parser.parse_args()
     
+    if args.command == "export":
+        export_history(args)
+        return
+    if args.command == "query":
+        query_jobs(args)
+        return
+    if args.command == "import":
+        import_archives(args)
+        return
+    if args.command == "quota":
+        quota_report(args)
+        return
+    if args.command == "journal":
+        journal_report(args)
+        return
+    if args.command == "serve":
+        serve_api(args)
+        return
+    if args.command == "worker":
+        JobPipeline(config_path=args.config).work(drain=args.drain, max_tasks=args.max_tasks, kinds=args.kinds)
+        return
+    
     # If --all is specified, enable all steps
     if args.all:
         args.search = args.score = args.generate = True
     
     # If no specific flags, run everything
-    if not any([args.search, args.score, args.generate, args.sync]):
+    if not any([args.search, args.score, args.generate, args.sync, args.pdf, args.pull]):
         args.search = args.score = args.generate = True
     
     # Initialize and run pipeline
     pipeline = JobPipeline(config_path=args.config)
+    
+    if args.dry_run:
+        describe_plan(pipeline, args)
+        return
+    
+    # Workers run the search; each one queues generate/sync tasks for what it finds
+    if args.queue and args.search:
+        pipeline.enqueue("search", [{"score": args.score, "generate": args.generate, "sync": args.sync,
+                                     "enrich": args.enrich}], keys=["search"])
+        return
+    
     results = pipeline.run(
         search=args.search,
         score=args.score,
         generate=args.generate,
-        sync=args.sync
+        sync=args.sync,
+        enrich=args.enrich,
+        pdf=args.pdf,
+        pull=args.pull,
+        queue=args.queue
     )
     
     # Save results to file
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    timestamp = pipeline.run_id
     results_file = f"pipeline_results_{timestamp}.json"
     with open(results_file, 'w') as f:
         json.dump(results, f, indent=2)
     print(f"\n💾 Results saved to: {results_file}")
+    
+    if args.export:
+        from history_export import export_run
+        try:
+            written = export_run(results, pipeline.config['history_dir'], run_id=timestamp)
+        except ImportError as e:
+            print(f"❌ History export failed: {e}")
+            return
+        print(f"📦 History updated: {len(written)} part file(s)")
+
+
+def describe_plan(pipeline: JobPipeline, args) -> None:
+    """Print the stages a run would execute, without importing or running them."""
+    stages = [
+        ("pull", args.pull, "notion_sync", "requests"),
+        ("search", args.search, "search_plan", None),
+        ("enrich", args.enrich, "job_enrich", None),
+        ("score", args.score, None, None),
+        ("generate", args.generate, "resume_generator", None),
+        ("pdf", args.pdf, "pdf_renderer", "playwright"),
+        ("sync", args.sync, "notion_sync", "requests"),
+        ("export", args.export, "history_export", "pandas"),
+    ]
+    
+    from settings import settings
+    print(f"🧪 Dry run (pipeline {__version__}, config: {settings.config_path})")
+    for name, enabled, module, dependency in stages:
+        if not enabled:
+            continue
+        # find_spec locates modules without executing them
+        missing = [m for m in (module, dependency) if m and importlib.util.find_spec(m) is None]
+        status = f"missing {', '.join(missing)}" if missing else "ready"
+        print(f"  • {name:<9} {status}")
+    
+    config = pipeline.config
+    print(f"  Search terms: {len(config['search_terms'])}, max jobs: {config['max_jobs']}, "
+          f"threshold: {config['match_threshold']}%")
+    print(f"  Output: {config['output_dir']}/, store: {config['store_path']}")
+
+
+def query_jobs(args):
+    """Print ranked full-text search results from the local job store."""
+    from job_store import JobStore, QueryError
+    config = JobPipeline(config_path=args.config).config
+    
+    with JobStore(config['store_path']) as store:
+        try:
+            matches = store.search(args.query, days=args.days, limit=args.limit)
+        except QueryError as e:
+            print(f"❌ Invalid query: {e}")
+            return
+    
+    print(f"🔎 {len(matches)} result(s) for: {args.query}")
+    for job in matches:
+        print(f"\n  [{job['match_score'] or '-'}] {job['title']} — {job['company']} ({job['location']})")
+        print(f"  {job['url']}")
+        print(f"  {job['snippet']}")
+
+
+def quota_report(args):
+    """Print API quota usage against the configured limits."""
+    JobPipeline(config_path=args.config)  # makes this config the active one
+    from quota import get_ledger
+    
+    rows = get_ledger().report()
+    print(f"📊 API quota ({datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M')} UTC)")
+    print(f"  {'Provider':<10} {'Window':<12} {'Used':>8} {'Limit':>8} {'Used %':>7}")
+    for row in rows:
+        if not row["limit"] and not row["used"]:
+            continue
+        limit = row["limit"] or "-"
+        percent = f"{row['percent']:.1f}" if row["percent"] is not None else "-"
+        warning = " ⚠️" if row["percent"] is not None and row["percent"] >= 80 else ""
+        print(f"  {row['provider']:<10} {row['window']:<12} {row['used']:>8} {limit:>8} {percent:>7}{warning}")
+
+
+def journal_report(args):
+    """Print event journal statistics and optionally compact it."""
+    from journal import Journal
+    settings = JobPipeline(config_path=args.config).config["journal"]
+    
+    journal = Journal(settings.get("path", "journal"), compact_events=0)
+    print(f"📜 Journal {settings.get('path', 'journal')}/: {len(journal.state)} jobs, "
+          f"{journal.pending_events} event(s) since the last snapshot, "
+          f"{journal.disk_usage() / 1024:.1f} KB, replayed in {journal.replay_seconds * 1000:.1f} ms")
+    if args.compact:
+        stats = journal.compact()
+        print(f"✅ Compacted {stats['events']} event(s), removed {stats['segments_removed']} segment(s), "
+              f"now {journal.disk_usage() / 1024:.1f} KB")
+
+
+def serve_api(args):
+    """Run the read-only HTTP API over the job store and generated packages."""
+    from api_server import JobAPI, serve
+    config = JobPipeline(config_path=args.config).config
+    settings = config["api"]
+    
+    api = JobAPI(
+        config['store_path'],
+        output_dir=config['output_dir'],
+        page_size=settings.get("page_size", 50),
+        max_page_size=settings.get("max_page_size", 500)
+    )
+    serve(api, host=args.host or settings.get("host", "127.0.0.1"), port=args.port or settings.get("port", 8765))
+
+
+def export_history(args):
+    """Backfill results dumps into the columnar history and optionally compact it."""
+    from history_export import backfill, compact_history
+    
+    config = JobPipeline(config_path=args.config).config
+    history_dir = config['history_dir']
+    
+    results_files = args.results_files or sorted(glob.glob("pipeline_results_*.json"))
+    try:
+        count = backfill(results_files, config['output_dir'], history_dir)
+    except ImportError as e:
+        print(f"❌ History export failed: {e}")
+        return
+    print(f"📦 Imported {count} records into {history_dir}/")
+    
+    if args.compact:
+        compacted = compact_history(history_dir)
+        print(f"🗜️  Compacted {compacted} partition(s)")
+
+
+def import_archives(args):
+    """Stream historical result dumps into the local job store."""
+    from archive_import import default_paths
+    from archive_import import import_archives as run_import
+    
+    config = JobPipeline(config_path=args.config).config
+    paths = args.paths or default_paths()
+    if not paths:
+        print("❌ No dump files found")
+        return
+    
+    print(f"📥 Importing {len(paths)} file(s) into {config['store_path']}...")
+    stats = run_import(paths, config['store_path'], workers=args.workers)
+    for error in stats['errors']:
+        print(f"  ⚠️  Skipped {error}")
+    if stats['bad_records']:
+        print(f"  ⚠️  Skipped {stats['bad_records']} unreadable record(s)")
+    print(f"✅ {stats['records']} records: {stats['written']} written, {stats['duplicates']} duplicates, "
+          f"{stats['unique_jobs']} unique jobs ({stats['records_per_second']}/s)")
 
 
 if __name__ == "__main__":
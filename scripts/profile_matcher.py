@@ -0,0 +1,182 @@
+"""
+Profile Matcher Module - Scoring Jobs Against Several Target Profiles at Once
+
+Each profile (e.g. Data Analyst, BI Analyst, Junior Data Scientist) is a
+set of keyword weights plus optional resume overrides:
+
+    {"name": "Business Intelligence Analyst",
+     "title_keywords": ["bi analyst", "business intelligence"],
+     "skills": {"power bi": 8, "tableau": 8, "sql": 6, "dashboard": 4},
+     "resume": {"summary": "...", "skills": ["Power BI", "Tableau", "SQL"]}}
+
+All keywords from all profiles are compiled into one shared matcher, so a
+job's text is scanned once; each profile then scores the matched keyword
+set with its own weight vector. Location, experience and job-type points
+are shared. The job is routed to its best-fitting profile.
+"""
+
+import re
+from typing import List, Dict, Set
+
+
+# Equivalent to the original single-profile scoring in pipeline.py
+DEFAULT_PROFILES = [
+    {
+        "name": "Data Analyst",
+        "title_keywords": ["data analyst"],
+        "skills": {"python": 6, "sql": 6, "power bi": 6, "data analysis": 6, "excel": 6}
+    }
+]
+
+ENTRY_LEVEL_TERMS = ["entry level", "junior", "1-2 years", "recent grad"]
+EARLY_CAREER_TERMS = ["0-2 years", "new grad"]
+JOB_TYPE_TERMS = ["full-time", "permanent"]
+
+PROVINCE_CODE = re.compile(r", ([A-Z]{2})\b")
+
+SKILLS_CAP = 30
+TITLE_POINTS = 5
+
+
+class KeywordMatcher:
+    """Finds which of many keywords occur in a text in a single scan."""
+
+    def __init__(self, keywords: List[str]):
+        """
+        Args:
+            keywords: Lowercase keywords; matched as substrings like `kw in text`
+        """
+        self.keywords = list(dict.fromkeys(keywords))
+        # Longest first so each position reports its longest keyword; shorter
+        # keywords contained in it are credited through `contained`
+        ordered = sorted(self.keywords, key=len, reverse=True)
+        self.index = {kw: i for i, kw in enumerate(self.keywords)}
+        self.pattern = re.compile("(?=(" + "|".join(re.escape(kw) for kw in ordered) + "))")
+        self.contained = {
+            kw: frozenset(self.index[other] for other in self.keywords if other in kw)
+            for kw in self.keywords
+        }
+
+    def match(self, text: str) -> Set[int]:
+        """Return the indices of all keywords occurring in text."""
+        found = set()
+        for longest in set(self.pattern.findall(text)):
+            found |= self.contained[longest]
+        return found
+
+
+class ProfileScorer:
+    """Scores jobs against every profile with one shared keyword scan."""
+
+    def __init__(self, profiles: List[Dict] = None):
+        """
+        Args:
+            profiles: Profile definitions (default: DEFAULT_PROFILES)
+        """
+        self.profiles = profiles or DEFAULT_PROFILES
+        keywords = ENTRY_LEVEL_TERMS + EARLY_CAREER_TERMS + JOB_TYPE_TERMS
+        for profile in self.profiles:
+            keywords += [kw.lower() for kw in profile.get("skills", {})]
+        self.matcher = KeywordMatcher(keywords)
+
+        index = self.matcher.index
+        self.entry_level = {index[t] for t in ENTRY_LEVEL_TERMS}
+        self.early_career = {index[t] for t in EARLY_CAREER_TERMS}
+        self.job_type = {index[t] for t in JOB_TYPE_TERMS}
+
+        # Sparse weight vector per profile: (keyword index, points)
+        self.weights = [
+            [(index[kw.lower()], points) for kw, points in profile.get("skills", {}).items()]
+            for profile in self.profiles
+        ]
+        self.title_keywords = [
+            [kw.lower() for kw in profile.get("title_keywords", [])] for profile in self.profiles
+        ]
+
+    @staticmethod
+    def location_points(location: str) -> int:
+        """Location score (max 40)."""
+        # Gazetteer labels carry the province code: "Dartmouth, NS", "Mississauga, ON (Hybrid)"
+        province = PROVINCE_CODE.search(location)
+        province = province.group(1) if province else ''
+        location = location.lower()
+        if 'halifax' in location or 'nova scotia' in location or province == 'NS':
+            return 40  # Top priority
+        if 'toronto' in location or 'ontario' in location or province == 'ON':
+            return 30  # Secondary
+        if 'remote' in location or 'canada' in location:
+            return 25
+        return 0
+
+    def score_job(self, job: Dict) -> Dict[str, int]:
+        """
+        Score one job against every profile.
+
+        Args:
+            job: Job dictionary with title, description, location
+
+        Returns:
+            Dictionary of profile name -> match score (0-100)
+        """
+        title = job.get('title', '').lower()
+        matched = self.matcher.match(f"{title} {job.get('description', '')}".lower())
+
+        # Points shared by all profiles
+        shared = self.location_points(job.get('location', ''))
+        if matched & self.entry_level:
+            shared += 20
+        elif matched & self.early_career:
+            shared += 18
+        if matched & self.job_type:
+            shared += 5
+
+        scores = {}
+        for profile, weights, title_keywords in zip(self.profiles, self.weights, self.title_keywords):
+            skills = min(SKILLS_CAP, sum(points for i, points in weights if i in matched))
+            title_points = TITLE_POINTS if any(kw in title for kw in title_keywords) else 0
+            scores[profile["name"]] = min(100, shared + skills + title_points)
+        return scores
+
+    def score(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Score jobs in place and route each to its best-fitting profile.
+
+        Sets match_score (best profile's score), profile (its name) and
+        profile_scores (all profiles) on every job. Ties go to the profile
+        listed first.
+
+        Args:
+            jobs: Job dictionaries
+
+        Returns:
+            The same jobs
+        """
+        for job in jobs:
+            scores = self.score_job(job)
+            best = max(scores, key=scores.get)
+            job['match_score'] = scores[best]
+            job['profile'] = best
+            job['profile_scores'] = scores
+        return jobs
+
+    def get(self, name: str) -> Dict:
+        """Return the profile definition with this name (first profile if unknown)."""
+        for profile in self.profiles:
+            if profile["name"] == name:
+                return profile
+        return self.profiles[0]
+
+
+if __name__ == "__main__":
+    # Route two sample postings using config.json profiles
+    from settings import load_config
+
+    scorer = ProfileScorer(load_config().get("profiles"))
+    samples = [
+        {"title": "Junior BI Analyst", "location": "Halifax, NS",
+         "description": "Build Power BI and Tableau dashboards, SQL. Full-time."},
+        {"title": "Junior Data Scientist", "location": "Remote, Canada",
+         "description": "Python, machine learning, statistics, scikit-learn. Entry level."},
+    ]
+    for job in scorer.score(samples):
+        print(f"  {job['match_score']}% → {job['profile']}: {job['title']}  {job['profile_scores']}")
@@ -0,0 +1,279 @@
+"""
+Quota Module - Persistent API Quota Ledger
+
+Counts metered API calls per provider in minute, day and month windows
+and checks them against the limits in config.json before each call:
+
+    "quota": {
+      "path": "quota.db",
+      "reserve": 0.2,
+      "providers": {
+        "brave": {"per_minute": 60, "per_month": 2000},
+        "notion": {"per_minute": 180}
+      }
+    }
+
+Normal-priority calls may use a window up to its limit. Low-priority work
+(deep result pages, posting page enrichment) stops once less than
+`reserve` of any window is left, so the budget that remains goes to first
+result pages and Notion writes. Callers that would rather wait than give
+up (a Notion sync that bursts past the per-minute limit) pass `max_wait`,
+and a call blocked only by the minute window sleeps until it rolls over.
+
+Counts are kept in memory and written to SQLite at most every few
+seconds (and at exit), so a check costs a few dictionary lookups. Every
+process, including `pipeline.py worker` processes, adds to the same
+ledger file; each one sees the others' usage as of their last flush.
+
+    from quota import spend, QuotaExceeded
+    spend("brave", priority="low")    # raises QuotaExceeded when over budget
+    spend("notion", max_wait=65)        # waits out a full minute window instead
+"""
+
+import atexit
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from typing import List, Dict, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS usage (
+    provider TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    calls INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (provider, bucket)
+);
+"""
+
+# Window name → (bucket prefix, strftime format) in UTC
+WINDOWS = {
+    "per_minute": ("m", "%Y-%m-%dT%H:%M"),
+    "per_day": ("d", "%Y-%m-%d"),
+    "per_month": ("M", "%Y-%m"),
+}
+
+# Published free-tier limits; config.json "quota.providers" overrides them
+DEFAULT_LIMITS = {
+    "brave": {"per_minute": 60, "per_month": 2000},
+    "notion": {"per_minute": 180},
+    "gmail": {"per_minute": 15000},
+    "web": {"per_minute": 120},
+}
+
+
+class QuotaExceeded(Exception):
+    """Raised when a call would exceed a provider's quota for its priority."""
+
+    def __init__(self, message: str, windows: Optional[List[str]] = None, retry_after: Optional[float] = None):
+        """
+        Args:
+            message: Error message
+            windows: Windows that are full ("per_minute", "per_day", "per_month")
+            retry_after: Seconds until the call fits again, when only the minute window is full
+        """
+        super().__init__(message)
+        self.windows = windows or []
+        self.retry_after = retry_after
+
+
+class QuotaLedger:
+    """Per-provider call counts in minute/day/month windows, persisted to SQLite."""
+
+    def __init__(self, path: Optional[str] = "quota.db", limits: Optional[Dict[str, Dict]] = None,
+                 reserve: float = 0.2, flush_seconds: float = 5):
+        """
+        Args:
+            path: SQLite ledger file (None keeps counts in memory only)
+            limits: Provider → {"per_minute", "per_day", "per_month"} call limits
+            reserve: Share of each window held back from low-priority calls
+            flush_seconds: Longest time counts stay unwritten
+        """
+        self.path = path
+        self.limits = {**DEFAULT_LIMITS, **(limits or {})}
+        self.reserve = reserve
+        self.flush_seconds = flush_seconds
+        self.lock = threading.Lock()
+        self.stored = {}
+        self.pending = {}
+        self.buckets = {}
+        self.bucket_minute = None
+        self.last_flush = time.monotonic()
+        self.conn = None
+        if path:
+            self.conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.executescript(SCHEMA)
+            self._reload()
+
+    def _current_buckets(self) -> Dict[str, str]:
+        """Bucket key per window for the current minute (recomputed once a minute)."""
+        minute = int(time.time() // 60)
+        if minute != self.bucket_minute:
+            now = datetime.fromtimestamp(minute * 60, tz=timezone.utc)
+            self.buckets = {window: f"{prefix}:{now.strftime(fmt)}" for window, (prefix, fmt) in WINDOWS.items()}
+            self.bucket_minute = minute
+        return self.buckets
+
+    def _reload(self) -> None:
+        """Read the stored counts of the current buckets."""
+        buckets = list(self._current_buckets().values())
+        rows = self.conn.execute(
+            f"SELECT provider, bucket, calls FROM usage WHERE bucket IN ({','.join('?' * len(buckets))})", buckets
+        ).fetchall()
+        self.stored = {(provider, bucket): calls for provider, bucket, calls in rows}
+
+    def used(self, provider: str) -> Dict[str, int]:
+        """Calls counted in each current window for a provider."""
+        with self.lock:
+            return self._used(provider)
+
+    def _used(self, provider: str) -> Dict[str, int]:
+        used = {}
+        for window, bucket in self._current_buckets().items():
+            key = (provider, bucket)
+            used[window] = self.stored.get(key, 0) + self.pending.get(key, 0)
+        return used
+
+    def _full_windows(self, provider: str, priority: str, cost: int) -> List[str]:
+        """Windows without room for the call (empty when it fits)."""
+        limits = self.limits.get(provider, {})
+        if not limits:
+            return []
+        share = 1 - self.reserve if priority == "low" else 1.0
+        used = self._used(provider)
+        return [window for window, limit in limits.items()
+                if limit and window in used and used[window] + cost > limit * share]
+
+    def _allows(self, provider: str, priority: str, cost: int) -> bool:
+        return not self._full_windows(provider, priority, cost)
+
+    def allows(self, provider: str, priority: str = "normal", cost: int = 1) -> bool:
+        """Whether a call of this priority and cost fits every window right now."""
+        with self.lock:
+            return self._allows(provider, priority, cost)
+
+    def spend(self, provider: str, priority: str = "normal", cost: int = 1, max_wait: float = 0) -> None:
+        """
+        Check and record a call.
+
+        Args:
+            provider: Provider name (brave, notion, gmail, web)
+            priority: "normal" or "low"; low-priority calls leave the reserve untouched
+            cost: Quota units the call uses
+            max_wait: Longest time to sleep for the minute window to roll over
+                when that is the only full window (0 never waits)
+
+        Raises:
+            QuotaExceeded: If the call does not fit (within max_wait); nothing is recorded
+        """
+        deadline = time.monotonic() + max_wait
+        while True:
+            with self.lock:
+                full = self._full_windows(provider, priority, cost)
+                if not full:
+                    for bucket in self._current_buckets().values():
+                        key = (provider, bucket)
+                        self.pending[key] = self.pending.get(key, 0) + cost
+                    due = time.monotonic() - self.last_flush >= self.flush_seconds
+                    break
+            # Just past the minute boundary, so the new bucket is current
+            retry_after = 60 - time.time() % 60 + 0.05 if full == ["per_minute"] else None
+            if retry_after is None or time.monotonic() + retry_after > deadline:
+                raise QuotaExceeded(f"{provider} quota exhausted for {priority}-priority calls "
+                                    f"({', '.join(full)})", full, retry_after)
+            time.sleep(retry_after)
+            # Pick up what other processes spent in the new minute before checking again
+            self.flush()
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write pending counts and pick up other processes' usage."""
+        with self.lock:
+            pending, self.pending = self.pending, {}
+            self.last_flush = time.monotonic()
+            if self.conn is None:
+                for key, calls in pending.items():
+                    self.stored[key] = self.stored.get(key, 0) + calls
+                return
+            minute_bucket = self._current_buckets()["per_minute"]
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT INTO usage (provider, bucket, calls) VALUES (?, ?, ?) "
+                    "ON CONFLICT(provider, bucket) DO UPDATE SET calls = calls + excluded.calls",
+                    [(provider, bucket, calls) for (provider, bucket), calls in pending.items()]
+                )
+                # Minute buckets are only needed while current
+                self.conn.execute("DELETE FROM usage WHERE bucket GLOB 'm:*' AND bucket < ?", (minute_bucket,))
+            self._reload()
+
+    def report(self) -> List[Dict]:
+        """
+        Usage of every known provider.
+
+        Returns:
+            Rows with provider, window, used, limit and percent (None when unlimited)
+        """
+        self.flush()
+        providers = sorted(set(self.limits) | {provider for provider, _ in self.stored})
+        rows = []
+        for provider in providers:
+            used = self.used(provider)
+            limits = self.limits.get(provider, {})
+            for window in WINDOWS:
+                limit = limits.get(window)
+                rows.append({
+                    "provider": provider,
+                    "window": window,
+                    "used": used[window],
+                    "limit": limit,
+                    "percent": round(100 * used[window] / limit, 1) if limit else None
+                })
+        return rows
+
+    def close(self) -> None:
+        """Flush and close the ledger."""
+        if self.conn is not None:
+            self.flush()
+            self.conn.close()
+            self.conn = None
+
+
+_ledger = None
+_ledger_lock = threading.Lock()
+
+
+def get_ledger() -> QuotaLedger:
+    """Process-wide ledger configured from the active config's "quota" section."""
+    global _ledger
+    if _ledger is None:
+        with _ledger_lock:
+            if _ledger is None:
+                from settings import settings
+                config = settings.config().get("quota", {})
+                path = config.get("path", "quota.db")
+                _ledger = QuotaLedger(
+                    settings.resolve(path) if path else None,
+                    limits=config.get("providers"),
+                    reserve=config.get("reserve", 0.2),
+                    flush_seconds=config.get("flush_seconds", 5)
+                )
+                atexit.register(_ledger.close)
+    return _ledger
+
+
+def set_ledger(ledger: QuotaLedger) -> None:
+    """Replace the process-wide ledger (e.g. an unlimited in-memory one for benchmarks)."""
+    global _ledger
+    _ledger = ledger
+
+
+def spend(provider: str, priority: str = "normal", cost: int = 1, max_wait: float = 0) -> None:
+    """Check and record a call against the shared ledger (see QuotaLedger.spend)."""
+    get_ledger().spend(provider, priority, cost, max_wait)
+
+
+def allows(provider: str, priority: str = "normal", cost: int = 1) -> bool:
+    """Whether the shared ledger has room for a call (see QuotaLedger.allows)."""
+    return get_ledger().allows(provider, priority, cost)
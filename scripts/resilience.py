@@ -0,0 +1,266 @@
+"""
+Resilience Module - Hedged Requests and Circuit Breaking
+
+Keeps one slow or failing API from stalling a whole search sweep:
+
+    LatencyTracker   rolling window of recent response times (p95 estimate)
+    CircuitBreaker   opens after consecutive failures, short-circuits calls
+                     while open, lets one trial call through after a cool-down
+    HedgedCaller     runs a call with an overall deadline and, if it has not
+                     answered by the recent p95 latency, fires a duplicate and
+                     takes whichever answers first
+
+The duplicate only goes out for the slowest ~5% of calls, so hedging costs
+a few percent of extra requests while cutting the tail of the latency
+distribution. Against a metered API those requests are billed, so callers
+can veto each duplicate with `can_hedge`.
+
+Only transient errors (timeouts, connection failures, HTTP 5xx) are
+retried, hedged or counted against the breaker. An answer like HTTP 429,
+401 or 422, a missing API key or an exhausted quota goes straight back to
+the caller: sending it again would only repeat the error and spend quota.
+"""
+
+import threading
+import time
+import urllib.error
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Dict, List, Optional
+
+
+# How often a waiting call checks whether other calls have opened the breaker
+BREAKER_POLL_SECONDS = 0.05
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an endpoint the breaker considers unhealthy."""
+
+
+def is_transient(error: Exception) -> bool:
+    """
+    Whether an error may go away if the call is simply made again.
+
+    Errors can say so themselves with a `transient` attribute; otherwise an
+    HTTP status (`status` or `code`) of 500 or more, a timeout or a
+    connection failure counts as transient and anything else does not.
+    """
+    transient = getattr(error, "transient", None)
+    if transient is not None:
+        return bool(transient)
+    status = getattr(error, "status", None) or getattr(error, "code", None)
+    if isinstance(status, int):
+        return status >= 500
+    return isinstance(error, (TimeoutError, ConnectionError, urllib.error.URLError))
+
+
+class LatencyTracker:
+    """Recent successful call latencies."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20, samples: Optional[List[float]] = None):
+        """
+        Args:
+            window: Number of recent latencies kept
+            min_samples: Samples needed before percentile() trusts the window
+            samples: Latencies carried over from an earlier run
+        """
+        self.samples = deque(samples or [], maxlen=window)
+        self.min_samples = min_samples
+        self.lock = threading.Lock()
+
+    def add(self, seconds: float) -> None:
+        with self.lock:
+            self.samples.append(seconds)
+
+    def snapshot(self) -> List[float]:
+        with self.lock:
+            return list(self.samples)
+
+    def percentile(self, pct: float, default: float) -> float:
+        """The pct-th percentile latency, or default until enough samples exist."""
+        with self.lock:
+            if len(self.samples) < self.min_samples:
+                return default
+            ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker (closed → open → half-open → closed)."""
+
+    def __init__(self, failure_threshold: int = 5, reset_seconds: float = 60):
+        """
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_seconds: How long the circuit stays open before a trial call
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at = None
+        self.trial_running = False
+        self.lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self.lock:
+            if self.opened_at is None:
+                return "closed"
+            return "half-open" if time.monotonic() - self.opened_at >= self.reset_seconds else "open"
+
+    def allow(self) -> bool:
+        """Whether a call may go out now. While half-open, only one trial call is allowed."""
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at < self.reset_seconds or self.trial_running:
+                return False
+            self.trial_running = True
+            return True
+
+    def record_success(self) -> None:
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial_running = False
+
+    def release(self) -> None:
+        """End a call that says nothing about the endpoint's health (e.g. HTTP 429)."""
+        with self.lock:
+            self.trial_running = False
+
+    def record_failure(self) -> None:
+        with self.lock:
+            self.failures += 1
+            self.trial_running = False
+            if self.opened_at is not None or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+class HedgedCaller:
+    """Calls a function with a deadline, a hedged duplicate and a circuit breaker."""
+
+    def __init__(self, fn: Callable, timeout: float = 10, hedge: bool = True,
+                 hedge_percentile: float = 95, hedge_delay: float = 1.0,
+                 breaker: Optional[CircuitBreaker] = None, max_workers: int = 16,
+                 retryable: Callable[[Exception], bool] = is_transient,
+                 can_hedge: Optional[Callable[[], bool]] = None):
+        """
+        Args:
+            fn: Function to call; must be safe to run twice concurrently
+            timeout: Overall deadline per call in seconds
+            hedge: Whether to send a duplicate for slow calls
+            hedge_percentile: Latency percentile after which the duplicate goes out
+            hedge_delay: Hedge delay used until enough latencies are recorded
+            breaker: Circuit breaker shared by every call (None disables it)
+            max_workers: Threads for attempts in flight
+            retryable: Whether an error may be retried and counts against the breaker
+            can_hedge: Asked before each duplicate goes out; False skips it (e.g.
+                when a metered API's quota is running low)
+        """
+        self.fn = fn
+        self.timeout = timeout
+        self.hedge = hedge
+        self.hedge_percentile = hedge_percentile
+        self.hedge_delay = hedge_delay
+        self.breaker = breaker
+        self.retryable = retryable
+        self.can_hedge = can_hedge
+        self.latencies = LatencyTracker()
+        # Attempts abandoned at the deadline finish in the background; fn should
+        # apply its own socket timeout so they cannot hold a thread forever
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hedged")
+        self.stats = {"calls": 0, "hedged": 0, "hedge_wins": 0, "timeouts": 0, "failures": 0,
+                      "short_circuited": 0, "rejected": 0, "hedges_skipped": 0}
+        self.lock = threading.Lock()
+
+    def _count(self, key: str) -> None:
+        with self.lock:
+            self.stats[key] += 1
+
+    def _attempt(self, args, kwargs):
+        start = time.monotonic()
+        result = self.fn(*args, **kwargs)
+        self.latencies.add(time.monotonic() - start)
+        return result
+
+    def __call__(self, *args, **kwargs):
+        """
+        Call fn(*args, **kwargs).
+
+        Raises:
+            CircuitOpenError: If the breaker is open
+            TimeoutError: If no attempt answered before the deadline
+            Exception: A non-transient error at once, or the last attempt's
+                error if every attempt failed
+        """
+        if self.breaker and not self.breaker.allow():
+            self._count("short_circuited")
+            raise CircuitOpenError("endpoint unhealthy, circuit open")
+        self._count("calls")
+
+        start = time.monotonic()
+        deadline = start + self.timeout
+        hedge_at = start + self.latencies.percentile(self.hedge_percentile, self.hedge_delay)
+        primary = self.executor.submit(self._attempt, args, kwargs)
+        pending = {primary}
+        hedged = not self.hedge
+        error = None
+
+        while pending:
+            until = deadline if hedged else min(hedge_at, deadline)
+            if self.breaker:
+                until = min(until, time.monotonic() + BREAKER_POLL_SECONDS)
+            done, pending = wait(pending, timeout=max(0, until - time.monotonic()),
+                                 return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    result = future.result()
+                except Exception as e:
+                    if not self.retryable(e):
+                        self._count("rejected")
+                        if self.breaker:
+                            self.breaker.release()
+                        raise
+                    error = e
+                    continue
+                if future is not primary:
+                    self._count("hedge_wins")
+                if self.breaker:
+                    self.breaker.record_success()
+                return result
+
+            now = time.monotonic()
+            if now >= deadline:
+                break
+            # Calls that went out just before other calls tripped the breaker stop waiting too
+            if pending and self.breaker and self.breaker.state == "open":
+                self._count("short_circuited")
+                raise CircuitOpenError("endpoint unhealthy, circuit opened while waiting")
+            # A fast transient failure is retried at once; a slow call is duplicated at the hedge point
+            if not hedged and (now >= hedge_at or not pending):
+                hedged = True
+                if self.can_hedge and not self.can_hedge():
+                    self._count("hedges_skipped")
+                    continue
+                self._count("hedged")
+                pending.add(self.executor.submit(self._attempt, args, kwargs))
+
+        if self.breaker:
+            self.breaker.record_failure()
+        if pending:
+            self._count("timeouts")
+            raise TimeoutError(f"no response within {self.timeout}s")
+        self._count("failures")
+        raise error
+
+    def summary(self) -> Dict:
+        """Call counters plus the current hedge delay and breaker state."""
+        summary = dict(self.stats)
+        summary["hedge_delay"] = round(self.latencies.percentile(self.hedge_percentile, self.hedge_delay), 3)
+        summary["breaker"] = self.breaker.state if self.breaker else "disabled"
+        return summary
+
+    def close(self) -> None:
+        """Stop accepting attempts; abandoned ones are not waited for."""
+        self.executor.shutdown(wait=False)
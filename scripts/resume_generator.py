@@ -2,15 +2,35 @@
 Resume Generator Module - Tailored Application Package Creation
 
 Generates customized resume and cover letter for each job application.
+
+Package layouts (config.json "packages"):
+    flat      applications/<Company>_<Role>/ (names can collide)
+    sharded   applications/<id[:2]>/<id>/, keyed by a stable job ID derived
+              from the posting URL, so no two jobs share a directory
+
+With bundle, the pages are stored self-contained in bundle.zip instead
+of as loose HTML (job_details.json stays loose for the history export).
+Each small file takes at least one filesystem block, so this is the
+layout that saves disk; PDF rendering only sees loose HTML, so bundles
+are meant for archiving.
 """
 
 import os
 import re
 import json
+import hashlib
+import zipfile
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 from datetime import datetime
 
+from company_names import normalize_company
+from normalize import normalize_url
+
+
+BUNDLE_NAME = "bundle.zip"
+LAYOUTS = ("flat", "sharded")
+
 
 # Candidate profile (customize this with your details)
 CANDIDATE_PROFILE = {
@@ -196,7 +216,82 @@ def customize_cover_letter(template: str, job: Dict, profile: Dict) -> str:
     return customized
 
 
-def generate_application_package(job: Dict, template_dir: str, output_dir: str) -> str:
+def resolve_profile(target: Optional[Dict] = None) -> Dict:
+    """
+    Merge a target profile's resume overrides into CANDIDATE_PROFILE.
+    
+    Args:
+        target: Profile definition from config.json profiles (may be None)
+        
+    Returns:
+        Candidate profile used to fill the templates
+    """
+    if not target:
+        return CANDIDATE_PROFILE
+    return {**CANDIDATE_PROFILE, **target.get("resume", {})}
+
+
+def job_id(job: Dict) -> str:
+    """
+    Stable 16-character ID for a job.
+    
+    Derived from the normalized posting URL, so the same posting found by
+    different queries (or with tracking parameters) maps to the same ID.
+    Jobs without a URL fall back to company, title and location.
+    """
+    url = job.get("url", "")
+    if url:
+        key = normalize_url(url)
+    else:
+        key = "|".join(job.get(field, "").strip().lower() for field in ("company", "title", "location"))
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+def package_name(job: Dict, layout: str = "flat") -> str:
+    """
+    Package directory path relative to the output directory.
+    
+    Args:
+        job: Job dictionary
+        layout: "flat" (Company_Role) or "sharded" (<id[:2]>/<id>)
+        
+    Returns:
+        Relative directory path
+    """
+    if layout == "sharded":
+        identifier = job_id(job)
+        return os.path.join(identifier[:2], identifier)
+    if layout != "flat":
+        raise ValueError(f"Unknown package layout: {layout} (expected one of {', '.join(LAYOUTS)})")
+    
+    # Create safe directory name
+    company = re.sub(r'[^\w\s-]', '', job.get("company", "Unknown")).strip()
+    role = re.sub(r'[^\w\s-]', '', job.get("title", "Role")).strip()[:30]
+    return f"{company}_{role}".replace(" ", "_").replace("-", "_")
+
+
+def write_bundle(package_dir: str, pages: Dict[str, str]) -> str:
+    """
+    Store a package's pages in one compressed, self-contained zip.
+    
+    Args:
+        package_dir: Package directory
+        pages: File name → page HTML (with inline styles)
+        
+    Returns:
+        Path to the bundle
+    """
+    bundle_path = os.path.join(package_dir, BUNDLE_NAME)
+    with zipfile.ZipFile(f"{bundle_path}.tmp", 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=9) as bundle:
+        for file_name, html in pages.items():
+            bundle.writestr(file_name, html)
+    os.replace(f"{bundle_path}.tmp", bundle_path)
+    return bundle_path
+
+
+def generate_application_package(job: Dict, template_dir: str, output_dir: str,
+                                 profile: Optional[Dict] = None, layout: str = "flat",
+                                 bundle: bool = False) -> str:
     """
     Generate complete application package for a job.
     
@@ -204,16 +299,19 @@ def generate_application_package(job: Dict, template_dir: str, output_dir: str)
         job: Job dictionary
         template_dir: Directory containing templates
         output_dir: Directory to save generated files
+        profile: Target profile the job was routed to (default: CANDIDATE_PROFILE as is)
+        layout: "flat" or "sharded" package directories (see module docstring)
+        bundle: Write the pages into a compressed bundle.zip instead of loose HTML
         
     Returns:
         Path to generated package directory
     """
-    # Create safe directory name
-    company = re.sub(r'[^\w\s-]', '', job.get("company", "Unknown")).strip()
-    role = re.sub(r'[^\w\s-]', '', job.get("title", "Role")).strip()[:30]
+    candidate = resolve_profile(profile)
+    # Cover letters and package names use the canonical name ("RBC" → "Royal Bank of Canada")
+    job = {**job, "company": normalize_company(job.get("company", "")) or "Unknown"}
     
-    package_name = f"{company}_{role}".replace(" ", "_").replace("-", "_")
-    package_dir = os.path.join(output_dir, package_name)
+    name = package_name(job, layout)
+    package_dir = os.path.join(output_dir, name)
     
     # Create directory
     Path(package_dir).mkdir(parents=True, exist_ok=True)
@@ -223,26 +321,28 @@ def generate_application_package(job: Dict, template_dir: str, output_dir: str)
     cover_template = load_template(os.path.join(template_dir, "cover_letter_template.html"))
     
     # Generate customized versions
-    customized_resume = customize_resume(resume_template, job, CANDIDATE_PROFILE)
-    customized_cover = customize_cover_letter(cover_template, job, CANDIDATE_PROFILE)
+    pages = {
+        "resume.html": customize_resume(resume_template, job, candidate),
+        "cover_letter.html": customize_cover_letter(cover_template, job, candidate)
+    }
     
     # Save files
-    resume_path = os.path.join(package_dir, "resume.html")
-    cover_path = os.path.join(package_dir, "cover_letter.html")
-    
-    with open(resume_path, 'w', encoding='utf-8') as f:
-        f.write(customized_resume)
-    
-    with open(cover_path, 'w', encoding='utf-8') as f:
-        f.write(customized_cover)
+    if bundle:
+        write_bundle(package_dir, pages)
+    else:
+        for file_name, html in pages.items():
+            with open(os.path.join(package_dir, file_name), 'w', encoding='utf-8') as f:
+                f.write(html)
     
     # Save job details
     details = {
+        "job_id": job_id(job),
         "company": job.get("company", "Unknown"),
         "role": job.get("title", "Unknown"),
         "location": job.get("location", "Unknown"),
         "url": job.get("url", ""),
         "match_score": job.get("match_score", 0),
+        "profile": job.get("profile", ""),
         "generated_at": datetime.now().isoformat()
     }
     
@@ -250,7 +350,7 @@ def generate_application_package(job: Dict, template_dir: str, output_dir: str)
     with open(details_path, 'w') as f:
         json.dump(details, f, indent=2)
     
-    print(f"  ✅ Generated: {package_name}/")
+    print(f"  ✅ Generated: {name}/")
     return package_dir
 
 
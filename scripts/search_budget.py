@@ -0,0 +1,178 @@
+"""
+Search Budget Module - Yield-Based Allocation of Search Requests
+
+Records how productive each search term is (new unique jobs and jobs above
+match_threshold per API call) and spreads a per-run request budget over
+the plan, giving extra result pages to the terms that pay off.
+
+Allocation is a UCB-style bandit: each term's value is its decayed
+above-threshold yield per call (plus a small credit for new unique jobs)
+and an exploration bonus that shrinks as the term is tried more. Terms
+that have never run are always tried once.
+
+Allocation never goes deeper than the plan allows: an entry's "pages"
+caps it, and entries without one get `default_pages`. The pipeline keeps
+the budget off by default; when enabled, the budget defaults to the
+requests the plan already makes, so it moves pages between terms
+without raising the metered spend.
+
+The bandit needs history: each new term costs a probe and exploration
+keeps sending pages to unproductive terms for the first runs, so over
+short horizons, or when productivity is spread evenly over terms, a
+uniform plan does as well or better (see bench_search_budget.py).
+"""
+
+import json
+import math
+import os
+from datetime import datetime
+from typing import List, Dict
+
+from search_plan import DEFAULT_PAGES
+
+
+class YieldTracker:
+    """Persistent per-term yield statistics."""
+
+    def __init__(self, path: str = "search_yield.json", decay: float = 0.9):
+        """
+        Load tracked statistics.
+
+        Args:
+            path: JSON file holding term statistics and run history
+            decay: Weight kept by older runs each time a term is recorded
+        """
+        self.path = path
+        self.decay = decay
+        self.terms = {}
+        self.history = []
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'r') as f:
+                    data = json.load(f)
+                self.terms = data.get("terms", {})
+                self.history = data.get("history", [])
+            except (OSError, json.JSONDecodeError):
+                pass
+
+    @staticmethod
+    def _yield(stats: Dict) -> float:
+        return stats["above_threshold"] + 0.1 * stats["new_jobs"]
+
+    def value(self, term: str, total_calls: float, exploration: float, scale: float = 1.0) -> float:
+        """
+        UCB score of a term: yield per call plus exploration bonus.
+
+        The bonus is multiplied by `scale` (the overall yield per call) so
+        exploration stays proportionate however productive searches are.
+        """
+        stats = self.terms.get(term)
+        if not stats or stats["calls"] <= 0:
+            return math.inf
+        mean = self._yield(stats) / stats["calls"]
+        bonus = exploration * scale * math.sqrt(math.log(max(total_calls, 1.0) + 1) / stats["calls"])
+        return mean + bonus
+
+    def allocate(self, plan: List[Dict], budget: int, exploration: float = 0.5,
+                 page_discount: float = 0.6, default_pages: int = DEFAULT_PAGES) -> List[Dict]:
+        """
+        Assign result pages to plan entries within a request budget.
+
+        Each additional page for the same term is worth `page_discount`
+        times the previous one, since deeper pages rarely surface
+        better matches. An entry's own "pages" caps its depth.
+
+        Args:
+            plan: Query plan entries (see search_plan.expand_plan)
+            budget: Total API requests allowed this run
+            exploration: Weight of the exploration bonus
+            page_discount: Value multiplier for each extra page
+            default_pages: Depth cap for entries without "pages"
+
+        Returns:
+            New plan containing only funded entries, with "pages" set
+        """
+        total_calls = sum(s["calls"] for s in self.terms.values())
+        scale = sum(self._yield(s) for s in self.terms.values()) / total_calls if total_calls else 1.0
+        values = {e["query"]: self.value(e["query"], total_calls, exploration, scale) for e in plan}
+        pages = {e["query"]: 0 for e in plan}
+        caps = {e["query"]: min(e.get("pages", default_pages), 10) for e in plan}
+
+        for _ in range(budget):
+            candidates = [q for q in pages if pages[q] < caps[q]]
+            if not candidates:
+                break
+            best = max(candidates, key=lambda q: values[q] * page_discount ** pages[q])
+            pages[best] += 1
+            # An untried term only needs one probe before it has real stats
+            if values[best] == math.inf:
+                values[best] = 0.0
+                caps[best] = 1
+
+        return [dict(e, pages=pages[e["query"]]) for e in plan if pages[e["query"]]]
+
+    def record(self, term_stats: Dict[str, Dict], above_threshold: Dict[str, int]) -> Dict:
+        """
+        Fold one run's results into the statistics.
+
+        Args:
+            term_stats: Per-term stats from SearchEngine.run
+            above_threshold: Above-threshold job counts credited per term
+
+        Returns:
+            This run's summary (api_calls, above_threshold, per-call yield)
+        """
+        for term, stats in term_stats.items():
+            # Requests deferred for quota never reached the API, so they say nothing about the term
+            answered = stats["requests"] - stats.get("deferred", 0)
+            if not answered:
+                continue
+            tracked = self.terms.setdefault(term, {"calls": 0.0, "new_jobs": 0.0, "above_threshold": 0.0})
+            for key in ("calls", "new_jobs", "above_threshold"):
+                tracked[key] *= self.decay
+            # Cached answers still count as a probe so the term's stats stay meaningful
+            tracked["calls"] += max(stats["api_calls"], 1)
+            tracked["new_jobs"] += stats["new_jobs"]
+            tracked["above_threshold"] += above_threshold.get(term, 0)
+            tracked["last_run"] = datetime.now().isoformat(timespec='seconds')
+
+        api_calls = sum(s["api_calls"] for s in term_stats.values())
+        above = sum(above_threshold.values())
+        summary = {
+            "date": datetime.now().isoformat(timespec='seconds'),
+            "api_calls": api_calls,
+            "new_jobs": sum(s["new_jobs"] for s in term_stats.values()),
+            "above_threshold": above,
+            "above_threshold_per_call": round(above / api_calls, 3) if api_calls else 0.0
+        }
+        self.history.append(summary)
+        return summary
+
+    def save(self) -> None:
+        """Write statistics and run history."""
+        if not self.path:
+            return
+        with open(f"{self.path}.tmp", 'w') as f:
+            json.dump({"terms": self.terms, "history": self.history[-365:]}, f, indent=2)
+        os.replace(f"{self.path}.tmp", self.path)
+
+
+def credit_terms(jobs: List[Dict]) -> Dict[str, int]:
+    """Credit each job to the first query that found it."""
+    counts = {}
+    for job in jobs:
+        queries = job.get("queries") or []
+        if queries:
+            counts[queries[0]] = counts.get(queries[0], 0) + 1
+    return counts
+
+
+if __name__ == "__main__":
+    # Show the current allocation for config.json search terms
+    from search_plan import plan_from_terms
+    from settings import load_config
+
+    terms = load_config()["search_terms"]
+    tracker = YieldTracker("../search_yield.json")
+    for entry in tracker.allocate(plan_from_terms(terms), budget=10):
+        print(f"  {entry['pages']} page(s): {entry['query']}")
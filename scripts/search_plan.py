@@ -0,0 +1,315 @@
+"""
+Search Plan Module - Declarative Query Plans for Brave Search
+
+Replaces the one-off search scripts with a single engine. A plan is a list
+of queries, each with a category tag, optional site filters, page depth and
+priority:
+
+    [
+      {"query": "RBC TD Scotiabank data analyst entry level", "category": "Banking",
+       "sites": ["indeed.com", "linkedin.com"], "pages": 2, "priority": 1}
+    ]
+
+The engine expands the plan into individual API requests, runs them
+concurrently (highest priority first), answers repeats from a shared
+on-disk result cache, and merges everything through one URL dedup index
+into a single consolidated output. Each request has a deadline, slow ones
+can be hedged with a duplicate (off by default: Brave bills the duplicate
+too), and while the API keeps failing the circuit breaker answers from
+expired cache entries instead of waiting on it.
+
+Usage:
+    python search_plan.py --plan ../search_plan.json --output ../job_search_results.json
+"""
+
+import argparse
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Dict, Optional
+
+from job_search import search_brave_jobs
+from normalize import normalize_url
+from quota import allows
+from resilience import HedgedCaller, CircuitBreaker, CircuitOpenError, LatencyTracker
+
+
+DEFAULT_COUNT = 10
+
+# Result pages fetched for an entry without "pages"
+DEFAULT_PAGES = 1
+
+
+def load_plan(plan_path: str) -> List[Dict]:
+    """Load a query plan from a JSON file."""
+    with open(plan_path, 'r') as f:
+        plan = json.load(f)
+    return plan.get("queries", []) if isinstance(plan, dict) else plan
+
+
+def plan_from_terms(search_terms: List[str], count: int = DEFAULT_COUNT) -> List[Dict]:
+    """Build a plan from config.json search_terms (one page each)."""
+    return [{"query": term, "category": "General", "count": count} for term in search_terms]
+
+
+def expand_plan(plan: List[Dict]) -> List[Dict]:
+    """
+    Expand plan entries into individual API requests.
+
+    Site filters are appended as `(site:a OR site:b)` and each page of
+    depth becomes its own request. Requests are ordered by priority
+    (lower number first), then page, so shallow high-priority pages run first.
+
+    Args:
+        plan: Query plan entries
+
+    Returns:
+        List of request dictionaries (query, count, offset, category, term, priority)
+    """
+    specs = []
+    for entry in plan:
+        query = entry["query"]
+        sites = entry.get("sites", [])
+        if sites:
+            query += " (" + " OR ".join(f"site:{site}" for site in sites) + ")"
+
+        for page in range(max(1, entry.get("pages", DEFAULT_PAGES))):
+            specs.append({
+                "query": query,
+                "term": entry["query"],
+                "count": entry.get("count", DEFAULT_COUNT),
+                "offset": page,
+                "category": entry.get("category", "General"),
+                "priority": entry.get("priority", 5)
+            })
+
+    specs.sort(key=lambda r: (r["priority"], r["offset"]))
+    return specs
+
+
+class ResultCache:
+    """
+    On-disk cache of raw search results keyed by request, with a TTL.
+
+    Expired entries are kept for stale_hours as a fallback for when the
+    API is unavailable.
+    """
+
+    def __init__(self, cache_path: Optional[str], ttl_hours: float = 12, stale_hours: float = 168):
+        self.cache_path = cache_path
+        self.ttl_seconds = ttl_hours * 3600
+        self.retain_seconds = max(stale_hours * 3600, self.ttl_seconds)
+        self.lock = threading.Lock()
+        self.entries = {}
+        self.dirty = False
+        if cache_path and os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'r') as f:
+                    self.entries = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                self.entries = {}
+
+    @staticmethod
+    def key(request: Dict, country: str) -> str:
+        return f"{request['query']}|{request['count']}|{request['offset']}|{country}"
+
+    def get(self, key: str, stale: bool = False) -> Optional[List[Dict]]:
+        """Fresh results for key; with stale=True, any retained results."""
+        with self.lock:
+            entry = self.entries.get(key)
+        limit = self.retain_seconds if stale else self.ttl_seconds
+        if entry and time.time() - entry["time"] < limit:
+            return entry["results"]
+        return None
+
+    def put(self, key: str, results: List[Dict]) -> None:
+        with self.lock:
+            self.entries[key] = {"time": time.time(), "results": results}
+            self.dirty = True
+
+    def save(self) -> None:
+        """Persist entries still within the stale retention window."""
+        if not self.cache_path or not self.dirty:
+            return
+        now = time.time()
+        with self.lock:
+            live = {k: v for k, v in self.entries.items() if now - v["time"] < self.retain_seconds}
+        with open(f"{self.cache_path}.tmp", 'w') as f:
+            json.dump(live, f)
+        os.replace(f"{self.cache_path}.tmp", self.cache_path)
+
+
+class SearchEngine:
+    """Executes query plans concurrently with a shared cache and dedup index."""
+
+    def __init__(self, cache_path: Optional[str] = "search_cache.json", ttl_hours: float = 12,
+                 workers: int = 6, country: str = 'ca', timeout: float = 10, hedge: bool = False,
+                 hedge_percentile: float = 95, breaker_failures: int = 5,
+                 breaker_reset_seconds: float = 60, latency_path: Optional[str] = None):
+        """
+        Args:
+            cache_path: Result cache file (None disables caching)
+            ttl_hours: Age after which cached results are refetched
+            workers: Concurrent requests
+            country: Brave country code
+            timeout: Deadline per request in seconds, including a hedged duplicate
+            hedge: Duplicate requests slower than the recent hedge_percentile latency;
+                each duplicate is a metered call, so it is skipped once the Brave
+                quota only allows normal-priority requests
+            hedge_percentile: Latency percentile that triggers the duplicate
+            breaker_failures: Consecutive failed requests that open the circuit (0 disables it)
+            breaker_reset_seconds: Time the circuit stays open before a trial request
+            latency_path: File keeping recent API latencies between runs, so the
+                hedge delay is a real p95 from the first request (None disables it)
+        """
+        self.cache = ResultCache(cache_path, ttl_hours)
+        self.workers = workers
+        self.country = country
+        self.timeout = timeout
+        self.seen = {}
+        self.deferred = 0
+        self.lock = threading.Lock()
+        breaker = CircuitBreaker(breaker_failures, breaker_reset_seconds) if breaker_failures else None
+        self.caller = HedgedCaller(self._fetch, timeout=timeout, hedge=hedge,
+                                   hedge_percentile=hedge_percentile, breaker=breaker,
+                                   max_workers=workers * 2, can_hedge=lambda: allows("brave", "low"))
+        self.latency_path = latency_path
+        if latency_path and os.path.exists(latency_path):
+            try:
+                with open(latency_path, 'r') as f:
+                    self.caller.latencies = LatencyTracker(samples=json.load(f))
+            except (OSError, json.JSONDecodeError):
+                pass
+
+    @staticmethod
+    def _priority(request: Dict) -> str:
+        """Deeper result pages are the first thing to give up when quota runs low."""
+        return "low" if request["offset"] else "normal"
+
+    def _fetch(self, request: Dict) -> List[Dict]:
+        """One API attempt; the socket timeout bounds attempts abandoned by a hedge."""
+        return search_brave_jobs(request["query"], count=request["count"], country=self.country,
+                                 offset=request["offset"], timeout=self.timeout,
+                                 priority=self._priority(request))
+
+    def _execute(self, request: Dict) -> Dict:
+        """Run one request, answering from cache when possible."""
+        key = ResultCache.key(request, self.country)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return {"request": request, "results": cached, "cached": True}
+
+        if not allows("brave", self._priority(request)):
+            with self.lock:
+                self.deferred += 1
+            stale = self.cache.get(key, stale=True)
+            return {"request": request, "results": stale or [], "cached": True, "deferred": True}
+
+        try:
+            results = self.caller(request)
+        except Exception as e:
+            # Expired results beat no results while the API is down
+            stale = self.cache.get(key, stale=True)
+            error = str(e) or type(e).__name__
+            if stale is not None:
+                error += f" (used {len(stale)} cached results)"
+            return {"request": request, "results": stale or [], "error": error,
+                    "cached": isinstance(e, CircuitOpenError)}
+
+        self.cache.put(key, results)
+        return {"request": request, "results": results, "cached": False}
+
+    def run(self, plan: List[Dict]) -> Dict:
+        """
+        Execute a plan and merge results.
+
+        Args:
+            plan: Query plan entries
+
+        Returns:
+            Dictionary with consolidated jobs (each tagged with categories
+            and matching queries), per-term stats, errors and request health
+            (hedges, timeouts, short-circuited requests, breaker state,
+            requests deferred for quota)
+        """
+        specs = expand_plan(plan)
+        stats = {}
+        errors = []
+        new_jobs = []
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            # map() yields in submission order, so merging stays deterministic
+            for outcome in executor.map(self._execute, specs):
+                request = outcome["request"]
+                term_stats = stats.setdefault(request["term"], {
+                    "category": request["category"], "requests": 0, "api_calls": 0, "deferred": 0,
+                    "results": 0, "new_jobs": 0
+                })
+                term_stats["requests"] += 1
+                term_stats["api_calls"] += 0 if outcome["cached"] else 1
+                term_stats["deferred"] += 1 if outcome.get("deferred") else 0
+                term_stats["results"] += len(outcome["results"])
+
+                if "error" in outcome:
+                    errors.append(f"Search error for '{request['term']}': {outcome['error']}")
+
+                for result in outcome["results"]:
+                    key = normalize_url(result.get("url", ""))
+                    job = self.seen.get(key)
+                    if job is None:
+                        job = dict(result, categories=[], queries=[])
+                        self.seen[key] = job
+                        new_jobs.append(job)
+                        term_stats["new_jobs"] += 1
+                    if request["category"] not in job["categories"]:
+                        job["categories"].append(request["category"])
+                    if request["term"] not in job["queries"]:
+                        job["queries"].append(request["term"])
+
+        self.cache.save()
+        if self.latency_path:
+            with open(self.latency_path, 'w') as f:
+                json.dump([round(seconds, 4) for seconds in self.caller.latencies.snapshot()], f)
+        health = dict(self.caller.summary(), deferred=self.deferred)
+        return {"jobs": new_jobs, "stats": stats, "errors": errors, "health": health}
+
+
+def main():
+    """Main entry point for CLI usage."""
+    parser = argparse.ArgumentParser(description="Run a declarative job search plan")
+    parser.add_argument("--plan", "-p", default="search_plan.json", help="Path to plan file")
+    parser.add_argument("--output", "-o", default="job_search_results.json", help="Consolidated output file")
+    parser.add_argument("--cache", default="search_cache.json", help="Result cache file ('' to disable)")
+    parser.add_argument("--workers", "-w", type=int, default=6, help="Concurrent requests")
+    args = parser.parse_args()
+
+    plan = load_plan(args.plan)
+    engine = SearchEngine(cache_path=args.cache or None, workers=args.workers,
+                          latency_path="search_latency.json")
+
+    start = time.perf_counter()
+    outcome = engine.run(plan)
+    elapsed = time.perf_counter() - start
+
+    for term, term_stats in outcome["stats"].items():
+        print(f"  [{term_stats['category']}] {term}: {term_stats['new_jobs']} new "
+              f"({term_stats['results']} results, {term_stats['api_calls']} API calls)")
+    for error in outcome["errors"]:
+        print(f"  ⚠️  {error}")
+
+    with open(args.output, 'w') as f:
+        json.dump({
+            "generated_at": datetime.now().isoformat(timespec='seconds'),
+            "plan": args.plan,
+            "jobs": outcome["jobs"]
+        }, f, indent=2)
+
+    print(f"\n✅ {len(outcome['jobs'])} unique jobs from {len(expand_plan(plan))} requests "
+          f"in {elapsed:.1f}s → {args.output}")
+
+
+if __name__ == "__main__":
+    main()
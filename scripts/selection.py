@@ -0,0 +1,118 @@
+"""
+Selection Module - Top-K Job Selection with Diversity Caps
+
+Picks the best `k` scored jobs without sorting the whole candidate list,
+optionally capping how many come from one company or one location so a
+single employer's twenty near-identical postings cannot fill the day's
+quota:
+
+    selector = TopKSelector(k=10, threshold=80, per_company=2, per_location=5)
+    for job in scored_jobs:          # any order, e.g. as scores arrive
+        selector.push(job)
+    best = selector.result()         # highest score first
+
+The result is exactly what sorting every job by score and walking the
+list greedily (skipping jobs whose company or location is full) would
+give. Jobs are kept in one bounded min-heap per (company, location)
+group, holding at most min(k, per_company, per_location) jobs: a job
+beaten by that many others with the same company and location can never
+be picked, since by its turn their group is full or the selection is.
+Without caps this is a single k-sized heap.
+"""
+
+import heapq
+import itertools
+from typing import Dict, Iterable, List, Optional
+
+from normalize import company_key
+
+
+def location_key(location: str) -> str:
+    """Location used for capping: "Halifax, NS (Hybrid)" and "Halifax, NS" count together."""
+    return location.split(" (")[0].strip().lower()
+
+
+class TopKSelector:
+    """Streaming top-k selection with per-company and per-location caps."""
+
+    def __init__(self, k: int, threshold: float = 0, per_company: Optional[int] = None,
+                 per_location: Optional[int] = None):
+        """
+        Args:
+            k: Jobs to select
+            threshold: Minimum match_score
+            per_company: Most jobs selected from one company (None for no cap)
+            per_location: Most jobs selected from one location (None for no cap)
+        """
+        self.k = k
+        self.threshold = threshold
+        self.per_company = per_company
+        self.per_location = per_location
+        self.group_size = min(cap for cap in (k, per_company, per_location) if cap is not None)
+        self.groups = {}
+        # Tie-breaker so equal scores keep arrival order and dicts are never compared
+        self.counter = itertools.count()
+        self.seen = 0
+
+    def _group(self, job: Dict) -> tuple:
+        company = company_key(job.get("company", "")) if self.per_company is not None else ""
+        location = location_key(job.get("location", "")) if self.per_location is not None else ""
+        return company, location
+
+    def push(self, job: Dict) -> None:
+        """Offer a scored job (must have match_score)."""
+        self.seen += 1
+        score = job.get("match_score", 0)
+        if score < self.threshold or self.k <= 0:
+            return
+        heap = self.groups.setdefault(self._group(job), [])
+        # Earlier arrivals win ties, so they rank higher: negate the counter
+        entry = (score, -next(self.counter), job)
+        if len(heap) < self.group_size:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+
+    def extend(self, jobs: Iterable[Dict]) -> "TopKSelector":
+        for job in jobs:
+            self.push(job)
+        return self
+
+    @property
+    def kept(self) -> int:
+        """Jobs currently held as candidates."""
+        return sum(len(heap) for heap in self.groups.values())
+
+    def result(self) -> List[Dict]:
+        """
+        Selected jobs, highest score first.
+
+        Returns:
+            Up to k jobs respecting both caps
+        """
+        # Max-heap over every kept job; only pop as many as the greedy walk needs
+        candidates = [(-score, -order, group, job) for group, heap in self.groups.items()
+                      for score, order, job in heap]
+        heapq.heapify(candidates)
+        companies, locations, selected = {}, {}, []
+        while candidates and len(selected) < self.k:
+            _, _, (company, location), job = heapq.heappop(candidates)
+            if self.per_company is not None and companies.get(company, 0) >= self.per_company:
+                continue
+            if self.per_location is not None and locations.get(location, 0) >= self.per_location:
+                continue
+            companies[company] = companies.get(company, 0) + 1
+            locations[location] = locations.get(location, 0) + 1
+            selected.append(job)
+        return selected
+
+
+def select_top_k(jobs: Iterable[Dict], k: int, threshold: float = 0, per_company: Optional[int] = None,
+                 per_location: Optional[int] = None) -> List[Dict]:
+    """
+    Best k jobs by match_score above threshold, with optional caps (see TopKSelector).
+
+    Returns:
+        Selected jobs, highest score first
+    """
+    return TopKSelector(k, threshold, per_company, per_location).extend(jobs).result()
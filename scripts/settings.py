@@ -0,0 +1,199 @@
+"""
+Settings Module - Shared Configuration and Credential Registry
+
+One registry per process loads config.json and the credentials/*.md files
+on first use and serves every later lookup from memory. A file is read
+again only when its modification time or size changes, environment
+variables override file values, and relative paths (the config and
+credential files and every path setting in the config) resolve against
+the project root instead of the current directory, so scripts behave the
+same whether they are started from the repo root or from scripts/.
+
+    from settings import load_config, get_credential
+    config = load_config()                      # active config.json
+    api_key = get_credential("brave-search", ["api key", "token"], env="BRAVE_API_KEY")
+
+Environment:
+    PIPELINE_CONFIG            Path of the config file (default: <root>/config.json)
+    PIPELINE_CREDENTIALS_DIR   Directory of credential files (default: <root>/credentials)
+"""
+
+import copy
+import json
+import os
+import threading
+from typing import List, Dict, Optional
+
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+# Config keys (dotted for nested settings) that an environment variable overrides,
+# with the registry default. Overrides of bool and number settings are parsed as
+# JSON; everything else stays a string, so numeric IDs keep their leading digits.
+ENV_OVERRIDES = {
+    "notion_database_id": ("NOTION_DATABASE_ID", ""),
+    "match_threshold": ("PIPELINE_MATCH_THRESHOLD", 80),
+    "output_dir": ("PIPELINE_OUTPUT_DIR", "applications"),
+    "store_path": ("PIPELINE_STORE_PATH", "jobs.db"),
+    "notion_schema_path": ("PIPELINE_NOTION_SCHEMA_PATH", "notion_schema.json"),
+    "queue.path": ("PIPELINE_QUEUE_PATH", "work_queue.db"),
+    "quota.path": ("PIPELINE_QUOTA_PATH", "quota.db"),
+    "notification_settings.telegram_enabled": ("TELEGRAM_ENABLED", False),
+    "notification_settings.telegram_user_id": ("TELEGRAM_USER_ID", ""),
+}
+
+# Config keys holding file or directory paths; resolved like the config file itself
+PATH_SETTINGS = [
+    "output_dir", "templates_dir", "history_dir", "store_path", "notion_schema_path",
+    "search.plan", "search.cache_path", "search.latency_path", "search_budget.stats_path",
+    "enrichment.cache_dir", "markdown_conversion.root", "queue.path", "quota.path", "journal.path",
+]
+
+
+def _env_value(raw: str, default):
+    """Environment override typed like the registry default."""
+    if isinstance(default, (bool, int, float)):
+        try:
+            return json.loads(raw)
+        except ValueError:
+            pass
+    return raw
+
+
+def _deep_merge(base: Dict, override: Dict) -> Dict:
+    """Copy of base with override applied; nested dicts merge key by key."""
+    merged = copy.deepcopy(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _deep_merge(merged[key], value)
+        else:
+            merged[key] = copy.deepcopy(value)
+    return merged
+
+
+class Settings:
+    """Process-wide cache of config and credential files with change invalidation."""
+
+    def __init__(self, root: str = PROJECT_ROOT):
+        """
+        Args:
+            root: Directory relative paths are resolved against
+        """
+        self.root = root
+        self.config_path = self.resolve(os.getenv("PIPELINE_CONFIG", "config.json"))
+        self.credentials_dir = self.resolve(os.getenv("PIPELINE_CREDENTIALS_DIR", "credentials"))
+        self.file_reads = 0
+        self._files = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, path: str) -> str:
+        """Absolute path: as given if it exists from the cwd, else under the project root."""
+        if os.path.isabs(path) or os.path.exists(path):
+            return os.path.abspath(path)
+        return os.path.join(self.root, path)
+
+    def _read(self, path: str, parse):
+        """
+        Parsed file contents, re-read only when the file changed.
+
+        Returns:
+            Parsed value, or None if the file does not exist
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            cached = self._files.get(path)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        with open(path, 'r', encoding='utf-8') as f:
+            value = parse(f)
+        with self._lock:
+            self._files[path] = (signature, value)
+            self.file_reads += 1
+        return value
+
+    def config(self, path: Optional[str] = None, defaults: Optional[Dict] = None) -> Dict:
+        """
+        Load the active config with environment overrides applied.
+
+        Args:
+            path: Config file; when given it becomes the active config for
+                every later call in this process
+            defaults: Values the file is merged over; nested sections merge
+                key by key, so a partial section keeps the other defaults
+
+        Returns:
+            A copy of the config (empty if the file does not exist) with
+            path settings resolved against the project root
+        """
+        if path:
+            self.config_path = self.resolve(path)
+
+        config = _deep_merge(defaults or {}, self._read(self.config_path, json.load) or {})
+        for dotted, (env, default) in ENV_OVERRIDES.items():
+            if env in os.environ:
+                *parents, key = dotted.split(".")
+                target = config
+                for parent in parents:
+                    target = target.setdefault(parent, {})
+                target[key] = _env_value(os.environ[env], default)
+
+        for dotted in PATH_SETTINGS:
+            *parents, key = dotted.split(".")
+            target = config
+            for parent in parents:
+                target = target.get(parent)
+                if not isinstance(target, dict):
+                    break
+            else:
+                if isinstance(target.get(key), str) and target[key] not in ("", ":memory:"):
+                    target[key] = self.resolve(target[key])
+        return config
+
+    def credential_text(self, name: str) -> str:
+        """Raw contents of credentials/<name>.md ('' if missing)."""
+        return self._read(os.path.join(self.credentials_dir, f"{name}.md"), lambda f: f.read()) or ''
+
+    def credential(self, name: str, keys: List[str], env: Optional[str] = None) -> str:
+        """
+        Look up a credential, environment first.
+
+        Credential files hold "key: value" lines (Markdown list markers and
+        bold are ignored); the first line whose key ends with one of `keys`
+        wins.
+
+        Args:
+            name: Credential file name without .md (e.g. "brave-search")
+            keys: Lowercase key names to accept (e.g. ["api key", "token"])
+            env: Environment variable that overrides the file
+
+        Returns:
+            The credential, or '' if not found
+        """
+        if env and os.getenv(env):
+            return os.environ[env]
+
+        for line in self.credential_text(name).splitlines():
+            key, sep, value = line.partition(':')
+            key = key.strip(" \t-*#`").lower()
+            if sep and any(key.endswith(k) for k in keys):
+                return value.strip(" \t*`")
+        return ''
+
+
+settings = Settings()
+
+
+def load_config(path: Optional[str] = None, defaults: Optional[Dict] = None) -> Dict:
+    """Active config from the shared registry (see Settings.config)."""
+    return settings.config(path, defaults)
+
+
+def get_credential(name: str, keys: List[str], env: Optional[str] = None) -> str:
+    """Credential from the shared registry (see Settings.credential)."""
+    return settings.credential(name, keys, env)
@@ -0,0 +1,173 @@
+"""
+Similarity Module - Offline TF-IDF Scoring Against the Candidate Profile
+
+Builds hashed TF-IDF vectors (unigrams + bigrams) for the candidate
+profile and a batch of job descriptions and computes cosine similarity
+with vectorized NumPy operations over a CSR-style sparse layout. Nothing
+is downloaded or sent anywhere; 100k postings score in seconds.
+"""
+
+import re
+import zlib
+from itertools import chain
+from typing import List, Dict
+
+import numpy as np
+
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+
+STOP_WORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or our that the this "
+    "to was we were will with you your they their who what which".split()
+)
+
+
+def profile_text(profile: Dict) -> str:
+    """
+    Flatten a candidate profile into one document.
+
+    Accepts the resume_generator CANDIDATE_PROFILE shape and the
+    config.json candidate_profile shape (title, target_roles, skills).
+
+    Args:
+        profile: Candidate profile dictionary
+
+    Returns:
+        Text used as the profile document
+    """
+    parts = [profile.get("summary", ""), profile.get("title", "")]
+    parts += profile.get("target_roles", [])
+    # Skills are the strongest signal, so they are repeated for extra weight
+    parts += profile.get("skills", []) * 2
+    for role in profile.get("experience", []):
+        parts.append(role.get("title", ""))
+        parts += role.get("achievements", [])
+    return " ".join(p for p in parts if p)
+
+
+class SimilarityScorer:
+    """Hashed TF-IDF cosine similarity between one profile and many documents."""
+
+    def __init__(self, profile: str, n_features: int = 2 ** 18, bigrams: bool = True):
+        """
+        Args:
+            profile: Profile document text
+            n_features: Number of hash buckets
+            bigrams: Also index adjacent word pairs ("power bi", "data analysis")
+        """
+        self.n_features = n_features
+        self.bigrams = bigrams
+        self.profile = profile
+        # Vocabulary word -> id, with each id's hash bucket and stop-word flag.
+        # crc32 keeps buckets stable across processes, unlike hash().
+        self._vocab = {}
+        self._vocab_bucket = []
+        self._vocab_stop = []
+
+    def _word_ids(self, texts: List[str]):
+        """Tokenize texts into flat word-id and document-index arrays."""
+        word_lists = [TOKEN_PATTERN.findall(text.lower()) for text in texts]
+        lengths = np.fromiter(map(len, word_lists), dtype=np.int64, count=len(word_lists))
+        all_words = list(chain.from_iterable(word_lists))
+
+        # Hash each distinct word once; per-token work stays in C via map()
+        for word in set(all_words).difference(self._vocab):
+            self._vocab[word] = len(self._vocab_bucket)
+            self._vocab_bucket.append(zlib.crc32(word.encode()) % self.n_features)
+            self._vocab_stop.append(word in STOP_WORDS)
+
+        word_ids = np.fromiter(map(self._vocab.__getitem__, all_words), dtype=np.int64, count=len(all_words))
+        doc_index = np.repeat(np.arange(len(texts), dtype=np.int64), lengths)
+
+        keep = ~np.asarray(self._vocab_stop, dtype=bool)[word_ids]
+        return word_ids[keep], doc_index[keep]
+
+    def _features(self, texts: List[str]):
+        """Return (document index, hash bucket) for every unigram and bigram."""
+        word_ids, doc_index = self._word_ids(texts)
+        buckets = np.asarray(self._vocab_bucket, dtype=np.int64)[word_ids]
+        if not self.bigrams or len(buckets) < 2:
+            return doc_index, buckets
+
+        # Adjacent pairs within the same document, hashed from their word buckets
+        same_doc = doc_index[1:] == doc_index[:-1]
+        pair_buckets = (buckets[:-1][same_doc] * 1000003 + buckets[1:][same_doc] * 7919 + 1) % self.n_features
+        return (np.concatenate([doc_index, doc_index[1:][same_doc]]),
+                np.concatenate([buckets, pair_buckets]))
+
+    def score(self, texts: List[str]) -> np.ndarray:
+        """
+        Cosine similarity of each text to the profile.
+
+        IDF is fitted on the batch itself plus the profile, so terms that
+        appear in every posting ("data", "analyst") count for little.
+
+        Args:
+            texts: Job documents (title + description)
+
+        Returns:
+            Array of similarities in [0, 1], one per text
+        """
+        docs = [self.profile] + list(texts)
+        doc_index, buckets = self._features(docs)
+
+        # Unique (doc, bucket) pairs sorted by doc give a CSR matrix of term counts
+        keys, counts = np.unique(doc_index * self.n_features + buckets, return_counts=True)
+        rows = keys // self.n_features
+        cols = keys % self.n_features
+
+        df = np.bincount(cols, minlength=self.n_features)
+        idf = np.log((len(docs) + 1) / (df + 1)) + 1.0
+        weights = (1.0 + np.log(counts)) * idf[cols]
+
+        norms = np.sqrt(np.bincount(rows, weights=weights ** 2, minlength=len(docs)))
+        norms[norms == 0] = 1.0
+
+        profile_vector = np.zeros(self.n_features)
+        profile_mask = rows == 0
+        profile_vector[cols[profile_mask]] = weights[profile_mask] / norms[0]
+
+        dots = np.bincount(rows, weights=weights * profile_vector[cols], minlength=len(docs))
+        return np.clip(dots[1:] / norms[1:], 0.0, 1.0)
+
+
+def blend_scores(rule_scores: List[int], similarities: np.ndarray, boost: float = 10,
+                 floor: float = 0.03, ceiling: float = 0.2) -> List[int]:
+    """
+    Raise rule-based match scores by how similar each job is to the profile.
+
+    Similarity only ever adds points, mapped linearly from the cosine
+    similarity: nothing at or below `floor`, the full `boost` at or above
+    `ceiling`. The mapping is absolute, so a job's boost does not depend on
+    which other postings were scored with it. The defaults are calibrated
+    on benchmarks/data/similarity_fixture.json, where data-analyst postings
+    score 0.17-0.24 and data-adjacent or unrelated roles below 0.07.
+
+    Args:
+        rule_scores: Rule-based scores from profile_matcher.ProfileScorer
+        similarities: Output of SimilarityScorer.score
+        boost: Points added at or above the ceiling
+        floor: Similarity below which a job gains nothing
+        ceiling: Similarity at which a job gains the full boost
+
+    Returns:
+        Boosted scores (0-100)
+    """
+    similarities = np.asarray(similarities, dtype=float)
+    points = boost * np.clip((similarities - floor) / (ceiling - floor), 0.0, 1.0)
+    boosted = np.asarray(rule_scores, dtype=float) + points
+    return [int(round(s)) for s in np.clip(boosted, 0, 100)]
+
+
+if __name__ == "__main__":
+    # Compare two sample postings against the resume profile
+    from resume_generator import CANDIDATE_PROFILE
+
+    scorer = SimilarityScorer(profile_text(CANDIDATE_PROFILE))
+    samples = [
+        "Junior Data Analyst - Python, SQL and Power BI dashboards for operations reporting",
+        "Senior Mechanical Engineer - HVAC design, AutoCAD, site inspections",
+    ]
+    for text, similarity in zip(samples, scorer.score(samples)):
+        print(f"  {similarity:.3f}  {text}")
@@ -0,0 +1,274 @@
+"""
+Work Queue Module - Durable Task Queue for Pipeline Workers
+
+A SQLite-backed queue of pipeline tasks (search, generate, sync) that any
+number of `pipeline.py worker` processes on the same machine can drain:
+
+    queued ──lease──▶ leased ──complete──▶ done
+                         │
+                         └──fail / lease expired──▶ queued (after a backoff delay)
+                                                    failed (after max_attempts)
+
+A worker leases one task at a time for `lease_seconds` and renews the
+lease from a heartbeat thread while the task runs; if it crashes, the
+lease expires and another worker picks the task up. Pending tasks with the
+same key are enqueued only once, so re-running a sweep does not duplicate
+work that is still waiting.
+
+Workers also write the job store and quota ledger, which use SQLite WAL
+mode, so all workers must run on one host with the files on a local disk;
+SQLite locking is not reliable over network filesystems.
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from typing import List, Dict, Optional
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    key TEXT,
+    payload TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    run_at REAL NOT NULL,
+    lease_owner TEXT,
+    lease_expires REAL,
+    error TEXT,
+    created REAL NOT NULL,
+    finished REAL
+);
+CREATE INDEX IF NOT EXISTS tasks_ready ON tasks(state, run_at);
+CREATE UNIQUE INDEX IF NOT EXISTS tasks_pending_key ON tasks(key) WHERE state IN ('queued', 'leased');
+"""
+
+TASK_KINDS = ("search", "generate", "sync")
+
+
+def worker_name() -> str:
+    """Identifier recorded as the lease owner: host:pid."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class WorkQueue:
+    """Durable queue of pipeline tasks with leases and retries."""
+
+    def __init__(self, db_path: str = "work_queue.db", lease_seconds: float = 300,
+                 max_attempts: int = 3, retry_delay: float = 30):
+        """
+        Args:
+            db_path: SQLite file shared by the enqueuer and all workers
+            lease_seconds: How long a worker owns a task before it may be retried
+            max_attempts: Attempts before a task is marked failed
+            retry_delay: Delay before the first retry; doubles with each attempt
+        """
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        # Autocommit mode so lease() controls its own write transaction
+        self.conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def enqueue(self, kind: str, payloads: List[Dict], keys: Optional[List[str]] = None,
+                delay: float = 0) -> int:
+        """
+        Add tasks of one kind in a single transaction.
+
+        Args:
+            kind: Task kind (search, generate or sync)
+            payloads: JSON-serializable task arguments, one per task
+            keys: Optional dedupe key per task; a key already queued or leased is skipped
+            delay: Seconds before the tasks become runnable
+
+        Returns:
+            Number of tasks added
+        """
+        if kind not in TASK_KINDS:
+            raise ValueError(f"Unknown task kind: {kind}")
+        now = time.time()
+        keys = keys or [None] * len(payloads)
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = self.conn.executemany(
+                "INSERT OR IGNORE INTO tasks (kind, key, payload, run_at, created) VALUES (?, ?, ?, ?, ?)",
+                [(kind, key, json.dumps(payload), now + delay, now) for payload, key in zip(payloads, keys)]
+            )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return cursor.rowcount
+
+    def lease(self, worker: str, kinds: Optional[List[str]] = None) -> Optional[Dict]:
+        """
+        Take the oldest runnable task.
+
+        Runnable means queued and due, or leased with an expired lease. Expired
+        tasks that already used all their attempts are marked failed instead.
+
+        Args:
+            worker: Lease owner (see worker_name)
+            kinds: Only lease these task kinds (default: any)
+
+        Returns:
+            {"id", "kind", "payload", "attempts"} or None if nothing is runnable
+        """
+        now = time.time()
+        kind_filter = ""
+        params = [now, now]
+        if kinds:
+            kind_filter = f"AND kind IN ({','.join('?' * len(kinds))})"
+            params += list(kinds)
+
+        # BEGIN IMMEDIATE takes the write lock up front, so two workers never lease the same row
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.execute(
+                """
+                UPDATE tasks SET state = 'failed', finished = ?, error = 'lease expired'
+                WHERE state = 'leased' AND lease_expires < ? AND attempts >= ?
+                """,
+                (now, now, self.max_attempts)
+            )
+            row = self.conn.execute(
+                f"""
+                UPDATE tasks SET state = 'leased', lease_owner = ?, lease_expires = ?, attempts = attempts + 1
+                WHERE id = (
+                    SELECT id FROM tasks
+                    WHERE ((state = 'queued' AND run_at <= ?) OR (state = 'leased' AND lease_expires < ?))
+                    {kind_filter}
+                    ORDER BY run_at, id LIMIT 1
+                )
+                RETURNING id, kind, payload, attempts
+                """,
+                [worker, now + self.lease_seconds] + params
+            ).fetchone()
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+
+        if row is None:
+            return None
+        return {"id": row["id"], "kind": row["kind"], "payload": json.loads(row["payload"]),
+                "attempts": row["attempts"]}
+
+    def extend(self, task_id: int, worker: str) -> bool:
+        """Renew a lease for long-running work. False if the lease was lost."""
+        cursor = self.conn.execute(
+            "UPDATE tasks SET lease_expires = ? WHERE id = ? AND state = 'leased' AND lease_owner = ?",
+            (time.time() + self.lease_seconds, task_id, worker)
+        )
+        return cursor.rowcount == 1
+
+    def heartbeat(self, task_id: int, worker: str) -> "LeaseHeartbeat":
+        """Context manager that keeps a lease alive while the task runs (see LeaseHeartbeat)."""
+        return LeaseHeartbeat(self, task_id, worker)
+
+    def complete(self, task_id: int, worker: str) -> bool:
+        """
+        Mark a leased task done.
+
+        Returns:
+            False if the lease had expired and another worker took the task
+        """
+        cursor = self.conn.execute(
+            "UPDATE tasks SET state = 'done', finished = ?, error = NULL "
+            "WHERE id = ? AND state = 'leased' AND lease_owner = ?",
+            (time.time(), task_id, worker)
+        )
+        return cursor.rowcount == 1
+
+    def fail(self, task_id: int, worker: str, error: str) -> str:
+        """
+        Record a failed attempt; requeue with exponential backoff or give up.
+
+        Returns:
+            New state ("queued" or "failed"), or "" if the lease was lost
+        """
+        row = self.conn.execute(
+            "SELECT attempts FROM tasks WHERE id = ? AND state = 'leased' AND lease_owner = ?",
+            (task_id, worker)
+        ).fetchone()
+        if row is None:
+            return ""
+
+        now = time.time()
+        if row["attempts"] >= self.max_attempts:
+            state, run_at = "failed", now
+        else:
+            state, run_at = "queued", now + self.retry_delay * 2 ** (row["attempts"] - 1)
+        self.conn.execute(
+            """
+            UPDATE tasks SET state = ?, run_at = ?, error = ?, lease_owner = NULL, lease_expires = NULL,
+                finished = CASE WHEN ? = 'failed' THEN ? END
+            WHERE id = ? AND lease_owner = ?
+            """,
+            (state, run_at, error[:2000], state, now, task_id, worker)
+        )
+        return state
+
+    def counts(self) -> Dict[str, int]:
+        """Number of tasks in each state."""
+        return {row[0]: row[1] for row in self.conn.execute("SELECT state, COUNT(*) FROM tasks GROUP BY state")}
+
+    def failures(self, limit: int = 20) -> List[Dict]:
+        """Most recent failed tasks with their last error."""
+        rows = self.conn.execute(
+            "SELECT id, kind, key, attempts, error FROM tasks WHERE state = 'failed' "
+            "ORDER BY finished DESC LIMIT ?",
+            (limit,)
+        )
+        return [dict(row) for row in rows]
+
+
+class LeaseHeartbeat:
+    """
+    Renews a task's lease every third of `lease_seconds` from a background thread.
+
+    The thread opens its own connection, since SQLite connections are not
+    shared between threads. `lost` is set if another worker took the task
+    over, e.g. after this process was suspended past its lease.
+    """
+
+    def __init__(self, queue: WorkQueue, task_id: int, worker: str):
+        self.queue = queue
+        self.task_id = task_id
+        self.worker = worker
+        self.lost = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._beat, name=f"lease-{task_id}", daemon=True)
+
+    def _beat(self):
+        interval = max(self.queue.lease_seconds / 3, 0.1)
+        with WorkQueue(self.queue.db_path, lease_seconds=self.queue.lease_seconds) as queue:
+            while not self._stop.wait(interval):
+                if not queue.extend(self.task_id, self.worker):
+                    self.lost = True
+                    return
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()